@@ -0,0 +1 @@
+"""Benchmarks against a live database."""
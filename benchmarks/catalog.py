@@ -0,0 +1,249 @@
+"""Synthetic catalog seeding and query accounting shared by benchmarks."""
+
+import logging
+import random
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from typing import Any
+from uuid import UUID, uuid4
+
+from bootstrap.config import AppConfig
+from common.infrastructure.database.postgres.sqlalchemy.database import Database
+from common.infrastructure.database.postgres.sqlalchemy.executor import QueryExecutor
+from common.infrastructure.database.postgres.sqlalchemy.session_factory import (
+    MakerSessionFactory,
+)
+from common.infrastructure.database.postgres.sqlalchemy.unit_of_work import UnitOfWork
+from showcase.category.infrastructure.database.postgres.sqlalchemy.models import (
+    CategoryBase,
+)
+from showcase.course.domain.value_objects import (
+    CertificateType,
+    CourseStatus,
+    EducationFormat,
+    Format,
+)
+from showcase.course.infrastructure.database.postgres.sqlalchemy.models import (
+    CourseBase,
+    CourseCategoryBase,
+    CourseLecturerBase,
+    CourseSectionBase,
+    CourseSkillBase,
+    CourseTagBase,
+    SkillBase,
+    TagBase,
+)
+from showcase.lecturer.infrastructure.database.postgres.sqlalchemy.models import (
+    LecturerBase,
+)
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+BATCH_SIZE = 5_000
+
+
+@dataclass(frozen=True)
+class CatalogShape:
+    """Per-course collection sizes of the seeded catalog."""
+
+    sections: int = 12
+    categories: int = 3
+    tags: int = 8
+    skills: int = 6
+    lecturers: int = 2
+
+
+@dataclass
+class QueryStats:
+    statements: int = 0
+    rows: int = 0
+    latencies_ms: list[float] = field(default_factory=list[float])
+
+    @property
+    def p50_ms(self) -> float:
+        return statistics.median(self.latencies_ms) if self.latencies_ms else 0.0
+
+
+class RowCounter:
+    """Captures queries issued on an engine and counts their rows.
+
+    Row counts are obtained afterwards by re-running each captured statement as
+    ``SELECT count(*) FROM (...)`` so that timing is not skewed by accounting.
+    """
+
+    def __init__(self, database: Database) -> None:
+        self._engine = database.get_engine().sync_engine
+        self._captured: list[tuple[str, Any]] = []
+        self._enabled = False
+        event.listen(self._engine, "before_cursor_execute", self._capture)
+
+    def _capture(
+        self, conn: Any, cursor: Any, statement: str, parameters: Any, *_: Any
+    ) -> None:
+        if self._enabled and statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            self._captured.append((statement, parameters))
+
+    async def measure(
+        self,
+        session: AsyncSession,
+        run: Callable[[], Awaitable[object]],
+        repeat: int,
+    ) -> QueryStats:
+        stats = QueryStats()
+        for i in range(repeat):
+            self._captured.clear()
+            self._enabled = True
+            started = time.perf_counter()
+            await run()
+            stats.latencies_ms.append((time.perf_counter() - started) * 1000)
+            self._enabled = False
+
+            if i == 0:
+                stats.statements = len(self._captured)
+                stats.rows = await self._count_rows(session)
+        return stats
+
+    async def _count_rows(self, session: AsyncSession) -> int:
+        conn = await session.connection()
+        total = 0
+        for statement, parameters in list(self._captured):
+            result = await conn.exec_driver_sql(
+                f"SELECT count(*) FROM ({statement}) AS q", parameters
+            )
+            total += int(result.scalar_one())
+        return total
+
+
+def connect(logger: logging.Logger) -> tuple[Database, UnitOfWork, QueryExecutor]:
+    config = AppConfig.load()
+    database = Database.create(config.db, logger)
+    uow = UnitOfWork(MakerSessionFactory(database.get_session_maker()))
+    return database, uow, QueryExecutor(uow)
+
+
+async def seed_catalog(
+    session: AsyncSession,
+    courses: int,
+    shape: CatalogShape | None = None,
+    seed: int = 42,
+) -> list[UUID]:
+    """Insert a synthetic published catalog and return the course IDs."""
+    shape = shape or CatalogShape()
+    rng = random.Random(seed)
+    run_id = uuid4().hex[:8]
+    now = datetime.now(UTC)
+
+    categories = [uuid4() for _ in range(max(shape.categories * 5, 20))]
+    tags = [uuid4() for _ in range(max(shape.tags * 6, 50))]
+    skills = [uuid4() for _ in range(max(shape.skills * 5, 30))]
+    lecturers = [uuid4() for _ in range(max(shape.lecturers * 5, 10))]
+
+    await _insert(
+        session,
+        CategoryBase,
+        [
+            {"category_id": cid, "name": f"bench-{run_id}-category-{i}"}
+            for i, cid in enumerate(categories)
+        ],
+    )
+    await _insert(
+        session,
+        TagBase,
+        [
+            {"tag_id": tid, "name": f"bench-{run_id}-tag-{i}"}
+            for i, tid in enumerate(tags)
+        ],
+    )
+    await _insert(
+        session,
+        SkillBase,
+        [
+            {
+                "skill_id": sid,
+                "name": f"bench-{run_id}-skill-{i}",
+                "description": "Навык для нагрузочного тестирования каталога",
+            }
+            for i, sid in enumerate(skills)
+        ],
+    )
+    await _insert(
+        session,
+        LecturerBase,
+        [
+            {"lecturer_id": lid, "name": f"bench-{run_id}-lecturer-{i}"}
+            for i, lid in enumerate(lecturers)
+        ],
+    )
+
+    course_ids = [uuid4() for _ in range(courses)]
+    formats = list(Format)
+    education_formats = list(EducationFormat)
+    statuses = [CourseStatus.ACTIVE, CourseStatus.ENROLLING, CourseStatus.ARCHIVED]
+
+    await _insert(
+        session,
+        CourseBase,
+        [
+            {
+                "course_id": cid,
+                "name": f"Курс {i} по анализу данных и программированию на Python",
+                "description": "Практический курс: " + " ".join(["контент"] * 40),
+                "format": rng.choice(formats),
+                "education_format": rng.choice(education_formats),
+                "duration_hours": rng.randint(4, 400),
+                "cost": Decimal(rng.randint(0, 200_000)),
+                "discounted_cost": None,
+                "start_date": now + timedelta(days=rng.randint(-120, 365)),
+                "end_date": None,
+                "certificate_type": CertificateType.CERTIFICATE,
+                "status": rng.choice(statuses),
+                "is_published": True,
+            }
+            for i, cid in enumerate(course_ids)
+        ],
+    )
+    await _insert(
+        session,
+        CourseSectionBase,
+        [
+            {
+                "section_id": uuid4(),
+                "course_id": cid,
+                "name": f"Модуль {n}",
+                "description": "Описание модуля " + " ".join(["тема"] * 20),
+                "order_num": n,
+                "hours": rng.randint(1, 20),
+            }
+            for cid in course_ids
+            for n in range(shape.sections)
+        ],
+    )
+    for model, column, pool, per_course in (
+        (CourseCategoryBase, "category_id", categories, shape.categories),
+        (CourseTagBase, "tag_id", tags, shape.tags),
+        (CourseSkillBase, "skill_id", skills, shape.skills),
+        (CourseLecturerBase, "lecturer_id", lecturers, shape.lecturers),
+    ):
+        await _insert(
+            session,
+            model,
+            [
+                {"course_id": cid, column: ref}
+                for cid in course_ids
+                for ref in rng.sample(pool, per_course)
+            ],
+        )
+
+    return course_ids
+
+
+async def _insert(
+    session: AsyncSession, model: Any, rows: list[dict[str, Any]]
+) -> None:
+    for start in range(0, len(rows), BATCH_SIZE):
+        await session.execute(insert(model), rows[start : start + BATCH_SIZE])
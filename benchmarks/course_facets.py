@@ -0,0 +1,117 @@
+"""Facet counts: one grouped query vs paging through the filter endpoint.
+
+Seeds a synthetic catalog inside a transaction that is rolled back afterwards
+and, at each catalog size, times ``facets`` on both read repositories against
+the old way of obtaining counts: reading every matching course through
+``filter_extended`` and counting in Python. The baseline is skipped above
+``--baseline-max`` courses.
+
+Usage:
+    PYTHONPATH=src python -m benchmarks.course_facets --config configs/example.yaml
+"""
+
+import argparse
+import asyncio
+import logging
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from functools import partial
+
+from showcase.course.application.interfaces.repositories import ICourseReadRepository
+from showcase.course.application.interfaces.repositories.course_read_repository import (
+    CoursesFilter,
+)
+from showcase.course.infrastructure.database.postgres.sqlalchemy.projections import (
+    CourseCardProjector,
+)
+from showcase.course.infrastructure.database.postgres.sqlalchemy.repositories import (
+    CourseCardReadRepository,
+    CourseReadRepository,
+)
+
+from benchmarks.catalog import RowCounter, connect, seed_catalog
+
+
+CATALOG_SIZES = (10_000, 100_000)
+FILTERS = {
+    "all": CoursesFilter(),
+    "search": CoursesFilter(search="анализ", is_published=True),
+    "narrow": CoursesFilter(formats=["online"], price_max=50_000),
+}
+
+
+Measure = Callable[[], Awaitable[object]]
+
+
+async def paged_counts(repository: ICourseReadRepository, filter: CoursesFilter) -> int:
+    """Count facets by reading every matching course, as clients had to."""
+    counts: Counter[str] = Counter()
+    after = None
+    while True:
+        page = await repository.filter_extended(
+            filter.model_copy(update={"limit": 1000, "after": after})
+        )
+        for course in page.courses:
+            counts[f"format:{course.format.value}"] += 1
+            counts[f"status:{course.status.value}"] += 1
+            counts.update(f"category:{c.category_id}" for c in course.categories)
+            counts.update(f"tag:{tag}" for tag in course.tags)
+        if page.next_cursor is None:
+            return len(counts)
+        after = page.next_cursor
+
+
+async def run(sizes: tuple[int, ...], repeat: int, baseline_max: int) -> None:
+    logger = logging.getLogger("benchmark")
+    database, uow, executor = connect(logger)
+    counter = RowCounter(database)
+    orm = CourseReadRepository(executor)
+    cards = CourseCardReadRepository(executor)
+    projector = CourseCardProjector(executor)
+
+    try:
+        async with uow:
+            async with uow.get_session() as session:
+                seeded = 0
+                print(
+                    f"{'courses':>8} {'filter':>8} {'strategy':>10} {'queries':>8} "
+                    f"{'p50 ms':>10}"
+                )
+                for size in sorted(sizes):
+                    await seed_catalog(session, size - seeded, seed=size)
+                    seeded = size
+                    await projector.rebuild()
+
+                    for name, filter in FILTERS.items():
+                        strategies: list[tuple[str, Measure]] = [
+                            ("orm", partial(orm.facets, filter)),
+                            ("cards", partial(cards.facets, filter)),
+                        ]
+                        if size <= baseline_max:
+                            strategies.append(
+                                ("paged", partial(paged_counts, orm, filter))
+                            )
+                        for strategy, measure in strategies:
+                            stats = await counter.measure(session, measure, repeat)
+                            print(
+                                f"{size:>8} {name:>8} {strategy:>10} "
+                                f"{stats.statements:>8} {stats.p50_ms:>10.1f}"
+                            )
+
+            await uow.rollback()
+    finally:
+        await database.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(CATALOG_SIZES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--baseline-max", type=int, default=10_000)
+    args, _ = parser.parse_known_args()
+
+    asyncio.run(run(tuple(args.sizes), args.repeat, args.baseline_max))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""Ranking prompt size and latency with and without vector pre-ranking.
+
+Builds a synthetic catalog spread over a handful of topics, indexes it with
+``CourseVectorIndex`` in a temporary directory and, for each query, draws
+fallback-sized candidate lists (25 courses from mixed topics). Reports the
+estimated prompt tokens of the full list against the ``--top-k`` shortlist
+and the time spent pre-ranking.
+
+With ``--llm`` the configured LLM also ranks both lists and end-to-end
+ranking latency is reported; without it no network calls are made.
+
+Usage:
+    PYTHONPATH=src python -m benchmarks.course_prerank --config configs/example.yaml
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import statistics
+import tempfile
+import time
+from datetime import UTC, datetime
+from decimal import Decimal
+from uuid import uuid4
+
+from bootstrap.config import AppConfig
+from common.infrastructure.services.llama_index.client import MappedOpenAI
+from common.infrastructure.services.llama_index.tokens import estimate_tokens
+from llama_index.core.llms import MockLLM
+from showcase.category.application.read_models.category_read_model import (
+    CategoryReadModel,
+)
+from showcase.course.application.read_models.course_read_model import (
+    CourseReadModel,
+    CourseSectionReadModel,
+)
+from showcase.course.application.read_models.skill_read_model import SkillReadModel
+from showcase.course.domain.value_objects import (
+    CertificateType,
+    CourseStatus,
+    EducationFormat,
+    Format,
+)
+from showcase.course.infrastructure.services.llama_index.course_ranking_service import (
+    CourseRankingService,
+)
+from showcase.course.infrastructure.services.vectors.course_vector_index import (
+    CourseVectorIndex,
+)
+from showcase.course.infrastructure.services.vectors.hashing_vectorizer import (
+    HashingVectorizer,
+)
+from showcase.course.infrastructure.services.vectors.vector_pre_ranking_service import (
+    VectorPreRankingService,
+)
+
+
+CANDIDATES = 25
+TOPICS = {
+    "Анализ данных": "анализ данных pandas статистика визуализация python выборка",
+    "Веб-разработка": "веб frontend javascript react вёрстка html css браузер",
+    "Дизайн": "дизайн интерфейсов figma типографика композиция прототип макет",
+    "Маркетинг": "маркетинг реклама smm продвижение аудитория воронка бренд",
+    "Управление проектами": "проект agile scrum команда планирование риски сроки",
+    "Машинное обучение": "машинное обучение модели нейросети регрессия признаки",
+}
+QUERIES = [
+    "хочу научиться анализу данных на python",
+    "стать frontend разработчиком на react",
+    "курсы по дизайну интерфейсов в figma",
+    "продвижение бренда в социальных сетях",
+    "управлять командой по scrum",
+]
+
+
+def build_catalog(size: int, seed: int) -> list[CourseReadModel]:
+    rng = random.Random(seed)
+    now = datetime.now(UTC)
+    courses: list[CourseReadModel] = []
+    for i in range(size):
+        topic = rng.choice(list(TOPICS))
+        words = [*TOPICS[topic].split(), "практика", "занятие"]
+
+        def text(n: int, words: list[str] = words) -> str:
+            return " ".join(rng.choice(words) for _ in range(n))
+
+        courses.append(
+            CourseReadModel(
+                course_id=uuid4(),
+                name=f"{topic}: курс {i}",
+                description=text(60),
+                format=rng.choice(list(Format)),
+                education_format=rng.choice(list(EducationFormat)),
+                duration_hours=rng.randint(4, 400),
+                cost=Decimal(rng.randint(0, 200_000)),
+                discounted_cost=None,
+                start_date=None,
+                end_date=None,
+                certificate_type=CertificateType.CERTIFICATE,
+                status=CourseStatus.ACTIVE,
+                is_published=True,
+                locations=[],
+                categories=[CategoryReadModel(uuid4(), topic, None)],
+                tags=[],
+                acquired_skills=[
+                    SkillReadModel(uuid4(), text(2), text(12)) for _ in range(6)
+                ],
+                lecturers=[],
+                sections=[
+                    CourseSectionReadModel(uuid4(), f"Модуль {n}", text(25), n, 4)
+                    for n in range(12)
+                ],
+                created_at=now,
+                updated_at=now,
+            )
+        )
+    return courses
+
+
+async def run(size: int, top_k: int, repeat: int, use_llm: bool) -> None:
+    logger = logging.getLogger("benchmark")
+    catalog = build_catalog(size, seed=size)
+    rng = random.Random(0)
+
+    with tempfile.TemporaryDirectory() as directory:
+        index = CourseVectorIndex(
+            logger,
+            directory,
+            HashingVectorizer(4096),
+            course_repository=None,  # type: ignore[arg-type]  # never written to
+        )
+        started = time.perf_counter()
+        index.rebuild(catalog)
+        print(f"indexed {size} courses in {(time.perf_counter() - started):.2f} s")
+
+        ranking = CourseRankingService(logger, llm=_llm()) if use_llm else None
+        prompts = ranking or CourseRankingService(logger, llm=MockLLM())
+        print(
+            f"{'query':>42} {'full tok':>9} {'top-k tok':>9} {'prerank ms':>10}"
+            + (f" {'full ms':>9} {'top-k ms':>9}" if ranking else "")
+        )
+        for query in QUERIES:
+            full_tokens, short_tokens, prerank_ms = [], [], []
+            full_ms: list[float] = []
+            short_ms: list[float] = []
+            for _ in range(repeat):
+                candidates = rng.sample(catalog, CANDIDATES)
+
+                started = time.perf_counter()
+                scores = index.score(query, candidates)
+                order = sorted(range(CANDIDATES), key=lambda i: -scores[i])[:top_k]
+                prerank_ms.append((time.perf_counter() - started) * 1000)
+                shortlist = [candidates[i] for i in order]
+
+                full, _ = prompts.build_prompt(query, candidates)
+                short, _ = prompts.build_prompt(query, shortlist)
+                full_tokens.append(estimate_tokens(full))
+                short_tokens.append(estimate_tokens(short))
+
+                if ranking is not None:
+                    pre = VectorPreRankingService(logger, ranking, index, top_k)
+                    for service, sink in ((ranking, full_ms), (pre, short_ms)):
+                        started = time.perf_counter()
+                        await service.rank(query, candidates)
+                        sink.append((time.perf_counter() - started) * 1000)
+
+            line = (
+                f"{query[:42]:>42} {statistics.median(full_tokens):>9.0f} "
+                f"{statistics.median(short_tokens):>9.0f} "
+                f"{statistics.median(prerank_ms):>10.2f}"
+            )
+            if ranking is not None:
+                line += (
+                    f" {statistics.median(full_ms):>9.0f} "
+                    f"{statistics.median(short_ms):>9.0f}"
+                )
+            print(line)
+
+
+def _llm() -> MappedOpenAI:
+    return MappedOpenAI.from_config(AppConfig.load().llm)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=10_000)
+    parser.add_argument("--top-k", type=int, default=12)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--llm", action="store_true", help="Call the configured LLM")
+    args, _ = parser.parse_known_args()
+
+    asyncio.run(run(args.size, args.top_k, args.repeat, args.llm))
+
+
+if __name__ == "__main__":
+    main()
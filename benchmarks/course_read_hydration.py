@@ -0,0 +1,96 @@
+"""Course page hydration: joinedload fan-out vs batched selectin loading.
+
+Seeds a synthetic catalog (12 sections, 3 categories, 8 tags, 6 skills and
+2 lecturers per course) inside a transaction that is rolled back afterwards,
+then compares rows transferred and latency of the legacy joinedload query with
+``CourseReadRepository.get_all`` for catalog pages of 5, 100 and 1000 courses.
+
+Usage:
+    PYTHONPATH=src python -m benchmarks.course_read_hydration --config configs/example.yaml
+"""
+
+import argparse
+import asyncio
+import logging
+from functools import partial
+
+from showcase.course.infrastructure.database.postgres.sqlalchemy.mappers import (
+    CourseReadMapper,
+)
+from showcase.course.infrastructure.database.postgres.sqlalchemy.models import (
+    CourseBase,
+)
+from showcase.course.infrastructure.database.postgres.sqlalchemy.repositories import (
+    CourseReadRepository,
+)
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload
+
+from benchmarks.catalog import RowCounter, connect, seed_catalog
+
+
+PAGE_SIZES = (5, 100, 1000)
+
+
+async def run(page_sizes: tuple[int, ...], repeat: int) -> None:
+    logger = logging.getLogger("benchmark")
+    database, uow, executor = connect(logger)
+    counter = RowCounter(database)
+    repository = CourseReadRepository(executor)
+
+    async def joined_page(limit: int) -> None:
+        stmt = (
+            select(CourseBase)
+            .options(
+                joinedload(CourseBase.sections),
+                joinedload(CourseBase.categories),
+                joinedload(CourseBase.tags),
+                joinedload(CourseBase.acquired_skills),
+                joinedload(CourseBase.lecturers),
+            )
+            .limit(limit)
+        )
+        models = await executor.execute_scalar_many(stmt)
+        [CourseReadMapper.to_read_model(m) for m in models]
+
+    async def selectin_page(limit: int) -> None:
+        await repository.get_all(limit=limit)
+
+    try:
+        async with uow:
+            async with uow.get_session() as session:
+                await seed_catalog(session, max(page_sizes))
+
+                print(
+                    f"{'page':>6} {'strategy':>10} {'queries':>8} "
+                    f"{'rows':>10} {'p50 ms':>10}"
+                )
+                for size in page_sizes:
+                    for name, page in (
+                        ("joined", joined_page),
+                        ("selectin", selectin_page),
+                    ):
+                        stats = await counter.measure(
+                            session, partial(page, size), repeat
+                        )
+                        print(
+                            f"{size:>6} {name:>10} {stats.statements:>8} "
+                            f"{stats.rows:>10} {stats.p50_ms:>10.1f}"
+                        )
+
+            await uow.rollback()
+    finally:
+        await database.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, nargs="+", default=list(PAGE_SIZES))
+    parser.add_argument("--repeat", type=int, default=3)
+    args, _ = parser.parse_known_args()
+
+    asyncio.run(run(tuple(args.pages), args.repeat))
+
+
+if __name__ == "__main__":
+    main()
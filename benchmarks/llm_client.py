@@ -0,0 +1,124 @@
+"""Per-call overhead of structured LLM calls, before and after client reuse.
+
+Starts the stub server of ``benchmarks.llm_stub`` on localhost, answering
+every chat completion after ``--latency-ms``, then sends ``--calls``
+filter-inference completions through ``MappedOpenAI`` at each
+``--concurrency`` level in two setups:
+
+- before: the default OpenAI client, with the structured wrapper built for
+  every call;
+- after: the pooled client of ``create_http_client``, with the wrapper built
+  once.
+
+Reports mean, median and p95 latency per call, throughput and the TCP
+connections the stub server saw. No calls leave the machine.
+
+Usage:
+    PYTHONPATH=src python -m benchmarks.llm_client --calls 400
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from common.infrastructure.config.llm_config import LLMConfig, LLMHttpConfig
+from common.infrastructure.services.llama_index.client import (
+    MappedOpenAI,
+    create_http_client,
+)
+from showcase.course.application.read_models.filter_inference import CourseFilterLLM
+
+from benchmarks.llm_stub import Latency, StubLLMServer
+
+
+PROMPT = "Запрос пользователя: хочу научиться программировать на Python"
+
+
+async def measure(
+    call: Callable[[], Awaitable[object]], calls: int, concurrency: int
+) -> tuple[list[float], float]:
+    """Latencies of ``calls`` calls, ``concurrency`` at a time, and wall time."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def one() -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            await call()
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(calls)))
+    return latencies, time.perf_counter() - started
+
+
+async def run(calls: int, levels: list[int], latency_ms: float) -> None:
+    logger = logging.getLogger("benchmark")
+    server = StubLLMServer(Latency("fixed", (latency_ms,)))
+    base_url = await server.start()
+    config = LLMConfig(model="gpt-5-nano", base_url=base_url, api_key="stub")
+
+    started = time.perf_counter()
+    llm = MappedOpenAI.from_config(config)
+    for _ in range(1000):
+        llm.as_structured_llm(CourseFilterLLM)
+    wrapper_us = (time.perf_counter() - started) * 1e6 / 1000
+    print(f"as_structured_llm: {wrapper_us:.1f} us per wrapper")
+    print(f"stub latency {latency_ms:.0f} ms, {calls} calls per run\n")
+
+    print(
+        f"{'setup':>7} {'conc':>5} {'mean ms':>8} {'p50 ms':>7} {'p95 ms':>7} "
+        f"{'calls/s':>8} {'conns':>6}"
+    )
+    try:
+        for concurrency in levels:
+            for setup in ("before", "after"):
+                http_client = (
+                    create_http_client(LLMHttpConfig(), logger)
+                    if setup == "after"
+                    else None
+                )
+                call = _caller(MappedOpenAI.from_config(config, http_client), setup)
+                # Warm up the connection and check the answer parses
+                json.loads((await call()).text)
+                server.connections.clear()
+
+                latencies, wall = await measure(call, calls, concurrency)
+                latencies.sort()
+                print(
+                    f"{setup:>7} {concurrency:>5} "
+                    f"{statistics.fmean(latencies):>8.2f} "
+                    f"{statistics.median(latencies):>7.2f} "
+                    f"{latencies[int(0.95 * (len(latencies) - 1))]:>7.2f} "
+                    f"{calls / wall:>8.0f} {len(server.connections):>6}"
+                )
+                if http_client is not None:
+                    await http_client.aclose()
+    finally:
+        await server.stop()
+
+
+def _caller(llm: MappedOpenAI, setup: str) -> Callable[[], Awaitable[Any]]:
+    if setup == "before":
+        return lambda: llm.as_structured_llm(CourseFilterLLM).acomplete(PROMPT)
+    structured = llm.as_structured_llm(CourseFilterLLM)
+    return lambda: structured.acomplete(PROMPT)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 16, 64])
+    parser.add_argument("--latency-ms", type=float, default=5)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.calls, args.concurrency, args.latency_ms))
+
+
+if __name__ == "__main__":
+    main()
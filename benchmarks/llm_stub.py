@@ -0,0 +1,460 @@
+"""OpenAI-compatible stub LLM server for offline load tests.
+
+Answers chat completions on ``/v1/chat/completions`` with schema-valid
+``CourseFilterLLM`` and ``CourseRankingLLM`` results, so the recommendation
+pipeline runs end to end without paying for LLM calls:
+
+- filter inference names the listed categories that occur in the query, or
+  one picked by a hash of the query;
+- ranking returns every course alias of the prompt table in an order and
+  with confidences derived from a hash of the prompt.
+
+Answers are delayed by a ``--latency`` distribution and fail at the given
+rates: HTTP 500, HTTP 429 and answers cut short so they fail validation, as
+truncated structured output does.
+
+With ``--cassette`` and ``--upstream`` the server proxies to a real
+OpenAI-compatible API and appends every answer to the cassette, so pointing
+``llm.base_url`` of a production deployment at it records real traffic.
+With ``--cassette`` alone it replays the recorded answers: the one recorded
+for the same request, or with ``--match schema`` any recorded for the same
+output schema when there is none, and a synthetic answer otherwise. Cassettes keep
+a digest of each request, never the prompt, so user queries stay out of
+them. ``--latency recorded`` replays recorded latencies as well.
+
+Point the API or the Telegram bot at the printed URL through
+``llm.base_url`` to load-test them, or let ``benchmarks.recommendation_load``
+start the server in-process.
+
+Usage:
+    PYTHONPATH=src python -m benchmarks.llm_stub --latency lognormal:900:0.4
+    PYTHONPATH=src python -m benchmarks.llm_stub --cassette prod.jsonl --upstream https://api.openai.com/v1
+    PYTHONPATH=src python -m benchmarks.llm_stub --cassette prod.jsonl --match schema --latency recorded
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import random
+import re
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from dataclasses import dataclass
+from http import HTTPStatus
+from itertools import cycle
+from pathlib import Path
+from typing import Any, ClassVar
+
+import httpx
+from aiohttp import web
+from common.infrastructure.services.llama_index.tokens import estimate_tokens
+from pydantic import BaseModel
+from showcase.course.application.read_models.filter_inference import CourseFilterLLM
+from showcase.course.infrastructure.services.llama_index.course_ranking_service import (
+    CourseRankingItem,
+    CourseRankingLLM,
+)
+
+
+QUERY = re.compile(r'Запрос пользователя:\s*"(.*?)"', re.DOTALL)
+CATEGORIES = re.compile(r"Доступные категории:\n(.*?)\n\s*\n", re.DOTALL)
+ALIAS = re.compile(r"^\s*(c\d+)\t", re.MULTILINE)
+
+
+@dataclass(frozen=True)
+class Latency:
+    """Answer delay distribution, parsed from ``kind[:param...]``.
+
+    ``fixed:MS``, ``uniform:LOW_MS:HIGH_MS``, ``lognormal:MEDIAN_MS:SIGMA``
+    or ``recorded``, which replays cassette latencies and adds none to
+    synthetic answers.
+    """
+
+    kind: str = "fixed"
+    params: tuple[float, ...] = (0.0,)
+
+    ARITY: ClassVar[dict[str, int]] = {
+        "fixed": 1,
+        "uniform": 2,
+        "lognormal": 2,
+        "recorded": 0,
+    }
+
+    @classmethod
+    def parse(cls, spec: str) -> "Latency":
+        kind, *params = spec.split(":")
+        if cls.ARITY.get(kind) != len(params):
+            raise ValueError(f"Invalid latency: {spec!r}")
+        return cls(kind, tuple(map(float, params)))
+
+    def __str__(self) -> str:
+        return ":".join([self.kind, *(f"{p:g}" for p in self.params)])
+
+    def sample(self, rng: random.Random, recorded_ms: float | None = None) -> float:
+        """Delay in seconds."""
+        match self.kind:
+            case "fixed":
+                ms = self.params[0]
+            case "uniform":
+                ms = rng.uniform(*self.params)
+            case "lognormal":
+                median, sigma = self.params
+                ms = rng.lognormvariate(math.log(median), sigma)
+            case _:
+                ms = recorded_ms or 0.0
+        return ms / 1000
+
+
+@dataclass(frozen=True)
+class Failures:
+    error_rate: float = 0.0  # HTTP 500
+    rate_limit_rate: float = 0.0  # HTTP 429
+    malformed_rate: float = 0.0  # answers cut short, failing validation
+
+
+@dataclass
+class StubStats:
+    requests: int = 0
+    errors: int = 0  # HTTP 500 and 429 sent
+    malformed: int = 0
+    replayed: int = 0
+    synthesized: int = 0
+    recorded: int = 0
+
+
+class Cassette:
+    """Recorded answers, one JSON object per line.
+
+    An entry holds the request digest, the output schema name, the response
+    body and the upstream latency. With ``match="schema"`` a request without
+    a recording of its own gets the recordings of its schema in turn.
+    """
+
+    def __init__(self, path: Path, match: str = "exact") -> None:
+        self.path = path
+        self.match = match
+        self._by_key: dict[str, dict[str, Any]] = {}
+        self._by_schema: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        self._turns: dict[str, Iterator[dict[str, Any]]] = {}
+        if path.exists():
+            with path.open(encoding="utf-8") as file:
+                for line in file:
+                    if line.strip():
+                        self._add(json.loads(line))
+
+    def __len__(self) -> int:
+        return len(self._by_key)
+
+    @staticmethod
+    def key(body: dict[str, Any]) -> str:
+        request = {"schema": _schema_name(body), "messages": body.get("messages")}
+        return hashlib.sha256(
+            json.dumps(request, sort_keys=True, ensure_ascii=False).encode()
+        ).hexdigest()
+
+    def find(self, body: dict[str, Any]) -> dict[str, Any] | None:
+        entry = self._by_key.get(self.key(body))
+        if entry is not None or self.match != "schema":
+            return entry
+
+        schema = _schema_name(body) or ""
+        if not self._by_schema.get(schema):
+            return None
+        if schema not in self._turns:
+            self._turns[schema] = cycle(self._by_schema[schema])
+        return next(self._turns[schema])
+
+    def append(
+        self, body: dict[str, Any], response: dict[str, Any], latency_ms: float
+    ) -> None:
+        entry = {
+            "key": self.key(body),
+            "schema": _schema_name(body),
+            "latency_ms": round(latency_ms, 1),
+            "response": response,
+        }
+        self._add(entry)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as file:
+            file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def _add(self, entry: dict[str, Any]) -> None:
+        self._by_key[entry["key"]] = entry
+        self._by_schema[entry.get("schema") or ""].append(entry)
+
+
+class StubLLMServer:
+    """Chat completions endpoint for the recommendation LLM schemas.
+
+    ``connections`` collects the transports requests arrived on, to count
+    the TCP connections clients opened.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        latency: Latency | None = None,
+        failures: Failures | None = None,
+        cassette: Cassette | None = None,
+        upstream: str | None = None,
+        seed: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        if upstream is not None and cassette is None:
+            raise ValueError("Recording from upstream needs a cassette")
+
+        self.latency = latency or Latency()
+        self.failures = failures or Failures()
+        self.cassette = cassette
+        self.stats = StubStats()
+        self.connections: set[object] = set()
+        self._upstream = upstream
+        self._rng = random.Random(seed)
+        self._host = host
+        self._port = port
+        self._runner: web.AppRunner | None = None
+        self._client: httpx.AsyncClient | None = None
+
+    async def start(self) -> str:
+        """Start serving and return the base URL for ``llm.base_url``."""
+        app = web.Application(client_max_size=16 * 1024 * 1024)
+        app.router.add_post("/v1/chat/completions", self._complete)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self._host, self._port)
+        await site.start()
+        if self._upstream is not None:
+            self._client = httpx.AsyncClient(
+                base_url=self._upstream, timeout=httpx.Timeout(120, connect=10)
+            )
+
+        host, port = self._runner.addresses[0][:2]
+        return f"http://{host}:{port}/v1"
+
+    async def stop(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    async def _complete(self, request: web.Request) -> web.Response:
+        self.connections.add(request.transport)
+        self.stats.requests += 1
+        body = await request.json()
+        if self._client is not None:
+            return await self._record(request, body)
+
+        entry = self.cassette.find(body) if self.cassette else None
+        await asyncio.sleep(
+            self.latency.sample(self._rng, entry["latency_ms"] if entry else None)
+        )
+
+        roll = self._rng.random()
+        if roll < self.failures.error_rate:
+            self.stats.errors += 1
+            return _error(HTTPStatus.INTERNAL_SERVER_ERROR, "server_error")
+        if roll < self.failures.error_rate + self.failures.rate_limit_rate:
+            self.stats.errors += 1
+            return _error(HTTPStatus.TOO_MANY_REQUESTS, "rate_limit_exceeded")
+
+        if entry is not None:
+            self.stats.replayed += 1
+            response = entry["response"]
+        else:
+            self.stats.synthesized += 1
+            response = self._synthesize(body)
+
+        if self._rng.random() < self.failures.malformed_rate:
+            self.stats.malformed += 1
+            response = _truncated(response)
+        return web.json_response(response)
+
+    async def _record(self, request: web.Request, body: dict[str, Any]) -> web.Response:
+        assert self._client is not None
+        assert self.cassette is not None
+        started = time.perf_counter()
+        upstream = await self._client.post(
+            "chat/completions",
+            json=body,
+            headers={"Authorization": request.headers.get("Authorization", "")},
+        )
+        latency_ms = (time.perf_counter() - started) * 1000
+
+        if not upstream.is_success:
+            self.stats.errors += 1
+            return web.Response(
+                body=upstream.content,
+                status=upstream.status_code,
+                content_type="application/json",
+            )
+
+        response = upstream.json()
+        self.cassette.append(body, response, latency_ms)
+        self.stats.recorded += 1
+        return web.json_response(response)
+
+    def _synthesize(self, body: dict[str, Any]) -> dict[str, Any]:
+        prompt = "\n".join(
+            str(message.get("content") or "") for message in body.get("messages", [])
+        )
+        schema = _schema_name(body)
+        answer: BaseModel
+        if schema == CourseRankingLLM.__name__ or (
+            schema is None and ALIAS.search(prompt)
+        ):
+            answer = _ranking(prompt)
+        else:
+            answer = _filter(prompt)
+
+        arguments = answer.model_dump_json(exclude_none=True)
+        message: dict[str, Any] = {"role": "assistant", "content": None}
+        if body.get("tools"):
+            message["tool_calls"] = [
+                {
+                    "id": f"call_{self.stats.requests}",
+                    "type": "function",
+                    "function": {"name": schema, "arguments": arguments},
+                }
+            ]
+        else:
+            message["content"] = arguments
+
+        prompt_tokens = estimate_tokens(prompt)
+        completion_tokens = estimate_tokens(arguments)
+        return {
+            "id": f"stub-{self.stats.requests}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "stub"),
+            "choices": [{"index": 0, "message": message, "finish_reason": "stop"}],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+
+
+def _filter(prompt: str) -> CourseFilterLLM:
+    match = QUERY.search(prompt)
+    query = match.group(1).strip() if match else ""
+    if not query:
+        return CourseFilterLLM(is_decisive=False)
+
+    listed = CATEGORIES.search(prompt)
+    names = [
+        name
+        for line in (listed.group(1).splitlines() if listed else [])
+        if (name := line.strip()) and name != "нет"
+    ]
+    if not names:
+        return CourseFilterLLM(is_decisive=True)
+
+    matched = [name for name in names if name.lower() in query.lower()]
+    return CourseFilterLLM(
+        is_decisive=True,
+        category_names=matched or [names[_digest(query) % len(names)]],
+    )
+
+
+def _ranking(prompt: str) -> CourseRankingLLM:
+    aliases = ALIAS.findall(prompt)
+    random.Random(_digest(prompt)).shuffle(aliases)
+    return CourseRankingLLM(
+        courses=[
+            CourseRankingItem(id=alias, confidence=round(max(0.95 - 0.03 * i, 0.55), 2))
+            for i, alias in enumerate(aliases)
+        ]
+    )
+
+
+def _digest(text: str) -> int:
+    return int.from_bytes(hashlib.sha256(text.encode()).digest()[:8])
+
+
+def _schema_name(body: dict[str, Any]) -> str | None:
+    """Name of the structured-output schema, or of the first tool."""
+    schema = (body.get("response_format") or {}).get("json_schema") or {}
+    tools = body.get("tools") or []
+    return schema.get("name") or (tools[0]["function"]["name"] if tools else None)
+
+
+def _truncated(response: dict[str, Any]) -> dict[str, Any]:
+    response = json.loads(json.dumps(response))
+    message = response["choices"][0]["message"]
+    for call in message.get("tool_calls") or []:
+        arguments = call["function"]["arguments"]
+        call["function"]["arguments"] = arguments[: len(arguments) // 2]
+    if message.get("content"):
+        message["content"] = message["content"][: len(message["content"]) // 2]
+    return response
+
+
+def _error(status: HTTPStatus, code: str) -> web.Response:
+    # The OpenAI client honours retry-after-ms when it retries
+    headers = (
+        {"retry-after-ms": "200"} if status == HTTPStatus.TOO_MANY_REQUESTS else None
+    )
+    return web.json_response(
+        {"error": {"message": f"Stub {status.phrase}", "type": code, "code": code}},
+        status=status,
+        headers=headers,
+    )
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the stub server options to a benchmark's parser."""
+    parser.add_argument(
+        "--latency", type=Latency.parse, default=Latency.parse("fixed:200")
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--malformed-rate", type=float, default=0.0)
+    parser.add_argument("--cassette", type=Path)
+    parser.add_argument("--match", choices=["exact", "schema"], default="exact")
+    parser.add_argument("--upstream", help="record answers of this API")
+    parser.add_argument("--seed", type=int, default=0)
+
+
+def from_arguments(args: argparse.Namespace, port: int = 0) -> StubLLMServer:
+    return StubLLMServer(
+        latency=args.latency,
+        failures=Failures(args.error_rate, args.rate_limit_rate, args.malformed_rate),
+        cassette=Cassette(args.cassette, args.match) if args.cassette else None,
+        upstream=args.upstream,
+        seed=args.seed,
+        port=port,
+    )
+
+
+async def serve(args: argparse.Namespace) -> None:
+    server = from_arguments(args, args.port)
+    base_url = await server.start()
+    mode = "recording" if args.upstream else "replaying" if args.cassette else "stub"
+    print(f"{mode} at {base_url}; set llm.base_url to it, Ctrl-C to stop")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+        print(server.stats)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--port", type=int, default=8089)
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
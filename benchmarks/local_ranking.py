@@ -0,0 +1,81 @@
+"""Local ranking latency over a whole synthetic catalog.
+
+Builds the synthetic catalog of ``course_prerank``, indexes it with
+``CourseVectorIndex`` in a temporary directory and ranks every course with
+``LocalCourseRankingService`` for each query: once with a cold term cache
+and ``--repeat`` times warm. Also reports the share of the first ten
+results that belong to the topic the query was written for.
+
+No LLM or database calls are made.
+
+Usage:
+    PYTHONPATH=src python -m benchmarks.local_ranking --size 10000
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import tempfile
+import time
+
+from common.infrastructure.services.clock import SystemClock
+from showcase.course.infrastructure.services.vectors.course_vector_index import (
+    CourseVectorIndex,
+)
+from showcase.course.infrastructure.services.vectors.hashing_vectorizer import (
+    HashingVectorizer,
+)
+from showcase.course.infrastructure.services.vectors.local_ranking_service import (
+    LocalCourseRankingService,
+)
+
+from benchmarks.course_prerank import QUERIES, TOPICS, build_catalog
+
+
+async def run(size: int, repeat: int) -> None:
+    logger = logging.getLogger("benchmark")
+    catalog = build_catalog(size, seed=size)
+    topics = list(TOPICS)
+
+    with tempfile.TemporaryDirectory() as directory:
+        index = CourseVectorIndex(
+            logger,
+            directory,
+            HashingVectorizer(4096),
+            course_repository=None,  # type: ignore[arg-type]  # never written to
+        )
+        index.rebuild(catalog)
+        ranking = LocalCourseRankingService(logger, index, SystemClock())
+
+        print(f"{size} courses")
+        print(f"{'query':>42} {'cold ms':>8} {'warm ms':>8} {'top-10 on topic':>16}")
+        for query, topic in zip(QUERIES, topics, strict=False):
+            started = time.perf_counter()
+            await ranking.rank(query, catalog, [topic])
+            cold_ms = (time.perf_counter() - started) * 1000
+
+            warm_ms = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                ranked, _ = await ranking.rank(query, catalog, [topic])
+                warm_ms.append((time.perf_counter() - started) * 1000)
+
+            on_topic = sum(course.categories[0].name == topic for course in ranked[:10])
+            print(
+                f"{query[:42]:>42} {cold_ms:>8.0f} "
+                f"{statistics.median(warm_ms):>8.1f} {on_topic / 10:>16.0%}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.size, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
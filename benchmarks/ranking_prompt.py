@@ -0,0 +1,92 @@
+"""Ranking prompt size: compact course table vs the JSON list it replaced.
+
+Draws candidate lists from the synthetic catalog of ``course_prerank`` and
+renders each one twice: as the former payload (``CourseRankingReadModel``
+dumps embedded as a Python list repr) and with ``CoursePromptEncoder`` at
+several token budgets. Token counts come from the llama-index tokenizer.
+Also reports encoding latency with a cold and a warm row cache.
+
+No LLM calls are made.
+
+Usage:
+    PYTHONPATH=src python -m benchmarks.ranking_prompt
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from llama_index.core.utils import get_tokenizer
+from showcase.course.application.read_models.course_read_model import (
+    CourseRankingReadModel,
+    CourseReadModel,
+)
+from showcase.course.infrastructure.services.llama_index.course_prompt_encoder import (
+    CoursePromptEncoder,
+)
+
+from benchmarks.course_prerank import build_catalog
+
+
+BUDGETS = (8000, 4000, 2000, 1000)
+
+
+def legacy_payload(courses: list[CourseReadModel]) -> str:
+    return str(
+        [
+            CourseRankingReadModel.from_course_read_model(c).model_dump(mode="json")
+            for c in courses
+        ]
+    )
+
+
+def run(candidates: int, repeat: int) -> None:
+    tokenize = get_tokenizer()
+    catalog = build_catalog(candidates * repeat, seed=0)
+    rng = random.Random(0)
+    samples = [rng.sample(catalog, candidates) for _ in range(repeat)]
+
+    legacy = [len(tokenize(legacy_payload(sample))) for sample in samples]
+    print(f"{candidates} candidates, median of {repeat} lists")
+    print(f"{'payload':>16} {'tokens':>8} {'saved':>7} {'level':>6}")
+    print(f"{'legacy json':>16} {statistics.median(legacy):>8.0f} {'':>7} {'':>6}")
+
+    for budget in BUDGETS:
+        encoder = CoursePromptEncoder()
+        tokens, levels = [], []
+        for sample in samples:
+            encoded = encoder.encode(sample, budget)
+            tokens.append(len(tokenize(encoded.table)))
+            levels.append(encoded.level)
+        saved = 1 - statistics.median(tokens) / statistics.median(legacy)
+        print(
+            f"{f'table {budget}':>16} {statistics.median(tokens):>8.0f} "
+            f"{saved:>7.0%} {statistics.median(levels):>6.0f}"
+        )
+
+    encoder = CoursePromptEncoder()
+    cold: list[float] = []
+    warm: list[float] = []
+    for sample in samples:
+        for sink in (cold, warm):
+            started = time.perf_counter()
+            encoder.encode(sample, BUDGETS[1])
+            sink.append((time.perf_counter() - started) * 1000)
+    print(
+        f"encode ms: cold {statistics.median(cold):.2f}, "
+        f"warm {statistics.median(warm):.2f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--candidates", type=int, default=25)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    run(args.candidates, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
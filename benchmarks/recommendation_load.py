@@ -0,0 +1,247 @@
+"""Recommendation latency, throughput and DB connections under load.
+
+Starts the stub LLM server of ``benchmarks.llm_stub`` in-process and wires
+the recommendation pipeline as the API does, against the configured database
+and its catalog, with ``llm.base_url`` pointed at the stub. After one warm-up
+round over ``QUERIES``, at each ``--concurrency`` level ``--requests``
+recommendations cycling through ``QUERIES`` run ``concurrency`` at a time.
+
+Reports p50/p95/p99 latency, throughput, failed requests and requests that
+fell back to unfiltered courses, the LLM calls each stage made and database
+connections: the most checked out at once and the ones newly opened.
+
+The result cache, the filter inference cache and coalescing are turned off
+so every request runs the whole pipeline; ``--warm`` keeps them as
+configured. Stub latency, failure rates and cassette replay take the options
+of ``benchmarks.llm_stub``. No calls leave the machine.
+
+Usage:
+    PYTHONPATH=src python -m benchmarks.recommendation_load --config configs/example.yaml
+    PYTHONPATH=src python -m benchmarks.recommendation_load --latency lognormal:900:0.4 --error-rate 0.02
+"""
+
+import argparse
+import asyncio
+import logging
+import math
+import time
+from collections import Counter
+from typing import Any
+
+from bootstrap.config import AppConfig
+from common.infrastructure.database.postgres.sqlalchemy.database import Database
+from common.infrastructure.di.container.common import CommonContainer
+from common.infrastructure.services.llama_index.client import (
+    MappedOpenAI,
+    create_http_client,
+)
+from common.infrastructure.services.llama_index.instrumentation import LLMMetrics
+from showcase.category.infrastructure.di.container import CategoryContainer
+from showcase.course.application.interfaces.services.recommendation_service import (
+    GetRecommendationsDTO,
+    RecommendationNotice,
+)
+from showcase.course.infrastructure.di.container import (
+    CourseContainer,
+    RecommendationContainer,
+)
+from sqlalchemy import event
+
+from benchmarks import llm_stub
+
+
+QUERIES = (
+    "Хочу научиться программировать на Python с нуля",
+    "Курс по анализу данных онлайн с сертификатом",
+    "Машинное обучение для начинающих, не дольше 100 часов",
+    "Хочу сменить профессию и стать тестировщиком",
+    "Основы дизайна интерфейсов",
+    "Управление проектами в IT, офлайн",
+    "SQL и базы данных для аналитика",
+    "Английский язык для программистов",
+)
+CONCURRENCY = (1, 4, 16, 64)
+
+
+class PoolUsage:
+    """Database connections checked out at once, and new ones opened."""
+
+    def __init__(self, database: Database) -> None:
+        self.engine = database.get_engine().sync_engine
+        self.checked_out = 0
+        self.peak = 0
+        self.opened = 0
+        event.listen(self.engine, "connect", self._connect)
+        event.listen(self.engine, "checkout", self._checkout)
+        event.listen(self.engine, "checkin", self._checkin)
+
+    def reset(self) -> None:
+        self.peak = self.checked_out
+        self.opened = 0
+
+    def _connect(self, *_: Any) -> None:
+        self.opened += 1
+
+    def _checkout(self, *_: Any) -> None:
+        self.checked_out += 1
+        self.peak = max(self.peak, self.checked_out)
+
+    def _checkin(self, *_: Any) -> None:
+        self.checked_out -= 1
+
+
+def wire(
+    config: AppConfig,
+    logger: logging.Logger,
+    database: Database,
+    llm: MappedOpenAI,
+    llm_metrics: LLMMetrics,
+) -> RecommendationContainer:
+    """Build the recommendation containers the way the API does."""
+    common_container = CommonContainer(config=config, database=database, logger=logger)
+    course_container = CourseContainer(
+        logger=logger,
+        uuid_generator=common_container.uuid_generator,
+        query_executor=common_container.query_executor,
+        clock=common_container.clock,
+        course_config=config.course,
+    )
+    category_container = CategoryContainer(
+        uuid_generator=common_container.uuid_generator,
+        query_executor=common_container.query_executor,
+        clock=common_container.clock,
+        catalog_listener=course_container.course_card_projector,
+        catalog_cache=course_container.catalog_cache,
+        category_config=config.category,
+    )
+    return RecommendationContainer(
+        logger=logger,
+        clock=common_container.clock,
+        llm=llm,
+        course_read_repository=course_container.course_read_repository,
+        category_catalog=category_container.category_catalog,
+        catalog_version=course_container.catalog_version,
+        course_config=config.course,
+        llm_config=config.llm,
+        course_vector_index=course_container.course_vector_index,
+        llm_metrics=llm_metrics,
+    )
+
+
+def percentile(ordered: list[float], q: float) -> float:
+    """Nearest-rank percentile of sorted values."""
+    if not ordered:
+        return 0.0
+    return ordered[max(math.ceil(q * len(ordered)) - 1, 0)]
+
+
+async def drive(
+    container: RecommendationContainer, requests: int, concurrency: int
+) -> tuple[list[float], Counter[str], float]:
+    """Latencies of successful requests, outcome counts and wall time."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    outcomes: Counter[str] = Counter()
+
+    async def one(i: int) -> None:
+        dto = GetRecommendationsDTO(query=QUERIES[i % len(QUERIES)])
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                # A service per request, as the API resolves it
+                result = await container.recommendation_service().recommend(dto)
+            except Exception as e:
+                outcomes[type(e).__name__] += 1
+                return
+            latencies.append((time.perf_counter() - started) * 1000)
+            outcomes["ok"] += 1
+            outcomes["fallback"] += RecommendationNotice.FALLBACK_USED in (
+                result.notices
+            )
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    return sorted(latencies), outcomes, time.perf_counter() - started
+
+
+async def run(args: argparse.Namespace) -> None:
+    logger = logging.getLogger("benchmark")
+    config = AppConfig.load()
+    server = llm_stub.from_arguments(args)
+    config.llm.base_url = await server.start()
+    config.llm.api_key = "stub"
+    if not args.warm:
+        config.course.recommendation_cache.max_entries = 0
+        config.course.filter_inference_cache.max_entries = 0
+        config.course.filter_inference_cache.persist_path = None
+        config.course.coalescing.recommendations = False
+
+    database = Database.create(config.db, logger)
+    pool = PoolUsage(database)
+    llm_metrics = LLMMetrics()
+    llm_http_client = create_http_client(
+        config.llm.http, logger, llm_metrics.event_hooks()
+    )
+    llm = MappedOpenAI.from_config(config.llm, llm_http_client)
+    container = wire(config, logger, database, llm, llm_metrics)
+    fallback_ranking = asyncio.create_task(
+        container.fallback_recommendation_service().run()
+    )
+
+    def llm_calls() -> Counter[str]:
+        calls: Counter[str] = Counter()
+        for stats in llm_metrics.stats():
+            calls[stats.stage] += stats.calls
+        return calls
+
+    try:
+        # Loads categories, vectors and the fallback ranking before measuring
+        await drive(container, len(QUERIES), len(QUERIES))
+        print(f"stub latency {args.latency}, {args.requests} requests per level")
+        print(f"db pool: {pool.engine.pool.status()}\n")
+        print(
+            f"{'conc':>5} {'ok':>5} {'failed':>6} {'fallbk':>6} {'p50 ms':>8} "
+            f"{'p95 ms':>8} {'p99 ms':>8} {'req/s':>7} {'filter':>6} "
+            f"{'rank':>5} {'db peak':>7} {'db new':>6}"
+        )
+        for concurrency in args.concurrency:
+            calls_before = llm_calls()
+            pool.reset()
+            latencies, outcomes, wall = await drive(
+                container, args.requests, concurrency
+            )
+            calls = llm_calls() - calls_before
+            failed = args.requests - outcomes["ok"]
+            print(
+                f"{concurrency:>5} {outcomes['ok']:>5} {failed:>6} "
+                f"{outcomes['fallback']:>6} "
+                f"{percentile(latencies, 0.50):>8.1f} "
+                f"{percentile(latencies, 0.95):>8.1f} "
+                f"{percentile(latencies, 0.99):>8.1f} "
+                f"{args.requests / wall:>7.1f} {calls['filter_inference']:>6} "
+                f"{calls['ranking']:>5} {pool.peak:>7} {pool.opened:>6}"
+            )
+            errors = {k: v for k, v in outcomes.items() if k not in ("ok", "fallback")}
+            if errors:
+                print(f"      errors: {errors}")
+        print(f"\nstub: {server.stats}")
+    finally:
+        fallback_ranking.cancel()
+        await llm_http_client.aclose()
+        await database.shutdown()
+        await server.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=list(CONCURRENCY))
+    parser.add_argument("--warm", action="store_true", help="keep the caches")
+    llm_stub.add_arguments(parser)
+    args, _ = parser.parse_known_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Course cards maintenance entry point.
+
+Usage:
+    python cli/course_cards.py rebuild
+    python cli/course_cards.py check [--limit N] [--repair]
+"""
+
+import argparse
+import asyncio
+import sys
+
+from bootstrap.config import AppConfig
+from common.infrastructure.database.postgres.sqlalchemy.database import Database
+from common.infrastructure.di.container.common import CommonContainer
+from common.infrastructure.logger.logging.logger_factory import LoggerFactory
+from showcase.course.infrastructure.di.container import CourseContainer
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Maintain the course_cards table")
+    parser.add_argument("--config", type=str, help="Path to config file")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("rebuild", help="Project every course into course_cards")
+
+    check = commands.add_parser(
+        "check", help="Report cards that are missing or differ from the catalog"
+    )
+    check.add_argument("--limit", type=int, default=1000)
+    check.add_argument(
+        "--repair", action="store_true", help="Re-project the drifted cards"
+    )
+
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Run a course_cards maintenance command and return the exit code."""
+    args = parse_args()
+    config = AppConfig.load()
+
+    logger = LoggerFactory.create(None, config.env, config.logger)
+    database = Database.create(config.db, logger)
+
+    common_container = CommonContainer(config=config, logger=logger, database=database)
+    course_container = CourseContainer(
+        logger=logger,
+        uuid_generator=common_container.uuid_generator,
+        query_executor=common_container.query_executor,
+        clock=common_container.clock,
+        course_config=config.course,
+    )
+    uow = common_container.unit_of_work()
+    projector = course_container.course_card_projector()
+
+    async def run() -> int:
+        try:
+            if args.command == "rebuild":
+                async with uow:
+                    changed = await projector.rebuild()
+                logger.info("course cards rebuilt", extra={"changed": changed})
+                return 0
+
+            drift = await projector.find_drift(limit=args.limit)
+            logger.info(
+                "course cards checked",
+                extra={
+                    "missing": [str(i) for i in drift.missing],
+                    "stale": [str(i) for i in drift.stale],
+                },
+            )
+            if not drift.course_ids:
+                return 0
+
+            if args.repair:
+                async with uow:
+                    changed = await projector.refresh(drift.course_ids)
+                logger.info("course cards repaired", extra={"changed": changed})
+                return 0
+            return 1
+        finally:
+            await database.shutdown()
+
+    return asyncio.run(run())
+
+
+if __name__ == "__main__":
+    sys.exit(main())
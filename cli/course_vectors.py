@@ -0,0 +1,76 @@
+"""Course vector index maintenance entry point.
+
+Usage:
+    python cli/course_vectors.py rebuild [--batch N]
+"""
+
+import argparse
+import asyncio
+import sys
+
+from bootstrap.config import AppConfig
+from common.infrastructure.database.postgres.sqlalchemy.database import Database
+from common.infrastructure.di.container.common import CommonContainer
+from common.infrastructure.logger.logging.logger_factory import LoggerFactory
+from showcase.course.application.read_models.course_read_model import CourseReadModel
+from showcase.course.infrastructure.di.container import CourseContainer
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Maintain the course vector index")
+    parser.add_argument("--config", type=str, help="Path to config file")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    rebuild = commands.add_parser("rebuild", help="Vectorize every course")
+    rebuild.add_argument("--batch", type=int, default=500)
+
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Run a vector index maintenance command and return the exit code."""
+    args = parse_args()
+    config = AppConfig.load()
+
+    logger = LoggerFactory.create(None, config.env, config.logger)
+    database = Database.create(config.db, logger)
+
+    common_container = CommonContainer(config=config, logger=logger, database=database)
+    course_container = CourseContainer(
+        logger=logger,
+        uuid_generator=common_container.uuid_generator,
+        query_executor=common_container.query_executor,
+        clock=common_container.clock,
+        course_config=config.course,
+    )
+    repository = course_container.course_read_repository()
+    index = course_container.course_vector_index()
+
+    async def run() -> int:
+        try:
+            courses: list[CourseReadModel] = []
+            after = None
+            while True:
+                page = await repository.get_all(limit=args.batch, after=after)
+                courses += page.courses
+                if page.next_cursor is None:
+                    break
+                after = page.next_cursor
+
+            written = index.rebuild(courses)
+            logger.info(
+                "course vectors rebuilt",
+                extra={
+                    "courses": written,
+                    "directory": config.course.vector_index.directory,
+                },
+            )
+            return 0
+        finally:
+            await database.shutdown()
+
+    return asyncio.run(run())
+
+
+if __name__ == "__main__":
+    sys.exit(main())
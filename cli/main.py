@@ -1,5 +1,6 @@
 """Application entry point."""
 
+import asyncio
 from collections.abc import AsyncGenerator
 from typing import Any
 
@@ -8,10 +9,15 @@ from bootstrap.utils import log_config
 from common.infrastructure.database.postgres.sqlalchemy.database import Database
 from common.infrastructure.di.container.common import CommonContainer
 from common.infrastructure.logger.logging.logger_factory import LoggerFactory
-from common.infrastructure.services.llama_index.client import MappedOpenAI
+from common.infrastructure.services.llama_index.client import (
+    MappedOpenAI,
+    create_http_client,
+)
+from common.infrastructure.services.llama_index.instrumentation import LLMMetrics
 from fastapi import FastAPI
 from fastapi.concurrency import asynccontextmanager
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from idp.auth.application.interfaces.usecases.command.login_use_case import (
     ILoginUseCase,
 )
@@ -48,6 +54,9 @@ from showcase.category.application.interfaces.usecases.query.get_category_by_id_
 )
 from showcase.category.infrastructure.di.container import CategoryContainer
 from showcase.category.presentation.http.fastapi.controllers import category_router
+from showcase.course.application.interfaces.services.recommendation_job_service import (
+    IRecommendationJobService,
+)
 from showcase.course.application.interfaces.services.recommendation_service import (
     IRecommendationService,
 )
@@ -83,6 +92,7 @@ from showcase.course.application.interfaces.usecases.command.update_tag_use_case
 )
 from showcase.course.application.interfaces.usecases.query import (
     IGetCourseByIdUseCase,
+    IGetCourseFacetsUseCase,
     IGetCoursesSearchUseCase,
     IGetCoursesUseCase,
     IGetSkillByIdUseCase,
@@ -139,6 +149,9 @@ def init_course(app: FastAPI, container: CourseContainer) -> None:
     app.dependency_overrides[IGetCoursesExtendedUseCase] = (
         lambda: container.filter_courses_usecase()
     )
+    app.dependency_overrides[IGetCourseFacetsUseCase] = (
+        lambda: container.course_facets_usecase()
+    )
     app.dependency_overrides[IGetCourseByIdUseCase] = (
         lambda: container.get_course_by_id_usecase()
     )
@@ -259,6 +272,9 @@ def init_recommendations(app: FastAPI, container: RecommendationContainer) -> No
     app.dependency_overrides[IRecommendationService] = (
         lambda: container.recommendation_service()
     )
+    app.dependency_overrides[IRecommendationJobService] = (
+        lambda: container.recommendation_job_service()
+    )
 
 
 def main() -> FastAPI:
@@ -282,19 +298,26 @@ def main() -> FastAPI:
     database = Database.create(config.db, logger)
     logger.info("database initialized")
 
-    llm = MappedOpenAI(
-        model=config.llm.model,
-        api_key=config.llm.api_key,
-        api_base=config.llm.base_url,
-        temperature=0.3,
+    llm_metrics = LLMMetrics()
+    llm_http_client = create_http_client(
+        config.llm.http, logger, llm_metrics.event_hooks()
     )
-    MappedOpenAI.override(config.llm.model, config.llm.provider_model)
+    llm = MappedOpenAI.from_config(config.llm, llm_http_client)
     logger.info("llm initialized")
 
     # Create FastAPI server
     @asynccontextmanager
     async def lifespan(app: FastAPI) -> AsyncGenerator[None, Any]:
+        fallback_ranking = asyncio.create_task(
+            recommendation_container.fallback_recommendation_service().run()
+        )
+        recommendation_jobs = asyncio.create_task(
+            recommendation_container.recommendation_job_service().run()
+        )
         yield
+        recommendation_jobs.cancel()
+        fallback_ranking.cancel()
+        await llm_http_client.aclose()
         await database.shutdown()
 
     server = FastAPI(lifespan=lifespan)
@@ -333,20 +356,40 @@ def main() -> FastAPI:
     )
 
     course_container = CourseContainer(
-        uuid_generator=uuid_generator, query_executor=query_executor, clock=clock
+        logger=logger,
+        uuid_generator=uuid_generator,
+        query_executor=query_executor,
+        clock=clock,
+        course_config=config.course,
     )
     lecturer_container = LecturerContainer(
-        uuid_generator=uuid_generator, query_executor=query_executor, clock=clock
+        uuid_generator=uuid_generator,
+        query_executor=query_executor,
+        clock=clock,
+        catalog_listener=course_container.course_card_projector,
+        catalog_cache=course_container.catalog_cache,
     )
     category_container = CategoryContainer(
-        uuid_generator=uuid_generator, query_executor=query_executor, clock=clock
+        uuid_generator=uuid_generator,
+        query_executor=query_executor,
+        clock=clock,
+        catalog_listener=course_container.course_card_projector,
+        catalog_cache=course_container.catalog_cache,
+        category_config=config.category,
     )
 
     recommendation_container = RecommendationContainer(
         logger=logger,
+        uuid_generator=uuid_generator,
+        clock=clock,
         llm=llm,
         course_read_repository=course_container.course_read_repository,
-        category_read_repository=category_container.category_read_repository,
+        category_catalog=category_container.category_catalog,
+        catalog_version=course_container.catalog_version,
+        course_config=config.course,
+        llm_config=config.llm,
+        course_vector_index=course_container.course_vector_index,
+        llm_metrics=llm_metrics,
     )
 
     # Register routes
@@ -358,12 +401,20 @@ def main() -> FastAPI:
     init_token(server, token_container)
     init_recommendations(server, recommendation_container)
 
+    # LLM call histograms and counters in the Prometheus text format
+    @server.get("/metrics", include_in_schema=False)
+    async def metrics() -> PlainTextResponse:
+        return PlainTextResponse(
+            llm_metrics.prometheus(), media_type="text/plain; version=0.0.4"
+        )
+
     server.add_middleware(
         CORSMiddleware,
         allow_origins=["http://localhost:8081", config.deploy.external_url],
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor"],
     )
 
     # Create and configure app
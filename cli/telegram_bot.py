@@ -7,7 +7,11 @@ from bootstrap.utils import log_config
 from common.infrastructure.database.postgres.sqlalchemy.database import Database
 from common.infrastructure.di.container.common import CommonContainer
 from common.infrastructure.logger.logging.logger_factory import LoggerFactory
-from common.infrastructure.services.llama_index.client import MappedOpenAI
+from common.infrastructure.services.llama_index.client import (
+    MappedOpenAI,
+    create_http_client,
+)
+from common.infrastructure.services.llama_index.instrumentation import LLMMetrics
 from showcase.category.infrastructure.di.container import CategoryContainer
 from showcase.course.infrastructure.di.container import (
     CourseContainer,
@@ -45,13 +49,11 @@ def main() -> None:
     database = Database.create(config.db, logger)
     logger.info("database initialized")
 
-    llm = MappedOpenAI(
-        model=config.llm.model,
-        api_key=config.llm.api_key,
-        api_base=config.llm.base_url,
-        temperature=0.3,
+    llm_metrics = LLMMetrics()
+    llm_http_client = create_http_client(
+        config.llm.http, logger, llm_metrics.event_hooks()
     )
-    MappedOpenAI.override(config.llm.model, config.llm.provider_model)
+    llm = MappedOpenAI.from_config(config.llm, llm_http_client)
     logger.info("llm initialized")
 
     # Bootstrap common container with config and database
@@ -60,22 +62,36 @@ def main() -> None:
     query_executor = common_container.query_executor
 
     course_container = CourseContainer(
+        logger=logger,
         uuid_generator=common_container.uuid_generator,
         query_executor=query_executor,
         clock=common_container.clock,
+        course_config=config.course,
     )
+    # The API process maintains the course vector index; the bot only reads it
+    course_container.course_vector_index.add_kwargs(writable=False)
 
     category_container = CategoryContainer(
         uuid_generator=common_container.uuid_generator,
         query_executor=query_executor,
         clock=common_container.clock,
+        catalog_listener=course_container.course_card_projector,
+        catalog_cache=course_container.catalog_cache,
+        category_config=config.category,
     )
 
     recommendation_container = RecommendationContainer(
         logger=logger,
+        uuid_generator=common_container.uuid_generator,
+        clock=common_container.clock,
         llm=llm,
         course_read_repository=course_container.course_read_repository,
-        category_read_repository=category_container.category_read_repository,
+        category_catalog=category_container.category_catalog,
+        catalog_version=course_container.catalog_version,
+        course_config=config.course,
+        llm_config=config.llm,
+        course_vector_index=course_container.course_vector_index,
+        llm_metrics=llm_metrics,
     )
 
     # Create bot and dispatcher
@@ -93,7 +109,7 @@ def main() -> None:
         get_courses_use_case=course_container.filter_courses_usecase(),
         get_course_by_id_use_case=course_container.get_course_by_id_usecase(),
         get_courses_search_use_case=course_container.get_courses_search_usecase(),
-        get_categories_use_case=category_container.get_categories_usecase(),
+        category_catalog=category_container.category_catalog(),
         recommendation_service=recommendation_container.recommendation_service(),
     )
 
@@ -101,11 +117,16 @@ def main() -> None:
 
     # Start polling
     async def run() -> None:
+        fallback_ranking = asyncio.create_task(
+            recommendation_container.fallback_recommendation_service().run()
+        )
         try:
             logger.info("starting telegram bot polling...")
             await start_polling(bot, dp)
         finally:
+            fallback_ranking.cancel()
             await bot.session.close()
+            await llm_http_client.aclose()
             await database.shutdown()
             logger.info("telegram bot stopped")
 
@@ -19,6 +19,9 @@ from showcase.category.infrastructure.database.postgres.sqlalchemy.models.catego
 from showcase.course.infrastructure.database.postgres.sqlalchemy.models.course import (
     CourseBase,
 )
+from showcase.course.infrastructure.database.postgres.sqlalchemy.models.course_card import (
+    CourseCardBase,
+)
 from showcase.course.infrastructure.database.postgres.sqlalchemy.models.enrollment import (
     EnrollmentBase,
 )
@@ -36,6 +39,7 @@ __models__: list[type[Base]] = [
     CategoryBase,
     LecturerBase,
     CourseBase,
+    CourseCardBase,
     EnrollmentBase,
 ]
 
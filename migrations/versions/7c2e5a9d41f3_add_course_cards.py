@@ -0,0 +1,143 @@
+"""add course_cards projection
+
+Revision ID: 7c2e5a9d41f3
+Revises: 0ebab11ac41b
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from showcase.course.infrastructure.database.postgres.sqlalchemy.projections.course_card_projector import (
+    CourseCardProjector,
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7c2e5a9d41f3"
+down_revision: Union[str, Sequence[str], None] = "0ebab11ac41b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    def enum(name: str) -> postgresql.ENUM:
+        return postgresql.ENUM(name=name, create_type=False)
+
+    op.create_table(
+        "course_cards",
+        sa.Column("course_id", sa.UUID(), nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("format", enum("format"), nullable=False),
+        sa.Column("education_format", enum("educationformat"), nullable=False),
+        sa.Column("duration_hours", sa.Integer(), nullable=False),
+        sa.Column("cost", sa.Numeric(precision=10, scale=2), nullable=False),
+        sa.Column("discounted_cost", sa.Numeric(precision=10, scale=2), nullable=True),
+        sa.Column("start_date", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("end_date", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("certificate_type", enum("certificatetype"), nullable=False),
+        sa.Column("status", enum("coursestatus"), nullable=False),
+        sa.Column("is_published", sa.Boolean(), nullable=False),
+        sa.Column(
+            "locations",
+            postgresql.ARRAY(sa.String(length=255)),
+            server_default=sa.text("'{}'"),
+            nullable=False,
+        ),
+        sa.Column(
+            "categories",
+            postgresql.JSONB(),
+            server_default=sa.text("'[]'::jsonb"),
+            nullable=False,
+        ),
+        sa.Column(
+            "tags",
+            postgresql.JSONB(),
+            server_default=sa.text("'[]'::jsonb"),
+            nullable=False,
+        ),
+        sa.Column(
+            "acquired_skills",
+            postgresql.JSONB(),
+            server_default=sa.text("'[]'::jsonb"),
+            nullable=False,
+        ),
+        sa.Column(
+            "lecturers",
+            postgresql.JSONB(),
+            server_default=sa.text("'[]'::jsonb"),
+            nullable=False,
+        ),
+        sa.Column(
+            "sections",
+            postgresql.JSONB(),
+            server_default=sa.text("'[]'::jsonb"),
+            nullable=False,
+        ),
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            server_default=sa.text("''::tsvector"),
+            nullable=False,
+        ),
+        sa.Column("course_created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("course_updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("version", sa.Integer(), server_default=sa.text("1"), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["course_id"], ["courses.course_id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("course_id"),
+    )
+    op.create_index(
+        "ix_course_cards_search_vector",
+        "course_cards",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_course_cards_categories",
+        "course_cards",
+        ["categories"],
+        postgresql_using="gin",
+        postgresql_ops={"categories": "jsonb_path_ops"},
+    )
+    op.create_index(
+        "ix_course_cards_tags",
+        "course_cards",
+        ["tags"],
+        postgresql_using="gin",
+        postgresql_ops={"tags": "jsonb_path_ops"},
+    )
+    op.create_index(
+        "ix_course_cards_start_date",
+        "course_cards",
+        ["start_date", "duration_hours", "course_id"],
+    )
+
+    # Backfill with the projector's own statement, so cards have one shape
+    op.execute(CourseCardProjector.upsert())
+
+
+def downgrade() -> None:
+    op.drop_index("ix_course_cards_start_date", table_name="course_cards")
+    op.drop_index("ix_course_cards_tags", table_name="course_cards")
+    op.drop_index("ix_course_cards_categories", table_name="course_cards")
+    op.drop_index("ix_course_cards_search_vector", table_name="course_cards")
+    op.drop_table("course_cards")
@@ -0,0 +1,195 @@
+"""maintain courses.search_vector with triggers
+
+Revision ID: b3f19d6c8e27
+Revises: 7c2e5a9d41f3
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b3f19d6c8e27"
+down_revision: Union[str, Sequence[str], None] = "7c2e5a9d41f3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Weights: name A, description B, sections and skills C.
+FUNCTIONS = [
+    """
+CREATE FUNCTION course_search_document(
+    name text, description text, course_id uuid
+) RETURNS tsvector
+LANGUAGE sql STABLE AS $$
+    SELECT
+        setweight(to_tsvector('russian', coalesce(name, '')), 'A')
+        || setweight(to_tsvector('russian', coalesce(description, '')), 'B')
+        || setweight(to_tsvector('russian', coalesce((
+            SELECT string_agg(concat_ws(' ', s.name, s.description), ' '
+                              ORDER BY s.order_num)
+            FROM course_sections s
+            WHERE s.course_id = course_search_document.course_id
+        ), '')), 'C')
+        || setweight(to_tsvector('russian', coalesce((
+            SELECT string_agg(concat_ws(' ', k.name, k.description), ' '
+                              ORDER BY k.name)
+            FROM course_skills cs
+            JOIN skills k ON k.skill_id = cs.skill_id
+            WHERE cs.course_id = course_search_document.course_id
+        ), '')), 'C')
+$$
+""",
+    """
+CREATE FUNCTION courses_refresh_search_vector(course_ids uuid[]) RETURNS void
+LANGUAGE sql AS $$
+    UPDATE courses c
+    SET search_vector = course_search_document(c.name, c.description, c.course_id)
+    WHERE c.course_id = ANY(course_ids)
+$$
+""",
+    """
+-- Row level: rewrites NEW in place, so no second UPDATE is issued.
+CREATE FUNCTION courses_search_vector_row() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.search_vector := course_search_document(
+        NEW.name, NEW.description, NEW.course_id
+    );
+    RETURN NEW;
+END
+$$
+""",
+    """
+-- Shared by course_sections and course_skills: both carry course_id.
+CREATE FUNCTION course_links_search_vector_stmt() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM courses_refresh_search_vector(
+            ARRAY(SELECT DISTINCT course_id FROM new_rows)
+        );
+    ELSIF TG_OP = 'DELETE' THEN
+        PERFORM courses_refresh_search_vector(
+            ARRAY(SELECT DISTINCT course_id FROM old_rows)
+        );
+    ELSE
+        PERFORM courses_refresh_search_vector(ARRAY(
+            SELECT course_id FROM new_rows
+            UNION
+            SELECT course_id FROM old_rows
+        ));
+    END IF;
+    RETURN NULL;
+END
+$$
+""",
+    """
+CREATE FUNCTION skills_search_vector_stmt() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM courses_refresh_search_vector(ARRAY(
+        SELECT DISTINCT cs.course_id
+        FROM new_rows n
+        JOIN old_rows o ON o.skill_id = n.skill_id
+        JOIN course_skills cs ON cs.skill_id = n.skill_id
+        WHERE (n.name, n.description) IS DISTINCT FROM (o.name, o.description)
+    ));
+    RETURN NULL;
+END
+$$
+""",
+]
+
+# Transition tables require one event per trigger.
+TRIGGERS = [
+    """
+CREATE TRIGGER courses_search_vector
+    BEFORE INSERT OR UPDATE OF name, description ON courses
+    FOR EACH ROW EXECUTE FUNCTION courses_search_vector_row()
+""",
+    """
+CREATE TRIGGER course_sections_search_vector_ins
+    AFTER INSERT ON course_sections REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION course_links_search_vector_stmt()
+""",
+    """
+CREATE TRIGGER course_sections_search_vector_upd
+    AFTER UPDATE ON course_sections
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION course_links_search_vector_stmt()
+""",
+    """
+CREATE TRIGGER course_sections_search_vector_del
+    AFTER DELETE ON course_sections REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION course_links_search_vector_stmt()
+""",
+    """
+CREATE TRIGGER course_skills_search_vector_ins
+    AFTER INSERT ON course_skills REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION course_links_search_vector_stmt()
+""",
+    """
+CREATE TRIGGER course_skills_search_vector_upd
+    AFTER UPDATE ON course_skills
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION course_links_search_vector_stmt()
+""",
+    """
+CREATE TRIGGER course_skills_search_vector_del
+    AFTER DELETE ON course_skills REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION course_links_search_vector_stmt()
+""",
+    """
+CREATE TRIGGER skills_search_vector
+    AFTER UPDATE ON skills
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION skills_search_vector_stmt()
+""",
+]
+
+BACKFILL = [
+    """
+UPDATE courses c
+SET search_vector = course_search_document(c.name, c.description, c.course_id)
+""",
+    """
+UPDATE course_cards cc
+SET search_vector = c.search_vector
+FROM courses c
+WHERE c.course_id = cc.course_id
+  AND cc.search_vector IS DISTINCT FROM c.search_vector
+""",
+]
+
+
+def upgrade() -> None:
+    # Trigger lookups go by course_id / skill_id on the child tables
+    op.create_index("ix_course_sections_course_id", "course_sections", ["course_id"])
+    op.create_index("ix_course_skills_skill_id", "course_skills", ["skill_id"])
+
+    # asyncpg runs one statement per call
+    for statement in (*FUNCTIONS, *TRIGGERS, *BACKFILL):
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS skills_search_vector ON skills")
+    for table in ("course_sections", "course_skills"):
+        for event in ("ins", "upd", "del"):
+            op.execute(
+                f"DROP TRIGGER IF EXISTS {table}_search_vector_{event} ON {table}"
+            )
+    op.execute("DROP TRIGGER IF EXISTS courses_search_vector ON courses")
+
+    op.execute("DROP FUNCTION IF EXISTS skills_search_vector_stmt()")
+    op.execute("DROP FUNCTION IF EXISTS course_links_search_vector_stmt()")
+    op.execute("DROP FUNCTION IF EXISTS courses_search_vector_row()")
+    op.execute("DROP FUNCTION IF EXISTS courses_refresh_search_vector(uuid[])")
+    op.execute("DROP FUNCTION IF EXISTS course_search_document(text, text, uuid)")
+
+    op.drop_index("ix_course_skills_skill_id", table_name="course_skills")
+    op.drop_index("ix_course_sections_course_id", table_name="course_sections")
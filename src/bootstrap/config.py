@@ -7,6 +7,8 @@ from common.infrastructure.config.llm_config import LLMConfig
 from common.infrastructure.config.logger_config import LoggerConfig
 from common.infrastructure.config.telegram_config import TelegramConfig
 from idp.auth.infrastructure.config.auth_config import AuthConfig
+from showcase.category.infrastructure.config.category_config import CategoryConfig
+from showcase.course.infrastructure.config.course_config import CourseConfig
 
 
 class AppConfig(Settings):
@@ -16,6 +18,8 @@ class AppConfig(Settings):
     logger: LoggerConfig
     telegram: TelegramConfig
     deploy: DeploymentMeta
+    course: CourseConfig = CourseConfig()
+    category: CategoryConfig = CategoryConfig()
 
     def masked_dict(self) -> dict[str, Any]:
         return self.model_dump(
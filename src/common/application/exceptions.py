@@ -33,3 +33,8 @@ class DuplicateEntryError(RepositoryError):
         self.field = field
         self.value = value
         super().__init__(f"Duplicate entry for field '{field}': {value} already exists")
+
+
+class InvalidCursorError(ApplicationError):
+    def __init__(self, message: str = "Invalid pagination cursor"):
+        super().__init__(message)
@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from enum import Enum
+from uuid import UUID
+
+
+class CatalogEntity(str, Enum):
+    COURSE = "course"
+    CATEGORY = "category"
+    LECTURER = "lecturer"
+    SKILL = "skill"
+    TAG = "tag"
+
+
+@dataclass(frozen=True)
+class CatalogChange:
+    """A catalog entity was created, updated or deleted."""
+
+    entity: CatalogEntity
+    entity_id: UUID
+    deleted: bool = False
+
+
+class ICatalogChangeListener(ABC):
+    """Reacts to catalog writes.
+
+    Write repositories call it after persisting a change and inside the same
+    transaction, so listeners may write derived data atomically with it.
+    Write use cases call it once the change is committed, which is when
+    in-memory caches should drop what they hold.
+    """
+
+    @abstractmethod
+    async def on_change(self, change: CatalogChange) -> None: ...
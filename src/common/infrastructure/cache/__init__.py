@@ -0,0 +1,7 @@
+"""In-process caches."""
+
+from common.infrastructure.cache.lru_cache import CacheStats, LRUCache
+from common.infrastructure.cache.single_flight import SingleFlight, SingleFlightStats
+
+
+__all__ = ["CacheStats", "LRUCache", "SingleFlight", "SingleFlightStats"]
@@ -0,0 +1,134 @@
+"""Bounded in-process LRU cache with TTL and size accounting."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    entries: int
+    size_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass
+class _Entry(Generic[V]):
+    value: V
+    size: int
+    expires_at: float
+
+
+class LRUCache(Generic[K, V]):
+    """Least-recently-used cache bounded by entry count and total size.
+
+    Entries expire ``ttl_seconds`` after they are stored. Each entry carries
+    its own size, as reported by the caller, and the least recently used
+    entries are evicted until both ``max_entries`` and ``max_bytes`` hold.
+
+    Readers that load a value outside the cache should take a ``version()``
+    token before loading and pass it to ``put``: if anything was invalidated
+    in between, the value may predate the change and is not stored.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_bytes: int,
+        ttl_seconds: float,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._timer = timer
+
+        self._entries: OrderedDict[K, _Entry[V]] = OrderedDict()
+        self._size = 0
+        self._version = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def get(self, key: K) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at <= self._timer():
+            if entry is not None:
+                self._remove(key)
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry.value
+
+    def version(self) -> int:
+        """Return a token that changes whenever an entry is invalidated."""
+        return self._version
+
+    def put(self, key: K, value: V, size: int, version: int | None = None) -> bool:
+        """Store ``value`` and return whether it was kept."""
+        if version is not None and version != self._version:
+            return False
+        if size > self.max_bytes or self.max_entries <= 0:
+            return False
+
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = _Entry(value, size, self._timer() + self.ttl_seconds)
+        self._size += size
+
+        while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self._evictions += 1
+        return True
+
+    def invalidate(self, key: K) -> None:
+        self._version += 1
+        if key in self._entries:
+            self._remove(key)
+            self._invalidations += 1
+
+    def invalidate_where(self, predicate: Callable[[V], bool]) -> None:
+        """Drop every entry whose value matches ``predicate``."""
+        self._version += 1
+        for key in [k for k, e in self._entries.items() if predicate(e.value)]:
+            self._remove(key)
+            self._invalidations += 1
+
+    def clear(self) -> None:
+        self._version += 1
+        self._invalidations += len(self._entries)
+        self._entries.clear()
+        self._size = 0
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            invalidations=self._invalidations,
+            entries=len(self._entries),
+            size_bytes=self._size,
+        )
+
+    def _remove(self, key: K) -> None:
+        entry = self._entries.pop(key)
+        self._size -= entry.size
@@ -0,0 +1,67 @@
+"""Coalescing of identical concurrent calls."""
+
+import asyncio
+from collections.abc import Callable, Coroutine, Hashable
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass(frozen=True)
+class SingleFlightStats:
+    calls: int
+    coalesced: int  # calls that joined a load already in flight
+    in_flight: int
+
+    @property
+    def coalesced_rate(self) -> float:
+        return self.coalesced / self.calls if self.calls else 0.0
+
+
+class SingleFlight(Generic[K, V]):
+    """Runs one ``load`` per key at a time and shares its outcome.
+
+    Callers arriving while a load for their key is in flight await it
+    instead of starting their own, and get its result or its exception.
+    Nothing is kept once the load finishes; put a cache behind it for that.
+
+    The load runs as a separate task that callers await through
+    ``asyncio.shield``: a cancelled caller, such as a disconnected client,
+    leaves without cancelling the load for the others. A load left with no
+    callers still runs to completion, so whatever it caches is not wasted.
+    Since the load runs in its own task, it must not depend on the caller's
+    unit of work.
+    """
+
+    def __init__(self) -> None:
+        self._flights: dict[K, asyncio.Task[V]] = {}
+        self._calls = 0
+        self._coalesced = 0
+
+    async def do(self, key: K, load: Callable[[], Coroutine[Any, Any, V]]) -> V:
+        self._calls += 1
+        task = self._flights.get(key)
+        if task is None:
+            task = asyncio.create_task(load())
+            self._flights[key] = task
+            task.add_done_callback(lambda done: self._land(key, done))
+        else:
+            self._coalesced += 1
+        return await asyncio.shield(task)
+
+    def stats(self) -> SingleFlightStats:
+        return SingleFlightStats(
+            calls=self._calls,
+            coalesced=self._coalesced,
+            in_flight=len(self._flights),
+        )
+
+    def _land(self, key: K, task: "asyncio.Task[V]") -> None:
+        if self._flights.get(key) is task:
+            del self._flights[key]
+        # Retrieved here so a load nobody awaits any more is not reported
+        if not task.cancelled():
+            task.exception()
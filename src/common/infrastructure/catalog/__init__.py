@@ -0,0 +1,14 @@
+"""Catalog change plumbing shared by bounded contexts."""
+
+from common.infrastructure.catalog.catalog_result_cache import CatalogResultCache
+from common.infrastructure.catalog.catalog_version import CatalogVersion
+from common.infrastructure.catalog.composite_listener import (
+    CompositeCatalogChangeListener,
+)
+
+
+__all__ = [
+    "CatalogResultCache",
+    "CatalogVersion",
+    "CompositeCatalogChangeListener",
+]
@@ -0,0 +1,60 @@
+"""Cache of results derived from the whole catalog."""
+
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Generic, TypeVar
+
+from common.infrastructure.cache import CacheStats, LRUCache
+from common.infrastructure.catalog.catalog_version import CatalogVersion
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class CatalogResultCache(Generic[K, V]):
+    """LRU/TTL cache emptied whenever ``CatalogVersion`` moves.
+
+    Suits results that may depend on any catalog entity, where tracking
+    the entities behind each entry is not worth it. A result loaded while
+    the version moved is returned but not stored.
+    """
+
+    def __init__(
+        self,
+        catalog_version: CatalogVersion,
+        max_entries: int,
+        max_bytes: int,
+        ttl_seconds: float,
+        sizeof: Callable[[V], int],
+    ) -> None:
+        self._catalog_version = catalog_version
+        self._seen_version = catalog_version.value
+        self._sizeof = sizeof
+        self._cache = LRUCache[K, V](
+            max_entries=max_entries, max_bytes=max_bytes, ttl_seconds=ttl_seconds
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self._cache.max_entries > 0
+
+    async def get_or_load(self, key: K, load: Callable[[], Awaitable[V]]) -> V:
+        self._sync_version()
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        version = self._catalog_version.value
+        value = await load()
+        if version == self._catalog_version.value:
+            self._cache.put(key, value, self._sizeof(value))
+        return value
+
+    def stats(self) -> CacheStats:
+        return self._cache.stats()
+
+    def _sync_version(self) -> None:
+        version = self._catalog_version.value
+        if version != self._seen_version:
+            self._seen_version = version
+            self._cache.clear()
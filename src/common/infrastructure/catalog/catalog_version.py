@@ -0,0 +1,25 @@
+"""Process-wide catalog version counter."""
+
+from common.application.interfaces.catalog.catalog_change_listener import (
+    CatalogChange,
+    ICatalogChangeListener,
+)
+
+
+class CatalogVersion(ICatalogChangeListener):
+    """Counter bumped by every committed catalog change.
+
+    Caches of results that depend on the catalog as a whole (search
+    rankings, recommendations) key their entries by ``value`` instead of
+    tracking which entities a result was derived from.
+    """
+
+    def __init__(self) -> None:
+        self._value = 0
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    async def on_change(self, change: CatalogChange) -> None:
+        self._value += 1
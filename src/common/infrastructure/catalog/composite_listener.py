@@ -0,0 +1,37 @@
+"""Fan-out of catalog changes to several listeners."""
+
+import logging
+
+from common.application.interfaces.catalog.catalog_change_listener import (
+    CatalogChange,
+    ICatalogChangeListener,
+)
+
+
+class CompositeCatalogChangeListener(ICatalogChangeListener):
+    """Forwards each change to ``listeners`` in order.
+
+    Meant for committed changes: a failing listener is logged and skipped,
+    so it neither fails the request that made the change nor keeps the
+    remaining listeners from hearing about it.
+    """
+
+    def __init__(
+        self, logger: logging.Logger, *listeners: ICatalogChangeListener
+    ) -> None:
+        self._logger = logger
+        self.listeners = listeners
+
+    async def on_change(self, change: CatalogChange) -> None:
+        for listener in self.listeners:
+            try:
+                await listener.on_change(change)
+            except Exception:
+                self._logger.exception(
+                    "Catalog change listener failed",
+                    extra={
+                        "listener": type(listener).__name__,
+                        "entity": change.entity.value,
+                        "entity_id": str(change.entity_id),
+                    },
+                )
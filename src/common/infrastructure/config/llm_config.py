@@ -3,12 +3,43 @@ from typing import Self
 from pydantic import BaseModel, model_validator
 
 
+class LLMResilienceConfig(BaseModel):
+    deadline_seconds: float = 25  # per call, including the wait for a slot
+    max_concurrency: int = 8  # calls in flight per process
+    # Send a second request when the first outlives the recent p95 latency
+    hedge: bool = False
+    hedge_percentile: float = 0.95
+    hedge_min_samples: int = 20  # latencies needed before hedging starts
+    hedge_min_delay_seconds: float = 1
+    # Consecutive failures that open the circuit, and how long it stays open
+    breaker_failures: int = 5
+    breaker_reset_seconds: float = 30
+
+
+class LLMHttpConfig(BaseModel):
+    # One keep-alive pool shared by every LLM call in the process
+    connect_timeout_seconds: float = 5
+    read_timeout_seconds: float = 60  # per chunk read, not the whole call
+    max_connections: int = 32
+    max_keepalive_connections: int = 32
+    keepalive_expiry_seconds: float = 60
+    http2: bool = True  # used when the h2 package is installed
+
+
 class LLMConfig(BaseModel):
     model: str
     provider_model: str = ""
     base_url: str
     api_key: str | None = None
 
+    # Candidate lists longer than ranking_chunk_size are ranked in chunks,
+    # at most ranking_concurrency prompts at a time
+    ranking_chunk_size: int = 25
+    ranking_concurrency: int = 4
+    ranking_tiebreak_size: int = 10  # merged head re-ranked on close calls
+    resilience: LLMResilienceConfig = LLMResilienceConfig()
+    http: LLMHttpConfig = LLMHttpConfig()
+
     @model_validator(mode="after")
     def default_provider_model(self) -> Self:
         if not self.provider_model:
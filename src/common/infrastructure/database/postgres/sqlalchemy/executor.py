@@ -1,7 +1,7 @@
 from collections.abc import Sequence
 from typing import Any, TypeVar, overload
 
-from sqlalchemy import Delete, Insert, Result, Row, Select, Update
+from sqlalchemy import CompoundSelect, Delete, Insert, Result, Row, Select, Update
 from sqlalchemy.sql.dml import ReturningInsert, ReturningUpdate
 
 from common.infrastructure.database.postgres.sqlalchemy.unit_of_work import UnitOfWork
@@ -61,7 +61,7 @@ class QueryExecutor:
 
     async def execute_many(
         self,
-        statement: Select[tuple[RESULT, ...]],
+        statement: Select[tuple[RESULT, ...]] | CompoundSelect[tuple[RESULT, ...]],
     ) -> Sequence[Row[tuple[RESULT]]]:
         return (await self.execute(statement)).unique().all()
 
@@ -74,6 +74,10 @@ class QueryExecutor:
         self, statement: Select[tuple[RESULT, ...]]
     ) -> Result[tuple[RESULT]]: ...
     @overload
+    async def execute(
+        self, statement: CompoundSelect[tuple[RESULT, ...]]
+    ) -> Result[tuple[RESULT]]: ...
+    @overload
     async def execute(  # type: ignore[overload-overlap]
         self, statement: ReturningInsert[tuple[RESULT]]
     ) -> Result[tuple[RESULT]]: ...
@@ -0,0 +1,158 @@
+"""Keyset (cursor) pagination helpers.
+
+A page is continued from the sort tuple of the last row it returned instead of
+an ``OFFSET``: the next query asks for rows strictly after that tuple in the
+``ORDER BY`` order, so its cost does not grow with the page number.
+
+Cursors are opaque to clients: URL-safe base64 of a JSON document holding the
+sort key signature and the typed values of the last row.
+"""
+
+import base64
+import binascii
+import json
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, and_, false, or_
+
+from common.application.exceptions import InvalidCursorError
+
+
+# (type, tag, encoder); bool precedes int as it is an int subclass. Floats are
+# stored via repr, which round-trips exactly, so key equality still holds.
+_CODECS: tuple[tuple[type, str, Callable[[Any], Any]], ...] = (
+    (UUID, "u", str),
+    (datetime, "t", datetime.isoformat),
+    (Decimal, "n", str),
+    (bool, "b", bool),
+    (int, "i", int),
+    (float, "f", repr),
+    (str, "s", str),
+)
+_DECODERS: dict[str, Callable[[Any], Any]] = {
+    "u": UUID,
+    "t": datetime.fromisoformat,
+    "n": Decimal,
+    "b": bool,
+    "i": int,
+    "f": float,
+    "s": str,
+}
+
+
+@dataclass(frozen=True)
+class SortKey:
+    """One ``ORDER BY`` term of a keyset-paginated query.
+
+    Nullable keys always sort their NULLs last, in both directions.
+    """
+
+    name: str
+    expression: ColumnElement[Any]
+    descending: bool = False
+    nullable: bool = False
+
+    @property
+    def signature(self) -> str:
+        return f"{self.name}:{'d' if self.descending else 'a'}"
+
+    def column(self) -> ColumnElement[Any]:
+        """Labeled expression to select alongside the row."""
+        return self.expression.label(self.name)
+
+    def order_by(self) -> ColumnElement[Any]:
+        clause = self.expression.desc() if self.descending else self.expression.asc()
+        return clause.nulls_last() if self.nullable else clause
+
+    def after(self, value: Any) -> ColumnElement[bool] | None:
+        """Rows strictly after ``value`` on this key, ``None`` if there are none."""
+        if value is None:
+            # NULLs sort last: nothing but other NULLs follows them.
+            return None
+        beyond = self.expression < value if self.descending else self.expression > value
+        return or_(beyond, self.expression.is_(None)) if self.nullable else beyond
+
+    def equals(self, value: Any) -> ColumnElement[bool]:
+        if self.nullable:
+            return self.expression.is_not_distinct_from(value)
+        condition: ColumnElement[bool] = self.expression == value
+        return condition
+
+
+def keyset_condition(
+    keys: Sequence[SortKey], values: Sequence[Any]
+) -> ColumnElement[bool]:
+    """Predicate selecting rows that sort strictly after ``values``.
+
+    Expands the row comparison ``(k1, k2, ...) > (v1, v2, ...)`` term by term so
+    that mixed directions and NULL placement are honoured.
+    """
+    terms: list[ColumnElement[bool]] = []
+    for i, key in enumerate(keys):
+        after = key.after(values[i])
+        if after is not None:
+            prefix = [keys[j].equals(values[j]) for j in range(i)]
+            terms.append(and_(*prefix, after))
+    return or_(*terms) if terms else false()
+
+
+def encode_cursor(keys: Sequence[SortKey], values: Sequence[Any]) -> str:
+    payload = {
+        "k": [key.signature for key in keys],
+        "v": [_encode_value(value) for value in values],
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(keys: Sequence[SortKey], cursor: str) -> list[Any]:
+    """Decode ``cursor`` issued for the same sort ``keys``.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or was issued for a
+            different ordering.
+
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if payload["k"] != [key.signature for key in keys]:
+            raise InvalidCursorError("Cursor does not match the requested ordering")
+        values = [_decode_value(value) for value in payload["v"]]
+    except InvalidCursorError:
+        raise
+    except (
+        binascii.Error,
+        UnicodeDecodeError,
+        json.JSONDecodeError,
+        InvalidOperation,
+        KeyError,
+        TypeError,
+        ValueError,
+    ) as e:
+        raise InvalidCursorError() from e
+
+    if len(values) != len(keys):
+        raise InvalidCursorError()
+    return values
+
+
+def _encode_value(value: Any) -> list[Any] | None:
+    if value is None:
+        return None
+    for type_, tag, encode in _CODECS:
+        if isinstance(value, type_):
+            return [tag, encode(value)]
+    raise TypeError(f"Unsupported cursor value type: {type(value).__name__}")
+
+
+def _decode_value(value: list[Any] | None) -> Any:
+    if value is None:
+        return None
+    tag, data = value
+    return _DECODERS[tag](data)
@@ -0,0 +1,6 @@
+"""In-process metrics."""
+
+from common.infrastructure.metrics.histogram import Histogram, HistogramSnapshot
+
+
+__all__ = ["Histogram", "HistogramSnapshot"]
@@ -0,0 +1,60 @@
+"""Bucketed histogram with Prometheus semantics."""
+
+import bisect
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class HistogramSnapshot:
+    buckets: tuple[float, ...]  # upper bounds, ascending; +Inf is implied
+    counts: tuple[int, ...]  # cumulative, one per bucket plus +Inf
+    sum: float
+    count: int
+
+    def quantile(self, q: float) -> float | None:
+        """Estimate the ``q`` quantile by interpolating inside its bucket.
+
+        Values in the +Inf bucket are reported as the largest bound.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        index = bisect.bisect_left(self.counts, rank)
+        if index >= len(self.buckets):
+            return self.buckets[-1] if self.buckets else None
+
+        lower = self.buckets[index - 1] if index else 0.0
+        below = self.counts[index - 1] if index else 0
+        inside = self.counts[index] - below
+        if not inside:
+            return self.buckets[index]
+        return lower + (self.buckets[index] - lower) * (rank - below) / inside
+
+
+class Histogram:
+    """Counts observations into fixed buckets; cheap enough for every call."""
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self._buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self._buckets) + 1)
+        self._sum = 0.0
+        self._count = 0
+
+    def observe(self, value: float) -> None:
+        self._counts[bisect.bisect_left(self._buckets, value)] += 1
+        self._sum += value
+        self._count += 1
+
+    def snapshot(self) -> HistogramSnapshot:
+        cumulative: list[int] = []
+        total = 0
+        for count in self._counts:
+            total += count
+            cumulative.append(total)
+        return HistogramSnapshot(
+            buckets=self._buckets,
+            counts=tuple(cumulative),
+            sum=self._sum,
+            count=self._count,
+        )
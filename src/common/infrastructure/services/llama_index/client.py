@@ -1,5 +1,10 @@
+import importlib.util
+import logging
+from collections.abc import Callable, Mapping
 from typing import Any, ClassVar
 
+import httpx
+from common.infrastructure.config.llm_config import LLMConfig, LLMHttpConfig
 from llama_index.llms.openai import OpenAI
 
 
@@ -9,6 +14,8 @@ class MappedOpenAI(OpenAI):
     Some OpenAI-compatible providers add prefixes to model identifiers, which
     doesn't work correctly with LlamaIndex. This class maps model names to their
     correct identifiers.
+
+    With an ``async_http_client``, its timeouts apply instead of ``timeout``.
     """
 
     MODEL_MAP: ClassVar = {
@@ -17,6 +24,19 @@ class MappedOpenAI(OpenAI):
         "gpt-5": "openai/gpt-5",
     }
 
+    @classmethod
+    def from_config(
+        cls, config: LLMConfig, http_client: httpx.AsyncClient | None = None
+    ) -> "MappedOpenAI":
+        cls.override(config.model, config.provider_model)
+        return cls(
+            model=config.model,
+            api_key=config.api_key,
+            api_base=config.base_url,
+            temperature=0.3,
+            async_http_client=http_client,
+        )
+
     def _get_model_kwargs(self, **kwargs: Any) -> dict[str, Any]:
         result = super()._get_model_kwargs(**kwargs)
 
@@ -26,6 +46,43 @@ class MappedOpenAI(OpenAI):
 
         return result
 
+    def _get_credential_kwargs(self, is_async: bool = False) -> dict[str, Any]:
+        result = super()._get_credential_kwargs(is_async)
+
+        http_client = result.get("http_client")
+        if http_client is not None:
+            result["timeout"] = http_client.timeout
+
+        return result
+
     @classmethod
     def override(cls, key: str, value: str) -> None:
         cls.MODEL_MAP[key] = value
+
+
+def create_http_client(
+    config: LLMHttpConfig,
+    logger: logging.Logger,
+    event_hooks: Mapping[str, list[Callable[..., Any]]] | None = None,
+) -> httpx.AsyncClient:
+    """Create the pooled HTTP client shared by all LLM calls.
+
+    Pass ``LLMMetrics.event_hooks()`` to record per-call HTTP metrics.
+    Close it with ``aclose`` on shutdown.
+    """
+    http2 = config.http2 and importlib.util.find_spec("h2") is not None
+    if config.http2 and not http2:
+        logger.info("h2 package not installed, LLM client uses HTTP/1.1")
+
+    return httpx.AsyncClient(
+        http2=http2,
+        event_hooks=event_hooks,
+        timeout=httpx.Timeout(
+            config.read_timeout_seconds, connect=config.connect_timeout_seconds
+        ),
+        limits=httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry_seconds,
+        ),
+    )
@@ -0,0 +1,245 @@
+"""LLM call resilience: deadlines, hedging, concurrency limit, circuit breaker."""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from enum import StrEnum
+from typing import TypeVar
+
+from common.infrastructure.config.llm_config import LLMResilienceConfig
+
+
+T = TypeVar("T")
+
+
+class LLMUnavailableError(Exception):
+    """The call got no usable answer.
+
+    The circuit is open, the deadline passed, or the call failed: a provider
+    error such as HTTP 5xx, 429 or a dropped connection, or an answer that
+    did not parse. The original error, if any, is the ``__cause__``.
+    """
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class LLMGuardStats:
+    state: CircuitState
+    in_flight: int  # requests holding a concurrency slot
+    waiting: int  # requests queued for a slot
+    calls: int
+    failures: int  # provider and parse errors, deadlines included
+    timeouts: int
+    rejected: int  # answered by the open circuit without a request
+    hedges: int  # second requests sent
+    hedge_wins: int  # second requests that answered first
+    hedge_delay_ms: float | None  # None while hedging is off or warming up
+
+
+class LLMGuard:
+    """Runs LLM calls under a deadline, a concurrency limit and a breaker.
+
+    ``run`` takes a factory rather than an awaitable so the call can be
+    hedged: when hedging is on and the first request outlives the recent
+    ``hedge_percentile`` latency, a second one is sent if a slot is free and
+    whichever answers first wins.
+
+    Any error of the call, parsing of the answer included when the factory
+    does it, counts as a failure and is raised as ``LLMUnavailableError``.
+    After ``breaker_failures`` consecutive failures the circuit opens and
+    calls fail fast with ``LLMUnavailableError`` for ``breaker_reset_seconds``;
+    then a single probe call decides whether it closes again. Callers turn
+    ``LLMUnavailableError`` into their non-LLM path.
+
+    Results computed from such a path should not be cached: take a
+    ``mark()`` before the work and check ``degraded_since`` afterwards.
+    """
+
+    LATENCY_WINDOW: int = 200
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        config: LLMResilienceConfig,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._logger = logger
+        self._config = config
+        self._timer = timer
+        self._semaphore = asyncio.Semaphore(max(config.max_concurrency, 1))
+        self._latencies: deque[float] = deque(maxlen=self.LATENCY_WINDOW)
+
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._consecutive_failures = 0
+        self._probing = False
+
+        self._in_flight = 0
+        self._waiting = 0
+        self._calls = 0
+        self._failures = 0
+        self._timeouts = 0
+        self._rejected = 0
+        self._hedges = 0
+        self._hedge_wins = 0
+
+    async def run(self, call: Callable[[], Awaitable[T]]) -> T:
+        probe = self._admit()
+        self._calls += 1
+        try:
+            async with asyncio.timeout(self._config.deadline_seconds):
+                result = await self._hedged(call)
+        except TimeoutError as e:
+            self._timeouts += 1
+            self._record_failure(probe)
+            raise LLMUnavailableError("LLM call exceeded its deadline") from e
+        except asyncio.CancelledError:
+            if probe:
+                self._probing = False
+            raise
+        except Exception as e:
+            self._record_failure(probe)
+            raise LLMUnavailableError(f"LLM call failed: {type(e).__name__}") from e
+
+        self._record_success()
+        return result
+
+    def mark(self) -> int:
+        """Token for ``degraded_since``."""
+        return self._failures + self._rejected
+
+    def degraded_since(self, mark: int) -> bool:
+        """Whether any call fell back to a non-LLM path after ``mark``.
+
+        Covers every caller in the process, so a concurrent outage also
+        counts; that only skips a few cache writes.
+        """
+        return self.mark() != mark
+
+    def stats(self) -> LLMGuardStats:
+        delay = self._hedge_delay()
+        return LLMGuardStats(
+            state=self._state,
+            in_flight=self._in_flight,
+            waiting=self._waiting,
+            calls=self._calls,
+            failures=self._failures,
+            timeouts=self._timeouts,
+            rejected=self._rejected,
+            hedges=self._hedges,
+            hedge_wins=self._hedge_wins,
+            hedge_delay_ms=round(delay * 1000, 1) if delay is not None else None,
+        )
+
+    def _admit(self) -> bool:
+        """Let a call through or reject it; returns whether it is the probe."""
+        if (
+            self._state == CircuitState.OPEN
+            and self._timer() - self._opened_at >= self._config.breaker_reset_seconds
+        ):
+            self._transition(CircuitState.HALF_OPEN)
+
+        if self._state == CircuitState.CLOSED:
+            return False
+        if self._state == CircuitState.HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+
+        self._rejected += 1
+        raise LLMUnavailableError(f"LLM circuit is {self._state}")
+
+    def _record_success(self) -> None:
+        self._consecutive_failures = 0
+        self._probing = False
+        if self._state != CircuitState.CLOSED:
+            self._transition(CircuitState.CLOSED)
+
+    def _record_failure(self, probe: bool) -> None:
+        self._failures += 1
+        self._consecutive_failures += 1
+        if probe:
+            self._probing = False
+        if probe or (
+            self._state == CircuitState.CLOSED
+            and self._consecutive_failures >= self._config.breaker_failures
+        ):
+            self._opened_at = self._timer()
+            self._transition(CircuitState.OPEN)
+
+    def _transition(self, state: CircuitState) -> None:
+        self._state = state
+        log = self._logger.warning if state == CircuitState.OPEN else self._logger.info
+        log(
+            "LLM circuit state changed",
+            extra={
+                "service": "LLMGuard",
+                "consecutive_failures": self._consecutive_failures,
+                **asdict(self.stats()),
+            },
+        )
+
+    async def _hedged(self, call: Callable[[], Awaitable[T]]) -> T:
+        delay = self._hedge_delay()
+        if delay is None:
+            return await self._attempt(call)
+
+        primary = asyncio.create_task(self._attempt(call))
+        pending: set[asyncio.Task[T]] = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if not done and not self._semaphore.locked():
+                self._hedges += 1
+                pending.add(asyncio.create_task(self._attempt(call)))
+
+            errors: list[BaseException] = []
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    error = task.exception()
+                    if error is not None:
+                        errors.append(error)
+                        continue
+                    if task is not primary:
+                        self._hedge_wins += 1
+                    return task.result()
+            raise errors[0]
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _attempt(self, call: Callable[[], Awaitable[T]]) -> T:
+        self._waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+
+        self._in_flight += 1
+        started = time.perf_counter()
+        try:
+            result = await call()
+        finally:
+            self._in_flight -= 1
+            self._semaphore.release()
+        self._latencies.append(time.perf_counter() - started)
+        return result
+
+    def _hedge_delay(self) -> float | None:
+        if (
+            not self._config.hedge
+            or len(self._latencies) < self._config.hedge_min_samples
+        ):
+            return None
+        ordered = sorted(self._latencies)
+        index = round(self._config.hedge_percentile * (len(ordered) - 1))
+        return max(ordered[index], self._config.hedge_min_delay_seconds)
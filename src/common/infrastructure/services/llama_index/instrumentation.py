@@ -0,0 +1,217 @@
+"""LLM call instrumentation: latency, tokens, retries and parse failures."""
+
+import json
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+from common.infrastructure.metrics import Histogram, HistogramSnapshot
+
+
+@dataclass
+class LLMCallRecord:
+    """What one LLM call cost, filled in as the call goes."""
+
+    stage: str
+    model: str | None = None
+    wall_ms: float = 0.0  # including the wait for a concurrency slot
+    ttfb_ms: float | None = None  # request sent to response headers, last attempt
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    attempts: int = 0  # HTTP requests sent; retries and hedges add to it
+    parse_failed: bool = False
+    error: str | None = None  # exception type, when the call raised
+
+
+@dataclass
+class _Series:
+    calls: int = 0
+    errors: int = 0
+    parse_failures: int = 0
+    retries: int = 0
+    wall_ms: Histogram = field(
+        default_factory=lambda: Histogram(LLMMetrics.LATENCY_BUCKETS_MS)
+    )
+    ttfb_ms: Histogram = field(
+        default_factory=lambda: Histogram(LLMMetrics.LATENCY_BUCKETS_MS)
+    )
+    prompt_tokens: Histogram = field(
+        default_factory=lambda: Histogram(LLMMetrics.TOKEN_BUCKETS)
+    )
+    completion_tokens: Histogram = field(
+        default_factory=lambda: Histogram(LLMMetrics.TOKEN_BUCKETS)
+    )
+
+
+@dataclass(frozen=True)
+class LLMStageStats:
+    stage: str
+    model: str
+    calls: int
+    errors: int
+    parse_failures: int
+    retries: int
+    wall_ms: HistogramSnapshot
+    ttfb_ms: HistogramSnapshot
+    prompt_tokens: HistogramSnapshot
+    completion_tokens: HistogramSnapshot
+
+
+_current_call: ContextVar[LLMCallRecord | None] = ContextVar(
+    "llm_current_call", default=None
+)
+_collected_calls: ContextVar[list[LLMCallRecord] | None] = ContextVar(
+    "llm_collected_calls", default=None
+)
+
+
+class LLMMetrics:
+    """Histograms and counters of LLM calls, per stage and model.
+
+    Services wrap each call in ``call(stage)``, which times it and counts
+    errors; an exception that is a ``ValueError`` (pydantic validation
+    included) counts as a structured-output parse failure. Time to first
+    byte, token usage, the model and retries come from the HTTP exchange,
+    through ``event_hooks`` installed on the LLM HTTP client; without them
+    only wall time, errors and parse failures are recorded.
+
+    ``collect`` gathers the records of every call made inside it, for a
+    per-request breakdown. ``prometheus`` renders everything in the
+    Prometheus text format.
+    """
+
+    LATENCY_BUCKETS_MS: tuple[float, ...] = (
+        50, 100, 250, 500, 1000, 2500, 5000, 10000, 25000, 60000,
+    )  # fmt: skip
+    TOKEN_BUCKETS: tuple[float, ...] = (
+        64, 128, 256, 512, 1024, 2048, 4096, 8192, 16384,
+    )  # fmt: skip
+
+    def __init__(self, timer: Callable[[], float] = time.perf_counter) -> None:
+        self._timer = timer
+        self._series: dict[tuple[str, str], _Series] = {}
+
+    @contextmanager
+    def call(self, stage: str) -> Iterator[LLMCallRecord]:
+        record = LLMCallRecord(stage=stage)
+        collected = _collected_calls.get()
+        if collected is not None:
+            collected.append(record)
+
+        token = _current_call.set(record)
+        started = self._timer()
+        try:
+            yield record
+        except BaseException as e:
+            record.error = type(e).__name__
+            record.parse_failed = record.parse_failed or isinstance(
+                e.__cause__ or e, ValueError
+            )
+            raise
+        finally:
+            _current_call.reset(token)
+            record.wall_ms = round((self._timer() - started) * 1000, 1)
+            self._observe(record)
+
+    @contextmanager
+    def collect(self) -> Iterator[list[LLMCallRecord]]:
+        """Gather records of calls made in this context, tasks included."""
+        calls: list[LLMCallRecord] = []
+        token = _collected_calls.set(calls)
+        try:
+            yield calls
+        finally:
+            _collected_calls.reset(token)
+
+    def event_hooks(self) -> dict[str, list[Callable[..., Any]]]:
+        """``httpx`` event hooks feeding the record of the current call."""
+        return {"request": [self._on_request], "response": [self._on_response]}
+
+    def stats(self) -> list[LLMStageStats]:
+        return [
+            LLMStageStats(
+                stage=stage,
+                model=model,
+                calls=series.calls,
+                errors=series.errors,
+                parse_failures=series.parse_failures,
+                retries=series.retries,
+                wall_ms=series.wall_ms.snapshot(),
+                ttfb_ms=series.ttfb_ms.snapshot(),
+                prompt_tokens=series.prompt_tokens.snapshot(),
+                completion_tokens=series.completion_tokens.snapshot(),
+            )
+            for (stage, model), series in sorted(self._series.items())
+        ]
+
+    def prometheus(self) -> str:
+        lines: list[str] = []
+        for stats in self.stats():
+            labels = f'stage="{stats.stage}",model="{stats.model}"'
+            for name, value in (
+                ("calls", stats.calls),
+                ("errors", stats.errors),
+                ("parse_failures", stats.parse_failures),
+                ("retries", stats.retries),
+            ):
+                lines.append(f"llm_{name}_total{{{labels}}} {value}")
+            for name, snapshot in (
+                ("wall_ms", stats.wall_ms),
+                ("ttfb_ms", stats.ttfb_ms),
+                ("prompt_tokens", stats.prompt_tokens),
+                ("completion_tokens", stats.completion_tokens),
+            ):
+                bounds = [*map(str, snapshot.buckets), "+Inf"]
+                for bound, count in zip(bounds, snapshot.counts, strict=True):
+                    lines.append(f'llm_{name}_bucket{{{labels},le="{bound}"}} {count}')
+                lines.append(f"llm_{name}_sum{{{labels}}} {snapshot.sum}")
+                lines.append(f"llm_{name}_count{{{labels}}} {snapshot.count}")
+        return "".join(f"{line}\n" for line in lines)
+
+    def _observe(self, record: LLMCallRecord) -> None:
+        series = self._series.setdefault(
+            (record.stage, record.model or "unknown"), _Series()
+        )
+        series.calls += 1
+        series.errors += record.error is not None
+        series.parse_failures += record.parse_failed
+        series.retries += max(record.attempts - 1, 0)
+        series.wall_ms.observe(record.wall_ms)
+        if record.ttfb_ms is not None:
+            series.ttfb_ms.observe(record.ttfb_ms)
+        if record.attempts and record.error is None:
+            series.prompt_tokens.observe(record.prompt_tokens)
+            series.completion_tokens.observe(record.completion_tokens)
+
+    async def _on_request(self, request: httpx.Request) -> None:
+        record = _current_call.get()
+        if record is not None:
+            record.attempts += 1
+            request.extensions["llm_sent_at"] = self._timer()
+
+    async def _on_response(self, response: httpx.Response) -> None:
+        record = _current_call.get()
+        sent_at = response.request.extensions.get("llm_sent_at")
+        if record is None or sent_at is None:
+            return
+
+        # Hooks run once headers arrive, before the body is read
+        record.ttfb_ms = round((self._timer() - sent_at) * 1000, 1)
+        if not response.is_success or "json" not in response.headers.get(
+            "content-type", ""
+        ):
+            return
+
+        await response.aread()
+        try:
+            body = json.loads(response.content)
+        except ValueError:
+            return
+        usage = body.get("usage") or {}
+        record.model = body.get("model") or record.model
+        record.prompt_tokens += usage.get("prompt_tokens") or 0
+        record.completion_tokens += usage.get("completion_tokens") or 0
@@ -0,0 +1,8 @@
+"""Token count estimates for LLM prompts."""
+
+import math
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough BPE token count: about four UTF-8 bytes per token."""
+    return math.ceil(len(text.encode()) / 4)
@@ -71,6 +71,16 @@ async def get_descriptor(
     return user
 
 
+async def get_optional_descriptor(
+    request: Request,
+    token: Annotated[str | None, Depends(oauth2_scheme_no_error)],
+    token_introspector: Annotated[ITokenIntrospector, Depends()],
+) -> IdentityDescriptor | None:
+    if token is None:
+        return None
+    return await get_descriptor(request, token, token_introspector)
+
+
 def is_admin(
     user: Annotated[IdentityDescriptor, Depends(get_descriptor)],
 ) -> bool:
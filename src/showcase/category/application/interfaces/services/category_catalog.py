@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+
+from showcase.category.application.read_models.category_snapshot import (
+    CategorySnapshot,
+)
+
+
+class ICategoryCatalog(ABC):
+    """Shared, periodically refreshed snapshot of all categories."""
+
+    @abstractmethod
+    async def snapshot(self) -> CategorySnapshot:
+        """Return the current snapshot, loading it if missing or expired."""
+        ...
+
+    @abstractmethod
+    def invalidate(self) -> None:
+        """Drop the snapshot so the next call reloads it."""
+        ...
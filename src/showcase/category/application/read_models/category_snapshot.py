@@ -0,0 +1,35 @@
+"""Category catalog snapshot."""
+
+import hashlib
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from uuid import UUID
+
+from showcase.category.application.read_models.category_read_model import (
+    CategoryReadModel,
+)
+
+
+@dataclass(frozen=True)
+class CategorySnapshot:
+    """Immutable view of every category, with lookups precomputed."""
+
+    categories: tuple[CategoryReadModel, ...]  # ordered by name
+    by_id: Mapping[UUID, CategoryReadModel]
+    names: frozenset[str]
+    names_text: str  # sorted names, one per line
+    names_digest: str  # SHA-256 of names_text, stable across processes
+
+    @classmethod
+    def of(cls, categories: Iterable[CategoryReadModel]) -> "CategorySnapshot":
+        ordered = tuple(sorted(categories, key=lambda c: (c.name, c.category_id)))
+        names = frozenset(c.name for c in ordered)
+        names_text = "\n".join(sorted(names))
+        return cls(
+            categories=ordered,
+            by_id=MappingProxyType({c.category_id: c for c in ordered}),
+            names=names,
+            names_text=names_text,
+            names_digest=hashlib.sha256(names_text.encode()).hexdigest(),
+        )
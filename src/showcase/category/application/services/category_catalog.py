@@ -0,0 +1,82 @@
+"""Category catalog: cached snapshot of all categories."""
+
+import asyncio
+from datetime import timedelta
+
+from common.domain.interfaces.clock import IClock
+from common.domain.value_objects.datetime import DateTime
+from showcase.category.application.interfaces.repositories.category_read_repository import (
+    ICategoryReadRepository,
+)
+from showcase.category.application.interfaces.services.category_catalog import (
+    ICategoryCatalog,
+)
+from showcase.category.application.read_models.category_read_model import (
+    CategoryReadModel,
+)
+from showcase.category.application.read_models.category_snapshot import (
+    CategorySnapshot,
+)
+
+
+class CategoryCatalog(ICategoryCatalog):
+    """Keeps one snapshot of all categories for ``ttl_seconds``.
+
+    Concurrent callers share a single load. Category write use cases call
+    ``invalidate`` after committing; a load that overlaps an invalidation is
+    served to its callers but not kept.
+    """
+
+    PAGE_SIZE = 500
+
+    def __init__(
+        self,
+        category_repository: ICategoryReadRepository,
+        clock: IClock,
+        ttl_seconds: float,
+    ) -> None:
+        self._category_repository = category_repository
+        self._clock = clock
+        self._ttl = timedelta(seconds=ttl_seconds)
+
+        self._snapshot: CategorySnapshot | None = None
+        self._expires_at: DateTime | None = None
+        self._version = 0
+        self._lock = asyncio.Lock()
+
+    async def snapshot(self) -> CategorySnapshot:
+        snapshot = self._current()
+        if snapshot is not None:
+            return snapshot
+
+        async with self._lock:
+            snapshot = self._current()
+            if snapshot is not None:
+                return snapshot
+
+            version = self._version
+            snapshot = CategorySnapshot.of(await self._load_all())
+            if version == self._version:
+                self._snapshot = snapshot
+                self._expires_at = self._clock.now() + self._ttl
+            return snapshot
+
+    def invalidate(self) -> None:
+        self._version += 1
+        self._snapshot = None
+        self._expires_at = None
+
+    def _current(self) -> CategorySnapshot | None:
+        if self._expires_at is None or self._expires_at <= self._clock.now():
+            return None
+        return self._snapshot
+
+    async def _load_all(self) -> list[CategoryReadModel]:
+        categories: list[CategoryReadModel] = []
+        while True:
+            page = await self._category_repository.get_all(
+                skip=len(categories), limit=self.PAGE_SIZE
+            )
+            categories.extend(page)
+            if len(page) < self.PAGE_SIZE:
+                return categories
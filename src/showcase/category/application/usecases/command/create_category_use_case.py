@@ -1,5 +1,10 @@
 from uuid import UUID
 
+from common.application.interfaces.catalog.catalog_change_listener import (
+    CatalogChange,
+    CatalogEntity,
+    ICatalogChangeListener,
+)
 from common.domain.interfaces.uuid_generator import IUUIDGenerator
 from showcase.category.application.dtos.commands.create_category_command import (
     CreateCategoryCommand,
@@ -7,6 +12,9 @@ from showcase.category.application.dtos.commands.create_category_command import
 from showcase.category.application.interfaces.repositories.category_repository import (
     ICategoryRepository,
 )
+from showcase.category.application.interfaces.services.category_catalog import (
+    ICategoryCatalog,
+)
 from showcase.category.application.interfaces.usecases.command.create_category_use_case import (
     ICreateCategoryUseCase,
 )
@@ -15,10 +23,16 @@ from showcase.category.domain.entities.category import Category
 
 class CreateCategoryUseCase(ICreateCategoryUseCase):
     def __init__(
-        self, uuid_generator: IUUIDGenerator, category_repository: ICategoryRepository
+        self,
+        uuid_generator: IUUIDGenerator,
+        category_repository: ICategoryRepository,
+        category_catalog: ICategoryCatalog,
+        catalog_cache: ICatalogChangeListener,
     ) -> None:
         self.uuid_generator = uuid_generator
         self.category_repository = category_repository
+        self.category_catalog = category_catalog
+        self.catalog_cache = catalog_cache
 
     async def execute(self, command: CreateCategoryCommand) -> UUID:
         category = Category(
@@ -27,4 +41,9 @@ class CreateCategoryUseCase(ICreateCategoryUseCase):
             description=command.description,
         )
         await self.category_repository.add(category)
+        self.category_catalog.invalidate()
+        # Results inferred or fallen back to without the category are stale
+        await self.catalog_cache.on_change(
+            CatalogChange(CatalogEntity.CATEGORY, category.category_id)
+        )
         return category.category_id
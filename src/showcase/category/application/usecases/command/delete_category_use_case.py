@@ -1,17 +1,36 @@
 from uuid import UUID
 
+from common.application.interfaces.catalog.catalog_change_listener import (
+    CatalogChange,
+    CatalogEntity,
+    ICatalogChangeListener,
+)
 from showcase.category.application.interfaces.repositories.category_repository import (
     ICategoryRepository,
 )
+from showcase.category.application.interfaces.services.category_catalog import (
+    ICategoryCatalog,
+)
 from showcase.category.application.interfaces.usecases.command.delete_category_use_case import (
     IDeleteCategoryUseCase,
 )
 
 
 class DeleteCategoryUseCase(IDeleteCategoryUseCase):
-    def __init__(self, category_repository: ICategoryRepository) -> None:
+    def __init__(
+        self,
+        category_repository: ICategoryRepository,
+        category_catalog: ICategoryCatalog,
+        catalog_cache: ICatalogChangeListener,
+    ) -> None:
         self.category_repository = category_repository
+        self.category_catalog = category_catalog
+        self.catalog_cache = catalog_cache
 
     async def execute(self, category_id: UUID) -> UUID:
         await self.category_repository.delete(category_id)
+        self.category_catalog.invalidate()
+        await self.catalog_cache.on_change(
+            CatalogChange(CatalogEntity.CATEGORY, category_id, deleted=True)
+        )
         return category_id
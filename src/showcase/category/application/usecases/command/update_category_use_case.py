@@ -1,19 +1,34 @@
 from uuid import UUID
 
+from common.application.interfaces.catalog.catalog_change_listener import (
+    CatalogChange,
+    CatalogEntity,
+    ICatalogChangeListener,
+)
 from showcase.category.application.dtos.commands.update_category_command import (
     UpdateCategoryCommand,
 )
 from showcase.category.application.interfaces.repositories.category_repository import (
     ICategoryRepository,
 )
+from showcase.category.application.interfaces.services.category_catalog import (
+    ICategoryCatalog,
+)
 from showcase.category.application.interfaces.usecases.command.update_category_use_case import (
     IUpdateCategoryUseCase,
 )
 
 
 class UpdateCategoryUseCase(IUpdateCategoryUseCase):
-    def __init__(self, category_repository: ICategoryRepository) -> None:
+    def __init__(
+        self,
+        category_repository: ICategoryRepository,
+        category_catalog: ICategoryCatalog,
+        catalog_cache: ICatalogChangeListener,
+    ) -> None:
         self.category_repository = category_repository
+        self.category_catalog = category_catalog
+        self.catalog_cache = catalog_cache
 
     async def execute(self, command: UpdateCategoryCommand) -> UUID:
         category = await self.category_repository.get_by_id(command.category_id)
@@ -22,4 +37,8 @@ class UpdateCategoryUseCase(IUpdateCategoryUseCase):
         category.description = command.description
 
         await self.category_repository.update(category)
+        self.category_catalog.invalidate()
+        await self.catalog_cache.on_change(
+            CatalogChange(CatalogEntity.CATEGORY, command.category_id)
+        )
         return command.category_id
@@ -0,0 +1,5 @@
+from pydantic import BaseModel
+
+
+class CategoryConfig(BaseModel):
+    catalog_ttl_seconds: float = 600
@@ -36,7 +36,12 @@ class CategoryReadRepository(ICategoryReadRepository):
 
     async def get_all(self, skip: int = 0, limit: int = 100) -> list[CategoryReadModel]:
         """Get all categories with optional filters."""
-        stmt = select(CategoryBase).offset(skip).limit(limit)
+        stmt = (
+            select(CategoryBase)
+            .order_by(CategoryBase.name, CategoryBase.category_id)
+            .offset(skip)
+            .limit(limit)
+        )
 
         models = await self.executor.execute_scalar_many(stmt)
         return [CategoryReadMapper.to_read_model(model) for model in models]
@@ -2,6 +2,11 @@
 
 from uuid import UUID
 
+from common.application.interfaces.catalog.catalog_change_listener import (
+    CatalogChange,
+    CatalogEntity,
+    ICatalogChangeListener,
+)
 from common.infrastructure.database.postgres.sqlalchemy.executor import QueryExecutor
 from showcase.category.application.interfaces.repositories.category_repository import (
     ICategoryRepository,
@@ -16,8 +21,11 @@ from sqlalchemy import delete, select
 class CategoryRepository(ICategoryRepository):
     """Write repository for categories."""
 
-    def __init__(self, executor: QueryExecutor) -> None:
+    def __init__(
+        self, executor: QueryExecutor, catalog_listener: ICatalogChangeListener
+    ) -> None:
         self.executor = executor
+        self.catalog_listener = catalog_listener
 
     async def get_by_id(self, category_id: UUID) -> Category:
         """Get a category by ID."""
@@ -30,17 +38,28 @@ class CategoryRepository(ICategoryRepository):
     async def add(self, category: Category) -> None:
         """Add a new category."""
         model = self._to_persistence(category)
-        await self.executor.add(model)
+        async with self.executor.uow:
+            await self.executor.add(model)
+            await self._notify(category.category_id)
 
     async def update(self, category: Category) -> None:
         """Update an existing category."""
         model = self._to_persistence(category)
-        await self.executor.save(model)
+        async with self.executor.uow:
+            await self.executor.save(model)
+            await self._notify(category.category_id)
 
     async def delete(self, category_id: UUID) -> None:
         """Delete a category by ID."""
-        await self.executor.execute(
-            delete(CategoryBase).where(CategoryBase.category_id == category_id)
+        async with self.executor.uow:
+            await self.executor.execute(
+                delete(CategoryBase).where(CategoryBase.category_id == category_id)
+            )
+            await self._notify(category_id, deleted=True)
+
+    async def _notify(self, category_id: UUID, deleted: bool = False) -> None:
+        await self.catalog_listener.on_change(
+            CatalogChange(CatalogEntity.CATEGORY, category_id, deleted=deleted)
         )
 
     @staticmethod
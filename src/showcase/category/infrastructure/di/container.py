@@ -3,6 +3,7 @@
 from typing import Any
 
 from dependency_injector import containers, providers
+from showcase.category.application.services.category_catalog import CategoryCatalog
 from showcase.category.application.usecases import (
     CreateCategoryUseCase,
     DeleteCategoryUseCase,
@@ -23,19 +24,32 @@ class CategoryContainer(containers.DeclarativeContainer):
     uuid_generator: providers.Dependency[Any] = providers.Dependency()
     query_executor: providers.Dependency[Any] = providers.Dependency()
     clock: providers.Dependency[Any] = providers.Dependency()
+    catalog_listener: providers.Dependency[Any] = providers.Dependency()
+    catalog_cache: providers.Dependency[Any] = providers.Dependency()
+    category_config: providers.Dependency[Any] = providers.Dependency()
 
     # Read repository
     category_read_repository = providers.Factory(CategoryReadRepository, query_executor)
 
+    # Shared snapshot of all categories
+    category_catalog = providers.Singleton(
+        CategoryCatalog,
+        category_read_repository,
+        clock,
+        category_config.provided.catalog_ttl_seconds,
+    )
+
     # Write repository
-    category_repository = providers.Factory(CategoryRepository, query_executor)
+    category_repository = providers.Factory(
+        CategoryRepository, query_executor, catalog_listener
+    )
 
     # Read use cases
     get_categories_usecase = providers.Factory(
         GetCategoriesUseCase, category_read_repository
     )
     delete_category_usecase = providers.Factory(
-        DeleteCategoryUseCase, category_repository
+        DeleteCategoryUseCase, category_repository, category_catalog, catalog_cache
     )
     get_category_by_id_usecase = providers.Factory(
         GetCategoryByIdUseCase, category_read_repository
@@ -46,7 +60,9 @@ class CategoryContainer(containers.DeclarativeContainer):
         CreateCategoryUseCase,
         category_repository=category_repository,
         uuid_generator=uuid_generator,
+        category_catalog=category_catalog,
+        catalog_cache=catalog_cache,
     )
     update_category_usecase = providers.Factory(
-        UpdateCategoryUseCase, category_repository
+        UpdateCategoryUseCase, category_repository, category_catalog, catalog_cache
     )
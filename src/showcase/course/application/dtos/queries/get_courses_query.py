@@ -3,6 +3,7 @@
 from dataclasses import dataclass
 from uuid import UUID
 
+from showcase.course.application.read_models.course_read_model import CourseView
 from showcase.course.domain.value_objects import CourseStatus, Format
 
 
@@ -16,3 +17,5 @@ class GetCoursesQuery:
     format: Format | None = None
     skip: int = 0
     limit: int = 100
+    after: str | None = None
+    view: CourseView = CourseView.SUMMARY
@@ -2,12 +2,16 @@
 
 from dataclasses import dataclass
 
+from showcase.course.application.read_models.course_read_model import CourseView
+
 
 @dataclass
 class GetCoursesSearchQuery:
     query: str
     skip: int = 0
     limit: int = 50
+    after: str | None = None
+    view: CourseView = CourseView.SUMMARY
     # optional filters kept for parity
     is_published: bool | None = None
     status: str | None = None
@@ -0,0 +1,16 @@
+from uuid import UUID
+
+from common.application.exceptions import ApplicationError, NotFoundError
+
+
+class RecommendationJobNotFoundError(NotFoundError):
+    def __init__(self, job_id: UUID) -> None:
+        super().__init__(job_id)
+        self.job_id = job_id
+
+
+class RecommendationJobRejectedError(ApplicationError):
+    def __init__(self, reason: str, retry_after_seconds: int) -> None:
+        super().__init__(f"Recommendation job rejected: {reason}")
+        self.reason = reason
+        self.retry_after_seconds = retry_after_seconds
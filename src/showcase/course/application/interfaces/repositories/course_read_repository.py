@@ -1,11 +1,22 @@
 """Course read repository interface."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from enum import Enum
 from uuid import UUID
 
 from pydantic import BaseModel
-from showcase.course.application.read_models.course_read_model import CourseReadModel
+from showcase.course.application.read_models.course_facets_read_model import (
+    CourseFacets,
+)
+from showcase.course.application.read_models.course_read_model import (
+    CoursePage,
+    CourseReadModel,
+    CourseSearchRanking,
+    CourseSummaryPage,
+    CourseSummaryReadModel,
+    CourseView,
+)
 from showcase.course.domain.value_objects import CourseStatus
 from showcase.course.domain.value_objects.format import EducationFormat, Format
 
@@ -70,9 +81,13 @@ class CoursesFilter(BaseModel):
     sort_field: CourseSortField = CourseSortField.NONE
     sort_order: CourseSortOrder = CourseSortOrder.ASC
 
-    # pagination
+    # pagination: ``after`` is a cursor from a previous page and takes
+    # precedence over ``skip``
     skip: int = 0
     limit: int = 100
+    after: str | None = None
+
+    view: CourseView = CourseView.SUMMARY
 
 
 class ICourseReadRepository(ABC):
@@ -83,6 +98,18 @@ class ICourseReadRepository(ABC):
         """Get a course by ID."""
         pass
 
+    @abstractmethod
+    async def get_by_ids(self, course_ids: Sequence[UUID]) -> list[CourseReadModel]:
+        """Get courses in the order of ``course_ids``, skipping missing ones."""
+        pass
+
+    @abstractmethod
+    async def get_summaries_by_ids(
+        self, course_ids: Sequence[UUID]
+    ) -> list[CourseSummaryReadModel]:
+        """Get course summaries with the semantics of ``get_by_ids``."""
+        pass
+
     @abstractmethod
     async def get_all(
         self,
@@ -92,17 +119,51 @@ class ICourseReadRepository(ABC):
         format: Format | None = None,
         skip: int = 0,
         limit: int = 100,
-    ) -> list[CourseReadModel]:
-        """Get all courses with optional filters."""
+        after: str | None = None,
+    ) -> CoursePage:
+        """Get all courses with optional filters.
+
+        Continues after the ``after`` cursor when given, otherwise skips
+        ``skip`` courses.
+        """
+        pass
+
+    @abstractmethod
+    async def get_all_summaries(
+        self,
+        status: CourseStatus | None = None,
+        is_published: bool | None = None,
+        category_id: UUID | None = None,
+        format: Format | None = None,
+        skip: int = 0,
+        limit: int = 100,
+        after: str | None = None,
+    ) -> CourseSummaryPage:
+        """Get course summaries with the filters of ``get_all``."""
         pass
 
     @abstractmethod
     async def search(
-        self, query: str, skip: int = 0, limit: int = 50
-    ) -> list[CourseReadModel]:
+        self, query: str, skip: int = 0, limit: int = 50, after: str | None = None
+    ) -> CoursePage:
         """Full-text search courses by query string."""
         pass
 
+    @abstractmethod
+    async def search_summaries(
+        self, query: str, skip: int = 0, limit: int = 50, after: str | None = None
+    ) -> CourseSummaryPage:
+        """Full-text search course summaries by query string."""
+        pass
+
+    @abstractmethod
+    async def search_ranking(self, query: str, limit: int) -> CourseSearchRanking:
+        """Rank the first ``limit`` matches of ``search``.
+
+        Each entry carries the cursor ``search`` would return after it.
+        """
+        pass
+
     @abstractmethod
     async def filter(self, filter: SimpleCoursesFilter) -> list[CourseReadModel]:
         """Deterministic simple filtering.
@@ -112,6 +173,21 @@ class ICourseReadRepository(ABC):
         pass
 
     @abstractmethod
-    async def filter_extended(self, filter: CoursesFilter) -> list[CourseReadModel]:
+    async def filter_extended(self, filter: CoursesFilter) -> CoursePage:
         """Deterministic extended filtering."""
         pass
+
+    @abstractmethod
+    async def filter_extended_summaries(
+        self, filter: CoursesFilter
+    ) -> CourseSummaryPage:
+        """Deterministic extended filtering of course summaries."""
+        pass
+
+    @abstractmethod
+    async def facets(self, filter: CoursesFilter) -> CourseFacets:
+        """Count the courses matching ``filter`` per facet value.
+
+        Sorting, paging and view fields of ``filter`` are ignored.
+        """
+        pass
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 
 from showcase.course.application.read_models.course_read_model import CourseReadModel
 
@@ -8,7 +9,18 @@ class ICourseRankingService(ABC):
 
     @abstractmethod
     async def rank(
-        self, query: str, courses: list[CourseReadModel]
+        self,
+        query: str,
+        courses: list[CourseReadModel],
+        category_names: Sequence[str] | None = None,
+        limit: int | None = None,
+        fallback: bool = False,
     ) -> tuple[list[CourseReadModel], bool]:
-        """Rank courses by relevance. Returns (ranked_courses, ranking_weak)."""
+        """Rank courses by relevance. Returns (ranked_courses, ranking_weak).
+
+        ``category_names`` are the categories inferred from the query, if any.
+        ``limit`` is how many courses the caller will show, if known.
+        ``fallback`` marks the fallback query, which asks for generally
+        popular courses rather than describing any of them.
+        """
         ...
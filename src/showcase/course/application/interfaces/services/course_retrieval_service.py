@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Set as AbstractSet
 
 from showcase.course.application.read_models.course_read_model import CourseReadModel
 from showcase.course.application.read_models.filter_inference import CourseFilterLLM
@@ -11,7 +12,7 @@ class ICourseRetrievalService(ABC):
     async def filter_by_inference(
         self,
         filter_llm: CourseFilterLLM,
-        available_category_names: set[str],
+        available_category_names: AbstractSet[str],
         limit: int,
         skip: int,
     ) -> list[CourseReadModel]:
@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+
+from showcase.course.application.read_models.course_read_model import CourseReadModel
+
+
+class IFallbackRecommendationService(ABC):
+    """Serves fallback courses ranked ahead of time."""
+
+    @abstractmethod
+    async def get(self, limit: int) -> list[CourseReadModel] | None:
+        """Return ranked fallback courses, or None if none are ready.
+
+        None means the ranking for the current catalog is not computed yet;
+        the caller then fetches and ranks fallback courses itself.
+        """
+        ...
@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
 
+from showcase.category.application.read_models.category_snapshot import (
+    CategorySnapshot,
+)
 from showcase.course.application.read_models.filter_inference import CourseFilterLLM
 
 
@@ -7,6 +10,6 @@ class IFilterInferenceService(ABC):
     """Infers structured course filter from user query."""
 
     @abstractmethod
-    async def infer(self, query: str, category_names: set[str]) -> CourseFilterLLM:
+    async def infer(self, query: str, categories: CategorySnapshot) -> CourseFilterLLM:
         """Infer CourseFilterLLM from user query and available categories."""
         ...
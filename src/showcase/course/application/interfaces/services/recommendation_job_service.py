@@ -0,0 +1,49 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from enum import Enum
+from uuid import UUID
+
+from showcase.course.application.interfaces.services.recommendation_service import (
+    GetRecommendationsDTO,
+    RecommendationsDTO,
+)
+
+
+class RecommendationJobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class RecommendationJobDTO:
+    job_id: UUID
+    status: RecommendationJobStatus
+    result: RecommendationsDTO | None = None  # once succeeded
+    error: str | None = None  # once failed: the exception type
+
+
+class IRecommendationJobService(ABC):
+    """Computes recommendations in the background for clients that poll."""
+
+    @abstractmethod
+    async def submit(
+        self, dto: GetRecommendationsDTO, submitter: str
+    ) -> RecommendationJobDTO:
+        """Enqueue a recommendation and return its job without waiting.
+
+        An unfinished job for the same normalized request is returned
+        instead of a new one. ``submitter`` identifies whoever asked, for
+        admission limits; ``RecommendationJobRejectedError`` is raised when
+        they or the queue are at the limit.
+        """
+        ...
+
+    @abstractmethod
+    async def get(self, job_id: UUID, wait_seconds: float = 0) -> RecommendationJobDTO:
+        """Return the job, waiting up to ``wait_seconds`` for it to finish.
+
+        Raises ``RecommendationJobNotFoundError`` for unknown or expired jobs.
+        """
+        ...
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
 from showcase.course.application.read_models.course_read_model import CourseReadModel
@@ -11,6 +11,12 @@ class RecommendationNotice(str, Enum):
     FALLBACK_USED = "fallback_used"
     RANKING_WEAK = "ranking_weak"
     FILTERS_INFERRED = "filters_inferred"
+    STAGE_TIMED_OUT = "stage_timed_out"
+
+
+class RankingMode(str, Enum):
+    LLM = "llm"
+    LOCAL = "local"  # no LLM call for ranking; faster and free
 
 
 @dataclass(frozen=True)
@@ -18,6 +24,21 @@ class GetRecommendationsDTO:
     query: str
     limit: int = 10
     skip: int = 0
+    ranking: RankingMode = RankingMode.LLM
+    debug: bool = False  # attach the LLM calls made for this request
+
+
+@dataclass(frozen=True)
+class LLMCallBreakdown:
+    stage: str  # "filter_inference" or "ranking"
+    model: str | None
+    wall_ms: float
+    ttfb_ms: float | None
+    prompt_tokens: int
+    completion_tokens: int
+    attempts: int
+    parse_failed: bool
+    error: str | None
 
 
 @dataclass(frozen=True)
@@ -25,6 +46,10 @@ class RecommendationsDTO:
     notices: list[RecommendationNotice]
     courses: list[CourseReadModel]
     skip: int
+    # Wall time per pipeline stage; stages overlap, so they may exceed "total"
+    stage_timings_ms: dict[str, float] = field(default_factory=dict)
+    # Only for debug requests; empty when served without LLM calls
+    llm_calls: list[LLMCallBreakdown] | None = None
 
 
 class IRecommendationService(ABC):
@@ -1,6 +1,7 @@
 """Course use case interfaces."""
 
 from .get_course_by_id_usecase import IGetCourseByIdUseCase
+from .get_course_facets_usecase import IGetCourseFacetsUseCase
 from .get_courses_extended_usecase import IGetCoursesExtendedUseCase
 from .get_courses_search_usecase import IGetCoursesSearchUseCase
 from .get_courses_usecase import IGetCoursesUseCase
@@ -12,6 +13,7 @@ from .get_tags_use_case import IGetTagsUseCase
 
 __all__ = [
     "IGetCourseByIdUseCase",
+    "IGetCourseFacetsUseCase",
     "IGetCoursesExtendedUseCase",
     "IGetCoursesSearchUseCase",
     "IGetCoursesUseCase",
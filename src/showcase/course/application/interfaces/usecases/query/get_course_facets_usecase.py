@@ -0,0 +1,15 @@
+"""Interface for course facet counts use case."""
+
+from abc import ABC, abstractmethod
+
+from showcase.course.application.interfaces.repositories.course_read_repository import (
+    CoursesFilter,
+)
+from showcase.course.application.read_models.course_facets_read_model import (
+    CourseFacets,
+)
+
+
+class IGetCourseFacetsUseCase(ABC):
+    @abstractmethod
+    async def execute(self, query: CoursesFilter) -> CourseFacets: ...
@@ -5,9 +5,14 @@ from abc import ABC, abstractmethod
 from showcase.course.application.dtos.queries.get_courses_search_query import (
     GetCoursesSearchQuery,
 )
-from showcase.course.application.read_models.course_read_model import CourseReadModel
+from showcase.course.application.read_models.course_read_model import (
+    CoursePage,
+    CourseSummaryPage,
+)
 
 
 class IGetCoursesSearchUseCase(ABC):
     @abstractmethod
-    async def execute(self, query: GetCoursesSearchQuery) -> list[CourseReadModel]: ...
+    async def execute(
+        self, query: GetCoursesSearchQuery
+    ) -> CoursePage | CourseSummaryPage: ...
@@ -3,13 +3,16 @@
 from abc import ABC, abstractmethod
 
 from showcase.course.application.dtos.queries import GetCoursesQuery
-from showcase.course.application.read_models.course_read_model import CourseReadModel
+from showcase.course.application.read_models.course_read_model import (
+    CoursePage,
+    CourseSummaryPage,
+)
 
 
 class IGetCoursesUseCase(ABC):
     """Interface for getting courses."""
 
     @abstractmethod
-    async def execute(self, query: GetCoursesQuery) -> list[CourseReadModel]:
+    async def execute(self, query: GetCoursesQuery) -> CoursePage | CourseSummaryPage:
         """Execute the get courses query."""
         pass
@@ -0,0 +1,31 @@
+"""Course facet counts read model."""
+
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class FacetCount(BaseModel):
+    value: str
+    count: int
+
+
+class CategoryFacetCount(BaseModel):
+    category_id: UUID
+    name: str
+    count: int
+
+
+class CourseFacets(BaseModel):
+    """Number of courses matching a filter, per facet value.
+
+    Every facet is counted under the whole filter, including its own
+    dimension. Values with no matching course are omitted.
+    """
+
+    total: int
+    formats: list[FacetCount]
+    education_formats: list[FacetCount]
+    statuses: list[FacetCount]
+    categories: list[CategoryFacetCount]
+    tags: list[FacetCount]
@@ -3,6 +3,7 @@
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
+from enum import Enum
 from uuid import UUID
 
 from pydantic import BaseModel
@@ -58,6 +59,24 @@ class CourseReadModel(BaseModel):
     updated_at: datetime
 
 
+class CourseView(str, Enum):
+    SUMMARY = "summary"  # CourseSummaryReadModel
+    FULL = "full"  # CourseReadModel
+
+
+class CourseSummaryReadModel(BaseModel):
+    """Read model for course lists: scalar columns only, no collections."""
+
+    course_id: UUID
+    name: str
+    format: Format
+    duration_hours: int
+    cost: Decimal
+    discounted_cost: Decimal | None
+    start_date: datetime | None
+    status: CourseStatus
+
+
 class CourseSectionRankingModel(BaseModel):
     """Optimized model for course section in ranking requests."""
 
@@ -113,3 +132,37 @@ class CourseRankingReadModel(BaseModel):
                 for section in course.sections
             ],
         )
+
+
+class CoursePage(BaseModel):
+    """Page of courses with an opaque cursor pointing past its last course.
+
+    ``next_cursor`` is ``None`` when there are no further courses.
+    """
+
+    courses: list[CourseReadModel]
+    next_cursor: str | None = None
+
+
+class CourseSummaryPage(BaseModel):
+    """Page of course summaries; see ``CoursePage``."""
+
+    courses: list[CourseSummaryReadModel]
+    next_cursor: str | None = None
+
+
+class RankedCourse(BaseModel):
+    """Search match with the cursor that continues a search after it."""
+
+    course_id: UUID
+    cursor: str
+
+
+class CourseSearchRanking(BaseModel):
+    """Best search matches in relevance order.
+
+    ``complete`` is ``False`` when more matches exist beyond ``courses``.
+    """
+
+    courses: list[RankedCourse]
+    complete: bool
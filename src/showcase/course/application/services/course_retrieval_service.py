@@ -2,6 +2,7 @@
 
 import logging
 import random
+from collections.abc import Set as AbstractSet
 
 from showcase.course.application.interfaces.repositories.course_read_repository import (
     ICourseReadRepository,
@@ -28,7 +29,7 @@ class CourseRetrievalService(ICourseRetrievalService):
     async def filter_by_inference(
         self,
         filter_llm: CourseFilterLLM,
-        available_category_names: set[str],
+        available_category_names: AbstractSet[str],
         limit: int,
         skip: int,
     ) -> list[CourseReadModel]:
@@ -115,7 +116,8 @@ class CourseRetrievalService(ICourseRetrievalService):
             extra={"service": "CourseRetrieval", "limit": limit},
         )
 
-        courses = await self._course_repository.get_all(limit=limit)
+        page = await self._course_repository.get_all(limit=limit)
+        courses = page.courses
         rng = random.Random()
         rng.shuffle(courses)
 
@@ -1,9 +1,14 @@
 """Recommendation orchestrator: coordinates filter inference, retrieval, and ranking."""
 
+import asyncio
 import logging
+import time
+from collections.abc import Awaitable
+from dataclasses import dataclass
+from typing import Any, TypeVar
 
-from showcase.category.application.interfaces.repositories.category_read_repository import (
-    ICategoryReadRepository,
+from showcase.category.application.interfaces.services.category_catalog import (
+    ICategoryCatalog,
 )
 from showcase.course.application.interfaces.services.course_ranking_service import (
     ICourseRankingService,
@@ -11,19 +16,55 @@ from showcase.course.application.interfaces.services.course_ranking_service impo
 from showcase.course.application.interfaces.services.course_retrieval_service import (
     ICourseRetrievalService,
 )
+from showcase.course.application.interfaces.services.fallback_recommendation_service import (
+    IFallbackRecommendationService,
+)
 from showcase.course.application.interfaces.services.filter_inference_service import (
     IFilterInferenceService,
 )
 from showcase.course.application.interfaces.services.recommendation_service import (
     GetRecommendationsDTO,
     IRecommendationService,
+    RankingMode,
     RecommendationNotice,
     RecommendationsDTO,
 )
+from showcase.course.application.read_models.course_read_model import CourseReadModel
+from showcase.course.application.read_models.filter_inference import CourseFilterLLM
+
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class RecommendationTimeouts:
+    """Per-stage time limits, in seconds."""
+
+    categories: float = 5
+    inference: float = 30
+    retrieval: float = 5
+    fallback: float = 5
+    ranking: float = 60
 
 
 class RecommendationService(IRecommendationService):
-    """Orchestrates filter inference, course retrieval, and LLM ranking."""
+    """Orchestrates filter inference, course retrieval, and LLM ranking.
+
+    Fallback courses are fetched speculatively alongside categories, filter
+    inference and filtered retrieval, and the fetch is cancelled once the
+    filter finds courses. A stage that times out sends the request down the
+    fallback path, or, for ranking, hands the courses to ``local_ranking``
+    (or keeps the retrieval order without one).
+
+    Requests with ``RankingMode.LOCAL`` are ranked by ``local_ranking`` only.
+
+    With ``fallback_recommendations``, the fallback path serves courses it
+    ranked ahead of time and skips ranking; while it has none ready, the
+    fallback courses are fetched and ranked as above.
+
+    Stages run as separate tasks, each with its own database session, so
+    ``recommend`` must not be called inside a unit of work.
+    """
 
     MAX_LIMIT: int = 25
     FALLBACK_RANKING_QUERY = """
@@ -36,23 +77,31 @@ class RecommendationService(IRecommendationService):
         - не нишевость
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         logger: logging.Logger,
-        category_repository: ICategoryReadRepository,
+        category_catalog: ICategoryCatalog,
         filter_inference: IFilterInferenceService,
         course_retrieval: ICourseRetrievalService,
         course_ranking: ICourseRankingService,
+        timeouts: RecommendationTimeouts | None = None,
+        local_ranking: ICourseRankingService | None = None,
+        fallback_recommendations: IFallbackRecommendationService | None = None,
     ) -> None:
         self._logger = logger
-        self._category_repository = category_repository
+        self._category_catalog = category_catalog
         self._filter_inference = filter_inference
         self._course_retrieval = course_retrieval
         self._course_ranking = course_ranking
+        self._timeouts = timeouts or RecommendationTimeouts()
+        self._local_ranking = local_ranking
+        self._fallback_recommendations = fallback_recommendations
 
     async def recommend(self, dto: GetRecommendationsDTO) -> RecommendationsDTO:
         query = dto.query
         notices: list[RecommendationNotice] = []
+        timings: dict[str, float] = {}
+        started = time.perf_counter()
 
         self._logger.info(
             "Recommendation started",
@@ -61,62 +110,102 @@ class RecommendationService(IRecommendationService):
                 "query": query[:200],
                 "limit": dto.limit,
                 "skip": dto.skip,
+                "ranking": dto.ranking,
             },
         )
 
-        # 1. Load categories
-        categories = await self._category_repository.get_all()
-        category_names = {c.name for c in categories}
-        self._logger.debug(
-            "Categories loaded",
-            extra={"action": "recommend", "count": len(categories)},
+        # Fallback courses are fetched while the filter is worked out
+        fallback = asyncio.create_task(
+            self._stage(
+                timings,
+                "fallback",
+                self._fallback_courses(),
+                self._timeouts.fallback,
+            )
         )
 
-        # 2. Infer filter from query
-        filter_llm = await self._filter_inference.infer(query, category_names)
+        try:
+            # 1-3. Load categories, infer filter and retrieve courses by it
+            limit = min(self.MAX_LIMIT, dto.limit)
+            filter_llm: CourseFilterLLM | None = None
+            preranked = False
+            fallback_used = False
+            try:
+                filter_llm, courses = await self._filtered_courses(
+                    query, limit, dto.skip, timings
+                )
+            except TimeoutError:
+                courses = []
+                notices.append(RecommendationNotice.STAGE_TIMED_OUT)
 
-        # 3. Retrieve courses: by filter or fallback
-        limit = min(self.MAX_LIMIT, dto.limit)
-        courses = await self._course_retrieval.filter_by_inference(
-            filter_llm, category_names, limit=limit, skip=dto.skip
-        )
+            if courses:
+                notices.append(RecommendationNotice.FILTERS_INFERRED)
 
-        if courses:
-            notices.append(RecommendationNotice.FILTERS_INFERRED)
+            if not courses:
+                query = self.FALLBACK_RANKING_QUERY
+                fallback_used = True
+                if filter_llm is not None:
+                    notices.append(
+                        RecommendationNotice.QUERY_INVALID
+                        if not filter_llm.is_decisive
+                        else RecommendationNotice.QUERY_AMBIGUOUS
+                    )
+                notices.append(RecommendationNotice.FALLBACK_USED)
 
-        if not courses:
-            query = self.FALLBACK_RANKING_QUERY
-            notices.append(
-                RecommendationNotice.QUERY_INVALID
-                if not filter_llm.is_decisive
-                else RecommendationNotice.QUERY_AMBIGUOUS
-            )
-            notices.append(RecommendationNotice.FALLBACK_USED)
+                try:
+                    courses, preranked = await fallback
+                except TimeoutError:
+                    courses = []
+                    notices.append(RecommendationNotice.STAGE_TIMED_OUT)
 
-            courses = await self._course_retrieval.get_fallback_courses(
-                limit=self.MAX_LIMIT
-            )
+                self._logger.info(
+                    "Fallback applied",
+                    extra={
+                        "action": "recommend",
+                        "reason": self._fallback_reason(filter_llm),
+                        "fallback_count": len(courses),
+                        "preranked": preranked,
+                    },
+                )
+        finally:
+            # No-op once awaited; cancels the fetch when the filter matched
+            self._discard(fallback)
 
-            self._logger.info(
-                "Fallback applied",
-                extra={
-                    "action": "recommend",
-                    "reason": (
-                        "indecisive" if not filter_llm.is_decisive else "no_courses"
-                    ),
-                    "fallback_count": len(courses),
-                },
+        # 4. Rank by LLM, or locally when asked to or when the LLM is too slow
+        # unless the fallback courses come ranked already
+        category_names = filter_llm.category_names if filter_llm else None
+        ranking = self._course_ranking
+        if dto.ranking == RankingMode.LOCAL and self._local_ranking is not None:
+            ranking = self._local_ranking
+        try:
+            ranked, ranking_weak = (
+                (courses, False)
+                if preranked
+                else await self._stage(
+                    timings,
+                    "ranking",
+                    ranking.rank(query, courses, category_names, limit, fallback_used),
+                    self._timeouts.ranking,
+                )
             )
-
-        # 4. Rank by LLM
-        ranked, ranking_weak = await self._course_ranking.rank(query, courses)
+        except TimeoutError:
+            ranked, ranking_weak = courses, True
+            notices.append(RecommendationNotice.STAGE_TIMED_OUT)
+            if self._local_ranking is not None and ranking is not self._local_ranking:
+                ranked, ranking_weak = await self._local_ranking.rank(
+                    query, courses, category_names, limit, fallback_used
+                )
         if ranking_weak:
             notices.append(RecommendationNotice.RANKING_WEAK)
 
         # 5. Build result
+        timings["total"] = self._elapsed_ms(started)
         result_courses = ranked[:limit]
         result = RecommendationsDTO(
-            notices=notices, courses=result_courses, skip=dto.skip + len(ranked)
+            notices=list(dict.fromkeys(notices)),
+            courses=result_courses,
+            skip=dto.skip + len(ranked),
+            stage_timings_ms=timings,
         )
 
         self._logger.info(
@@ -124,9 +213,88 @@ class RecommendationService(IRecommendationService):
             extra={
                 "action": "recommend",
                 "courses_count": len(result_courses),
-                "notices": notices,
+                "notices": result.notices,
                 "skip": result.skip,
+                "stage_timings_ms": timings,
             },
         )
 
         return result
+
+    async def _fallback_courses(self) -> tuple[list[CourseReadModel], bool]:
+        """Fallback courses and whether they are ranked already."""
+        if self._fallback_recommendations is not None:
+            courses = await self._fallback_recommendations.get(self.MAX_LIMIT)
+            if courses is not None:
+                return courses, True
+        courses = await self._course_retrieval.get_fallback_courses(
+            limit=self.MAX_LIMIT
+        )
+        return courses, False
+
+    async def _filtered_courses(
+        self, query: str, limit: int, skip: int, timings: dict[str, float]
+    ) -> tuple[CourseFilterLLM, list[CourseReadModel]]:
+        categories = await self._stage(
+            timings,
+            "categories",
+            self._category_catalog.snapshot(),
+            self._timeouts.categories,
+        )
+        self._logger.debug(
+            "Categories loaded",
+            extra={"action": "recommend", "count": len(categories.categories)},
+        )
+
+        filter_llm = await self._stage(
+            timings,
+            "inference",
+            self._filter_inference.infer(query, categories),
+            self._timeouts.inference,
+        )
+
+        courses = await self._stage(
+            timings,
+            "retrieval",
+            self._course_retrieval.filter_by_inference(
+                filter_llm, categories.names, limit=limit, skip=skip
+            ),
+            self._timeouts.retrieval,
+        )
+        return filter_llm, courses
+
+    async def _stage(
+        self,
+        timings: dict[str, float],
+        name: str,
+        stage: Awaitable[T],
+        timeout: float,
+    ) -> T:
+        """Await ``stage`` within ``timeout`` and record its wall time."""
+        started = time.perf_counter()
+        try:
+            return await asyncio.wait_for(stage, timeout)
+        except TimeoutError:
+            self._logger.warning(
+                "Recommendation stage timed out",
+                extra={"action": "recommend", "stage": name, "timeout": timeout},
+            )
+            raise
+        finally:
+            timings[name] = self._elapsed_ms(started)
+
+    @staticmethod
+    def _discard(task: "asyncio.Task[Any]") -> None:
+        """Cancel an unused branch; a failure it already hit is dropped."""
+        if not task.cancel() and not task.cancelled():
+            task.exception()
+
+    @staticmethod
+    def _fallback_reason(filter_llm: CourseFilterLLM | None) -> str:
+        if filter_llm is None:
+            return "timeout"
+        return "indecisive" if not filter_llm.is_decisive else "no_courses"
+
+    @staticmethod
+    def _elapsed_ms(started: float) -> float:
+        return round((time.perf_counter() - started) * 1000, 1)
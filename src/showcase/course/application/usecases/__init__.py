@@ -30,6 +30,9 @@ from showcase.course.application.usecases.command.update_tag_use_case import (
 from showcase.course.application.usecases.get_course_by_id_usecase import (
     GetCourseByIdUseCase,
 )
+from showcase.course.application.usecases.get_course_facets_usecase import (
+    GetCourseFacetsUseCase,
+)
 from showcase.course.application.usecases.get_courses_search_usecase import (
     GetCoursesSearchUseCase,
 )
@@ -56,6 +59,7 @@ __all__ = [
     "DeleteSkillUseCase",
     "DeleteTagUseCase",
     "GetCourseByIdUseCase",
+    "GetCourseFacetsUseCase",
     "GetCoursesSearchUseCase",
     "GetCoursesUseCase",
     "GetSkillByIdUseCase",
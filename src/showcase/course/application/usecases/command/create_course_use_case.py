@@ -1,5 +1,10 @@
 from uuid import UUID
 
+from common.application.interfaces.catalog.catalog_change_listener import (
+    CatalogChange,
+    CatalogEntity,
+    ICatalogChangeListener,
+)
 from common.domain.interfaces.uuid_generator import IUUIDGenerator
 from common.domain.value_objects.datetime import DateTime
 from showcase.course.application.dtos.commands.create_course_command import (
@@ -24,10 +29,12 @@ class CreateCourseUseCase(ICreateCourseUseCase):
         course_repository: ICourseRepository,
         uuid_generator: IUUIDGenerator,
         tag_repository: ITagRepository,
+        catalog_cache: ICatalogChangeListener,
     ) -> None:
         self.uuid_generator = uuid_generator
         self.course_repository = course_repository
         self.tag_repository = tag_repository
+        self.catalog_cache = catalog_cache
 
     async def execute(self, command: CreateCourseCommand) -> UUID:
         sections: list[CourseSection] = []
@@ -79,4 +86,7 @@ class CreateCourseUseCase(ICreateCourseUseCase):
             lecturer_ids=command.lecturer_ids,
         )
         await self.course_repository.add(course)
+        await self.catalog_cache.on_change(
+            CatalogChange(CatalogEntity.COURSE, course.course_id)
+        )
         return course.course_id
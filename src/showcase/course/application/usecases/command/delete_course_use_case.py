@@ -1,5 +1,10 @@
 from uuid import UUID
 
+from common.application.interfaces.catalog.catalog_change_listener import (
+    CatalogChange,
+    CatalogEntity,
+    ICatalogChangeListener,
+)
 from showcase.course.application.interfaces.repositories.course_repository import (
     ICourseRepository,
 )
@@ -9,9 +14,17 @@ from showcase.course.application.interfaces.usecases.command.delete_course_use_c
 
 
 class DeleteCourseUseCase(IDeleteCourseUseCase):
-    def __init__(self, course_repository: ICourseRepository) -> None:
+    def __init__(
+        self,
+        course_repository: ICourseRepository,
+        catalog_cache: ICatalogChangeListener,
+    ) -> None:
         self.course_repository = course_repository
+        self.catalog_cache = catalog_cache
 
     async def execute(self, course_id: UUID) -> UUID:
         await self.course_repository.delete(course_id)
+        await self.catalog_cache.on_change(
+            CatalogChange(CatalogEntity.COURSE, course_id, deleted=True)
+        )
         return course_id
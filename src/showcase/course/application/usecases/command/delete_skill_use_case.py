@@ -1,5 +1,10 @@
 from uuid import UUID
 
+from common.application.interfaces.catalog.catalog_change_listener import (
+    CatalogChange,
+    CatalogEntity,
+    ICatalogChangeListener,
+)
 from showcase.course.application.interfaces.repositories.skill_repository import (
     ISkillRepository,
 )
@@ -9,9 +14,17 @@ from showcase.course.application.interfaces.usecases.command.delete_skill_use_ca
 
 
 class DeleteSkillUseCase(IDeleteSkillUseCase):
-    def __init__(self, skill_repository: ISkillRepository) -> None:
+    def __init__(
+        self,
+        skill_repository: ISkillRepository,
+        catalog_cache: ICatalogChangeListener,
+    ) -> None:
         self.skill_repository = skill_repository
+        self.catalog_cache = catalog_cache
 
     async def execute(self, skill_id: UUID) -> UUID:
         await self.skill_repository.delete(skill_id)
+        await self.catalog_cache.on_change(
+            CatalogChange(CatalogEntity.SKILL, skill_id, deleted=True)
+        )
         return skill_id
@@ -1,5 +1,10 @@
 from uuid import UUID
 
+from common.application.interfaces.catalog.catalog_change_listener import (
+    CatalogChange,
+    CatalogEntity,
+    ICatalogChangeListener,
+)
 from showcase.course.application.interfaces.repositories.tag_repository import (
     ITagRepository,
 )
@@ -9,9 +14,17 @@ from showcase.course.application.interfaces.usecases.command.delete_tag_use_case
 
 
 class DeleteTagUseCase(IDeleteTagUseCase):
-    def __init__(self, tag_repository: ITagRepository) -> None:
+    def __init__(
+        self,
+        tag_repository: ITagRepository,
+        catalog_cache: ICatalogChangeListener,
+    ) -> None:
         self.tag_repository = tag_repository
+        self.catalog_cache = catalog_cache
 
     async def execute(self, tag_id: UUID) -> UUID:
         await self.tag_repository.delete(tag_id)
+        await self.catalog_cache.on_change(
+            CatalogChange(CatalogEntity.TAG, tag_id, deleted=True)
+        )
         return tag_id
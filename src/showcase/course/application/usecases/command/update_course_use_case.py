@@ -1,5 +1,10 @@
 from uuid import UUID
 
+from common.application.interfaces.catalog.catalog_change_listener import (
+    CatalogChange,
+    CatalogEntity,
+    ICatalogChangeListener,
+)
 from common.domain.interfaces.uuid_generator import IUUIDGenerator
 from common.domain.value_objects.datetime import DateTime
 from showcase.course.application.dtos.commands.update_course_command import (
@@ -24,10 +29,12 @@ class UpdateCourseUseCase(IUpdateCourseUseCase):
         course_repository: ICourseRepository,
         uuid_generator: IUUIDGenerator,
         tag_repository: ITagRepository,
+        catalog_cache: ICatalogChangeListener,
     ) -> None:
         self.course_repository = course_repository
         self.uuid_generator = uuid_generator
         self.tag_repository = tag_repository
+        self.catalog_cache = catalog_cache
 
     async def execute(self, command: UpdateCourseCommand) -> UUID:
         sections: list[CourseSection] = []
@@ -81,4 +88,7 @@ class UpdateCourseUseCase(IUpdateCourseUseCase):
         )
 
         await self.course_repository.update(course)
+        await self.catalog_cache.on_change(
+            CatalogChange(CatalogEntity.COURSE, command.course_id)
+        )
         return command.course_id
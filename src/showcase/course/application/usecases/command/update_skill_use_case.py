@@ -1,5 +1,10 @@
 from uuid import UUID
 
+from common.application.interfaces.catalog.catalog_change_listener import (
+    CatalogChange,
+    CatalogEntity,
+    ICatalogChangeListener,
+)
 from showcase.course.application.dtos.commands.update_skill_command import (
     UpdateSkillCommand,
 )
@@ -12,8 +17,13 @@ from showcase.course.application.interfaces.usecases.command.update_skill_use_ca
 
 
 class UpdateSkillUseCase(IUpdateSkillUseCase):
-    def __init__(self, skill_repository: ISkillRepository) -> None:
+    def __init__(
+        self,
+        skill_repository: ISkillRepository,
+        catalog_cache: ICatalogChangeListener,
+    ) -> None:
         self.skill_repository = skill_repository
+        self.catalog_cache = catalog_cache
 
     async def execute(self, command: UpdateSkillCommand) -> UUID:
         skill = await self.skill_repository.get_by_id(command.skill_id)
@@ -22,4 +32,7 @@ class UpdateSkillUseCase(IUpdateSkillUseCase):
         skill.description = command.description
 
         await self.skill_repository.update(skill)
+        await self.catalog_cache.on_change(
+            CatalogChange(CatalogEntity.SKILL, command.skill_id)
+        )
         return command.skill_id
@@ -1,5 +1,10 @@
 from uuid import UUID
 
+from common.application.interfaces.catalog.catalog_change_listener import (
+    CatalogChange,
+    CatalogEntity,
+    ICatalogChangeListener,
+)
 from showcase.course.application.dtos.commands.update_tag_command import (
     UpdateTagCommand,
 )
@@ -12,13 +17,21 @@ from showcase.course.application.interfaces.usecases.command.update_tag_use_case
 
 
 class UpdateTagUseCase(IUpdateTagUseCase):
-    def __init__(self, tag_repository: ITagRepository) -> None:
+    def __init__(
+        self,
+        tag_repository: ITagRepository,
+        catalog_cache: ICatalogChangeListener,
+    ) -> None:
         self.tag_repository = tag_repository
+        self.catalog_cache = catalog_cache
 
     async def execute(self, command: UpdateTagCommand) -> UUID:
         tag = await self.tag_repository.get_by_id(command.tag_id)
 
         tag.value = command.name
         await self.tag_repository.update(tag)
+        await self.catalog_cache.on_change(
+            CatalogChange(CatalogEntity.TAG, command.tag_id)
+        )
 
         return command.tag_id
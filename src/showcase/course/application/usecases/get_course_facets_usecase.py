@@ -0,0 +1,20 @@
+"""Use case implementation for course facet counts."""
+
+from showcase.course.application.interfaces.repositories import ICourseReadRepository
+from showcase.course.application.interfaces.repositories.course_read_repository import (
+    CoursesFilter,
+)
+from showcase.course.application.interfaces.usecases.query.get_course_facets_usecase import (
+    IGetCourseFacetsUseCase,
+)
+from showcase.course.application.read_models.course_facets_read_model import (
+    CourseFacets,
+)
+
+
+class GetCourseFacetsUseCase(IGetCourseFacetsUseCase):
+    def __init__(self, course_read_repository: ICourseReadRepository) -> None:
+        self.course_read_repository = course_read_repository
+
+    async def execute(self, query: CoursesFilter) -> CourseFacets:
+        return await self.course_read_repository.facets(query)
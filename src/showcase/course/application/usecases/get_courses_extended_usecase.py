@@ -7,12 +7,18 @@ from showcase.course.application.interfaces.repositories.course_read_repository
 from showcase.course.application.interfaces.usecases.query.get_courses_extended_usecase import (
     IGetCoursesExtendedUseCase,
 )
-from showcase.course.application.read_models.course_read_model import CourseReadModel
+from showcase.course.application.read_models.course_read_model import (
+    CoursePage,
+    CourseSummaryPage,
+    CourseView,
+)
 
 
 class GetCoursesExtendedUseCase(IGetCoursesExtendedUseCase):
     def __init__(self, course_read_repository: ICourseReadRepository) -> None:
         self.course_read_repository = course_read_repository
 
-    async def execute(self, query: CoursesFilter) -> list[CourseReadModel]:
-        return await self.course_read_repository.filter_extended(query)
+    async def execute(self, query: CoursesFilter) -> CoursePage | CourseSummaryPage:
+        if query.view == CourseView.FULL:
+            return await self.course_read_repository.filter_extended(query)
+        return await self.course_read_repository.filter_extended_summaries(query)
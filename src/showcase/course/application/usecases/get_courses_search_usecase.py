@@ -9,12 +9,25 @@ from showcase.course.application.interfaces.repositories.course_read_repository
 from showcase.course.application.interfaces.usecases.query.get_courses_search_usecase import (
     IGetCoursesSearchUseCase,
 )
-from showcase.course.application.read_models.course_read_model import CourseReadModel
+from showcase.course.application.read_models.course_read_model import (
+    CoursePage,
+    CourseSummaryPage,
+    CourseView,
+)
 
 
 class GetCoursesSearchUseCase(IGetCoursesSearchUseCase):
     def __init__(self, repository: ICourseReadRepository) -> None:
         self._repo = repository
 
-    async def execute(self, query: GetCoursesSearchQuery) -> list[CourseReadModel]:
-        return await self._repo.search(query.query, skip=query.skip, limit=query.limit)
+    async def execute(
+        self, query: GetCoursesSearchQuery
+    ) -> CoursePage | CourseSummaryPage:
+        search = (
+            self._repo.search
+            if query.view == CourseView.FULL
+            else self._repo.search_summaries
+        )
+        return await search(
+            query.query, skip=query.skip, limit=query.limit, after=query.after
+        )
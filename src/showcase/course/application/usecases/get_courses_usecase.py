@@ -3,7 +3,11 @@
 from showcase.course.application.dtos.queries import GetCoursesQuery
 from showcase.course.application.interfaces.repositories import ICourseReadRepository
 from showcase.course.application.interfaces.usecases.query import IGetCoursesUseCase
-from showcase.course.application.read_models.course_read_model import CourseReadModel
+from showcase.course.application.read_models.course_read_model import (
+    CoursePage,
+    CourseSummaryPage,
+    CourseView,
+)
 
 
 class GetCoursesUseCase(IGetCoursesUseCase):
@@ -12,13 +16,19 @@ class GetCoursesUseCase(IGetCoursesUseCase):
     def __init__(self, course_read_repository: ICourseReadRepository) -> None:
         self.course_read_repository = course_read_repository
 
-    async def execute(self, query: GetCoursesQuery) -> list[CourseReadModel]:
+    async def execute(self, query: GetCoursesQuery) -> CoursePage | CourseSummaryPage:
         """Execute the get courses query."""
-        return await self.course_read_repository.get_all(
+        get_all = (
+            self.course_read_repository.get_all
+            if query.view == CourseView.FULL
+            else self.course_read_repository.get_all_summaries
+        )
+        return await get_all(
             status=query.status,
             is_published=query.is_published,
             category_id=query.category_id,
             format=query.format,
             skip=query.skip,
             limit=query.limit,
+            after=query.after,
         )
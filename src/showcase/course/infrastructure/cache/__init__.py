@@ -0,0 +1,48 @@
+"""Course caches."""
+
+from showcase.course.infrastructure.cache.coalescing import (
+    CoalescingGetCourseByIdUseCase,
+    CoalescingGetCoursesSearchUseCase,
+    CoalescingRecommendationService,
+)
+from showcase.course.infrastructure.cache.course_facets_cache import (
+    CourseFacetsCache,
+)
+from showcase.course.infrastructure.cache.course_read_cache import (
+    CachedCourseReadRepository,
+    CourseReadCache,
+)
+from showcase.course.infrastructure.cache.course_search_cache import (
+    CourseSearchCache,
+)
+from showcase.course.infrastructure.cache.filter_inference_cache import (
+    CachedFilterInferenceService,
+    FilterInferenceCache,
+    FilterInferenceCacheStats,
+)
+from showcase.course.infrastructure.cache.recommendation_cache import (
+    CachedRecommendation,
+    CachedRecommendationService,
+    InMemoryRecommendationCacheBackend,
+    IRecommendationCacheBackend,
+    RecommendationCache,
+)
+
+
+__all__ = [
+    "CachedCourseReadRepository",
+    "CachedFilterInferenceService",
+    "CachedRecommendation",
+    "CachedRecommendationService",
+    "CoalescingGetCourseByIdUseCase",
+    "CoalescingGetCoursesSearchUseCase",
+    "CoalescingRecommendationService",
+    "CourseFacetsCache",
+    "CourseReadCache",
+    "CourseSearchCache",
+    "FilterInferenceCache",
+    "FilterInferenceCacheStats",
+    "IRecommendationCacheBackend",
+    "InMemoryRecommendationCacheBackend",
+    "RecommendationCache",
+]
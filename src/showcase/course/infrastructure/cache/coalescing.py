@@ -0,0 +1,118 @@
+"""Coalescing of identical concurrent course reads and recommendations."""
+
+from collections.abc import Hashable
+from uuid import UUID
+
+from common.infrastructure.cache import SingleFlight
+from showcase.course.application.dtos.queries import GetCourseByIdQuery
+from showcase.course.application.dtos.queries.get_courses_search_query import (
+    GetCoursesSearchQuery,
+)
+from showcase.course.application.interfaces.services.recommendation_service import (
+    GetRecommendationsDTO,
+    IRecommendationService,
+    RecommendationsDTO,
+)
+from showcase.course.application.interfaces.usecases.query import (
+    IGetCourseByIdUseCase,
+    IGetCoursesSearchUseCase,
+)
+from showcase.course.application.read_models.course_read_model import (
+    CoursePage,
+    CourseReadModel,
+    CourseSummaryPage,
+)
+from showcase.course.infrastructure.cache.course_search_cache import (
+    CourseSearchCache,
+)
+from showcase.course.infrastructure.cache.recommendation_cache import (
+    RecommendationCache,
+)
+
+
+class CoalescingRecommendationService(IRecommendationService):
+    """Computes a recommendation once for identical concurrent requests.
+
+    Requests are identical when their normalized query, limit, skip and
+    ranking mode match, as for ``RecommendationCache``, and both or neither
+    ask for the debug breakdown. Sits in front of the result cache, so a
+    burst of one prompt costs a single pipeline run and the requests after
+    it are cache hits.
+    """
+
+    def __init__(
+        self,
+        inner: IRecommendationService,
+        flight: SingleFlight[Hashable, RecommendationsDTO],
+        enabled: bool = True,
+    ) -> None:
+        self.inner = inner
+        self.flight = flight
+        self.enabled = enabled
+
+    async def recommend(self, dto: GetRecommendationsDTO) -> RecommendationsDTO:
+        if not self.enabled:
+            return await self.inner.recommend(dto)
+
+        key = (
+            RecommendationCache.normalize(dto.query),
+            dto.limit,
+            dto.skip,
+            dto.ranking,
+            dto.debug,
+        )
+        return await self.flight.do(key, lambda: self.inner.recommend(dto))
+
+
+class CoalescingGetCoursesSearchUseCase(IGetCoursesSearchUseCase):
+    """Runs one search for identical concurrent queries.
+
+    Queries are identical when their normalized text, page and filters
+    match.
+    """
+
+    def __init__(
+        self,
+        inner: IGetCoursesSearchUseCase,
+        flight: SingleFlight[Hashable, CoursePage | CourseSummaryPage],
+        enabled: bool = True,
+    ) -> None:
+        self.inner = inner
+        self.flight = flight
+        self.enabled = enabled
+
+    async def execute(
+        self, query: GetCoursesSearchQuery
+    ) -> CoursePage | CourseSummaryPage:
+        if not self.enabled:
+            return await self.inner.execute(query)
+
+        key = (
+            CourseSearchCache.normalize(query.query),
+            query.skip,
+            query.limit,
+            query.after,
+            query.view,
+            query.is_published,
+            query.status,
+        )
+        return await self.flight.do(key, lambda: self.inner.execute(query))
+
+
+class CoalescingGetCourseByIdUseCase(IGetCourseByIdUseCase):
+    """Loads a course once for concurrent requests of the same ID."""
+
+    def __init__(
+        self,
+        inner: IGetCourseByIdUseCase,
+        flight: SingleFlight[UUID, CourseReadModel],
+        enabled: bool = True,
+    ) -> None:
+        self.inner = inner
+        self.flight = flight
+        self.enabled = enabled
+
+    async def execute(self, query: GetCourseByIdQuery) -> CourseReadModel:
+        if not self.enabled:
+            return await self.inner.execute(query)
+        return await self.flight.do(query.course_id, lambda: self.inner.execute(query))
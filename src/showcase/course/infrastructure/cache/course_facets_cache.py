@@ -0,0 +1,54 @@
+"""In-process cache of course facet counts."""
+
+import hashlib
+from collections.abc import Awaitable, Callable
+
+from common.infrastructure.cache import CacheStats
+from common.infrastructure.catalog import CatalogResultCache, CatalogVersion
+from showcase.course.application.interfaces.repositories.course_read_repository import (
+    CoursesFilter,
+)
+from showcase.course.application.read_models.course_facets_read_model import (
+    CourseFacets,
+)
+from showcase.course.infrastructure.config.course_config import (
+    CourseFacetsCacheConfig,
+)
+
+
+class CourseFacetsCache:
+    """Short-lived facet counts keyed by a hash of the filter predicates.
+
+    Any catalog change empties the cache.
+    """
+
+    # Fields that do not change which courses match
+    IGNORED_FIELDS = frozenset(
+        {"sort_field", "sort_order", "skip", "limit", "after", "view"}
+    )
+
+    def __init__(
+        self, config: CourseFacetsCacheConfig, catalog_version: CatalogVersion
+    ) -> None:
+        self._cache = CatalogResultCache[str, CourseFacets](
+            catalog_version,
+            max_entries=config.max_entries,
+            max_bytes=config.max_bytes,
+            ttl_seconds=config.ttl_seconds,
+            sizeof=lambda facets: len(facets.model_dump_json().encode()),
+        )
+
+    @classmethod
+    def key(cls, filter: CoursesFilter) -> str:
+        predicates = filter.model_dump_json(exclude=set(cls.IGNORED_FIELDS))
+        return hashlib.sha256(predicates.encode()).hexdigest()
+
+    async def get_or_load(
+        self,
+        filter: CoursesFilter,
+        load: Callable[[CoursesFilter], Awaitable[CourseFacets]],
+    ) -> CourseFacets:
+        return await self._cache.get_or_load(self.key(filter), lambda: load(filter))
+
+    def stats(self) -> CacheStats:
+        return self._cache.stats()
@@ -0,0 +1,256 @@
+"""In-process cache of course read models."""
+
+from collections.abc import Awaitable, Callable, Sequence
+from uuid import UUID
+
+from common.application.interfaces.catalog.catalog_change_listener import (
+    CatalogChange,
+    CatalogEntity,
+    ICatalogChangeListener,
+)
+from common.infrastructure.cache import CacheStats, LRUCache
+from showcase.course.application.interfaces.repositories import ICourseReadRepository
+from showcase.course.application.interfaces.repositories.course_read_repository import (
+    CoursesFilter,
+    SimpleCoursesFilter,
+)
+from showcase.course.application.read_models.course_facets_read_model import (
+    CourseFacets,
+)
+from showcase.course.application.read_models.course_read_model import (
+    CoursePage,
+    CourseReadModel,
+    CourseSearchRanking,
+    CourseSummaryPage,
+    CourseSummaryReadModel,
+)
+from showcase.course.domain.value_objects import CourseStatus, Format
+from showcase.course.infrastructure.cache.course_facets_cache import (
+    CourseFacetsCache,
+)
+from showcase.course.infrastructure.cache.course_search_cache import (
+    CourseSearchCache,
+)
+from showcase.course.infrastructure.config.course_config import CourseCacheConfig
+
+
+class CourseReadCache(ICatalogChangeListener):
+    """Bounded LRU/TTL cache of ``CourseReadModel`` keyed by course ID.
+
+    Write use cases report committed changes through ``on_change``. Course
+    changes drop the course itself; category, lecturer and skill changes
+    drop every cached course embedding that entity. Cached models only carry
+    tag names, so a tag change clears the whole cache.
+
+    The cache is per process: other processes only see a change once the
+    entry expires after ``ttl_seconds``.
+    """
+
+    def __init__(self, config: CourseCacheConfig) -> None:
+        self._cache = LRUCache[UUID, CourseReadModel](
+            max_entries=config.max_entries,
+            max_bytes=config.max_bytes,
+            ttl_seconds=config.ttl_seconds,
+        )
+
+    async def get_or_load(
+        self,
+        course_id: UUID,
+        load: Callable[[UUID], Awaitable[CourseReadModel]],
+    ) -> CourseReadModel:
+        cached = self._cache.get(course_id)
+        if cached is not None:
+            return cached
+
+        version = self._cache.version()
+        course = await load(course_id)
+        self._cache.put(course_id, course, self._sizeof(course), version)
+        return course
+
+    async def get_many_or_load(
+        self,
+        course_ids: Sequence[UUID],
+        load: Callable[[Sequence[UUID]], Awaitable[list[CourseReadModel]]],
+    ) -> list[CourseReadModel]:
+        """Return cached courses and load the rest with a single ``load``."""
+        found: dict[UUID, CourseReadModel] = {}
+        missing: list[UUID] = []
+        for course_id in course_ids:
+            cached = self._cache.get(course_id)
+            if cached is not None:
+                found[course_id] = cached
+            else:
+                missing.append(course_id)
+
+        if missing:
+            version = self._cache.version()
+            for course in await load(missing):
+                self._cache.put(course.course_id, course, self._sizeof(course), version)
+                found[course.course_id] = course
+
+        return [found[course_id] for course_id in course_ids if course_id in found]
+
+    async def on_change(self, change: CatalogChange) -> None:
+        entity_id = change.entity_id
+        match change.entity:
+            case CatalogEntity.COURSE:
+                self._cache.invalidate(entity_id)
+            case CatalogEntity.CATEGORY:
+                self._cache.invalidate_where(
+                    lambda c: any(x.category_id == entity_id for x in c.categories)
+                )
+            case CatalogEntity.LECTURER:
+                self._cache.invalidate_where(
+                    lambda c: any(x.lecturer_id == entity_id for x in c.lecturers)
+                )
+            case CatalogEntity.SKILL:
+                self._cache.invalidate_where(
+                    lambda c: any(x.skill_id == entity_id for x in c.acquired_skills)
+                )
+            case CatalogEntity.TAG:
+                self._cache.clear()
+
+    def stats(self) -> CacheStats:
+        return self._cache.stats()
+
+    @staticmethod
+    def _sizeof(course: CourseReadModel) -> int:
+        """Approximate an entry's footprint by its serialized size."""
+        return len(course.model_dump_json().encode())
+
+
+class CachedCourseReadRepository(ICourseReadRepository):
+    """Serves lookups by ID, searches and facets from the course caches.
+
+    Courses by ID come from ``CourseReadCache`` and facet counts from
+    ``CourseFacetsCache``. A search page is cut from the cached ranking and
+    hydrated by ID. Pages the ranking cannot answer (past ``max_results``,
+    or an unknown cursor) and the remaining listings are passed through to
+    the wrapped repository.
+    """
+
+    def __init__(
+        self,
+        inner: ICourseReadRepository,
+        cache: CourseReadCache,
+        search_cache: CourseSearchCache,
+        facets_cache: CourseFacetsCache,
+    ) -> None:
+        self.inner = inner
+        self.cache = cache
+        self.search_cache = search_cache
+        self.facets_cache = facets_cache
+
+    async def get_by_id(self, course_id: UUID) -> CourseReadModel:
+        return await self.cache.get_or_load(course_id, self.inner.get_by_id)
+
+    async def get_by_ids(self, course_ids: Sequence[UUID]) -> list[CourseReadModel]:
+        return await self.cache.get_many_or_load(course_ids, self.inner.get_by_ids)
+
+    async def get_summaries_by_ids(
+        self, course_ids: Sequence[UUID]
+    ) -> list[CourseSummaryReadModel]:
+        return await self.inner.get_summaries_by_ids(course_ids)
+
+    async def get_all(
+        self,
+        status: CourseStatus | None = None,
+        is_published: bool | None = None,
+        category_id: UUID | None = None,
+        format: Format | None = None,
+        skip: int = 0,
+        limit: int = 100,
+        after: str | None = None,
+    ) -> CoursePage:
+        return await self.inner.get_all(
+            status, is_published, category_id, format, skip, limit, after
+        )
+
+    async def get_all_summaries(
+        self,
+        status: CourseStatus | None = None,
+        is_published: bool | None = None,
+        category_id: UUID | None = None,
+        format: Format | None = None,
+        skip: int = 0,
+        limit: int = 100,
+        after: str | None = None,
+    ) -> CourseSummaryPage:
+        return await self.inner.get_all_summaries(
+            status, is_published, category_id, format, skip, limit, after
+        )
+
+    async def search(
+        self, query: str, skip: int = 0, limit: int = 50, after: str | None = None
+    ) -> CoursePage:
+        window = await self._search_window(query, skip, limit, after)
+        if window is None:
+            return await self.inner.search(query, skip, limit, after)
+
+        course_ids, next_cursor = window
+        return CoursePage(
+            courses=await self.get_by_ids(course_ids), next_cursor=next_cursor
+        )
+
+    async def search_summaries(
+        self, query: str, skip: int = 0, limit: int = 50, after: str | None = None
+    ) -> CourseSummaryPage:
+        window = await self._search_window(query, skip, limit, after)
+        if window is None:
+            return await self.inner.search_summaries(query, skip, limit, after)
+
+        course_ids, next_cursor = window
+        return CourseSummaryPage(
+            courses=await self.get_summaries_by_ids(course_ids),
+            next_cursor=next_cursor,
+        )
+
+    async def search_ranking(self, query: str, limit: int) -> CourseSearchRanking:
+        return await self.inner.search_ranking(query, limit)
+
+    async def filter(self, filter: SimpleCoursesFilter) -> list[CourseReadModel]:
+        return await self.inner.filter(filter)
+
+    async def filter_extended(self, filter: CoursesFilter) -> CoursePage:
+        return await self.inner.filter_extended(filter)
+
+    async def filter_extended_summaries(
+        self, filter: CoursesFilter
+    ) -> CourseSummaryPage:
+        return await self.inner.filter_extended_summaries(filter)
+
+    async def facets(self, filter: CoursesFilter) -> CourseFacets:
+        return await self.facets_cache.get_or_load(filter, self.inner.facets)
+
+    async def _search_window(
+        self, query: str, skip: int, limit: int, after: str | None
+    ) -> tuple[list[UUID], str | None] | None:
+        """Cut a page of IDs from the cached ranking of ``query``.
+
+        Returns ``None`` when the page has to be read from the database.
+        """
+        if not self.search_cache.enabled:
+            return None
+
+        ranking = await self.search_cache.get_or_load(query, self.inner.search_ranking)
+        ranked = ranking.courses
+
+        if after is None:
+            start = skip
+        else:
+            position = next(
+                (i for i, course in enumerate(ranked) if course.cursor == after),
+                None,
+            )
+            if position is None:
+                return None
+            start = position + 1
+
+        end = start + limit
+        if end > len(ranked) and not ranking.complete:
+            return None
+
+        page = ranked[start:end]
+        has_more = end < len(ranked) or not ranking.complete
+        next_cursor = page[-1].cursor if page and has_more else None
+        return [course.course_id for course in page], next_cursor
@@ -0,0 +1,54 @@
+"""In-process cache of full-text search rankings."""
+
+from collections.abc import Awaitable, Callable
+
+from common.infrastructure.cache import CacheStats
+from common.infrastructure.catalog import CatalogResultCache, CatalogVersion
+from showcase.course.application.read_models.course_read_model import (
+    CourseSearchRanking,
+)
+from showcase.course.infrastructure.config.course_config import (
+    CourseSearchCacheConfig,
+)
+
+
+class CourseSearchCache:
+    """Search rankings keyed by normalized query.
+
+    Only ranked course IDs and their cursors are kept; pages are hydrated
+    by ID. Any catalog change empties the cache.
+    """
+
+    def __init__(
+        self, config: CourseSearchCacheConfig, catalog_version: CatalogVersion
+    ) -> None:
+        self.max_results = config.max_results
+        self._cache = CatalogResultCache[str, CourseSearchRanking](
+            catalog_version,
+            max_entries=config.max_entries,
+            max_bytes=config.max_bytes,
+            ttl_seconds=config.ttl_seconds,
+            sizeof=lambda ranking: len(ranking.model_dump_json().encode()),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self._cache.enabled
+
+    @staticmethod
+    def normalize(query: str) -> str:
+        """Lowercase and collapse whitespace, keeping the token order."""
+        return " ".join(query.lower().split())
+
+    async def get_or_load(
+        self,
+        query: str,
+        load: Callable[[str, int], Awaitable[CourseSearchRanking]],
+    ) -> CourseSearchRanking:
+        normalized = self.normalize(query)
+        return await self._cache.get_or_load(
+            normalized, lambda: load(normalized, self.max_results)
+        )
+
+    def stats(self) -> CacheStats:
+        return self._cache.stats()
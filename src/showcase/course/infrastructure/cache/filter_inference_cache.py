@@ -0,0 +1,188 @@
+"""Memoized filter inference."""
+
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from common.infrastructure.cache import CacheStats, LRUCache
+from common.infrastructure.services.llama_index.guard import LLMGuard
+from common.infrastructure.services.llama_index.tokens import estimate_tokens
+from showcase.category.application.read_models.category_snapshot import (
+    CategorySnapshot,
+)
+from showcase.course.application.interfaces.services.filter_inference_service import (
+    IFilterInferenceService,
+)
+from showcase.course.application.read_models.filter_inference import CourseFilterLLM
+from showcase.course.infrastructure.config.course_config import (
+    FilterInferenceCacheConfig,
+)
+
+
+@dataclass(frozen=True)
+class FilterInferenceCacheStats:
+    cache: CacheStats
+    saved_tokens: int  # estimated prompt and completion tokens not sent
+
+    @property
+    def hit_rate(self) -> float:
+        return self.cache.hit_rate
+
+
+@dataclass(frozen=True)
+class _Inference:
+    result: CourseFilterLLM
+    tokens: int  # estimated cost of the call that produced it
+
+
+class FilterInferenceCache:
+    """Inferred filters keyed by category set digest and normalized query.
+
+    The category set is part of the key, so renaming or adding a category
+    simply stops matching older entries. Indecisive results are kept too
+    unless ``cache_indecisive`` is off, so gibberish reaches the LLM once.
+
+    With ``persist_path`` set, entries are appended to a JSON-lines file and
+    read back on startup; entries older than ``ttl_seconds`` are dropped and
+    the file is rewritten without them. Restored entries start a fresh TTL.
+    """
+
+    def __init__(self, config: FilterInferenceCacheConfig) -> None:
+        self.enabled = config.max_entries > 0
+        self._cache_indecisive = config.cache_indecisive
+        self._prompt_tokens = config.prompt_tokens
+        self._ttl_seconds = config.ttl_seconds
+        self._path = Path(config.persist_path) if config.persist_path else None
+        self._cache = LRUCache[str, _Inference](
+            max_entries=config.max_entries,
+            max_bytes=config.max_bytes,
+            ttl_seconds=config.ttl_seconds,
+        )
+        self._saved_tokens = 0
+
+        if self.enabled and self._path is not None:
+            self._restore(self._path)
+
+    @staticmethod
+    def normalize(query: str) -> str:
+        """Lowercase and collapse whitespace, keeping the token order."""
+        return " ".join(query.lower().split())
+
+    @classmethod
+    def key(cls, query: str, categories: CategorySnapshot) -> str:
+        return f"{categories.names_digest}:{cls.normalize(query)}"
+
+    def get(self, key: str) -> CourseFilterLLM | None:
+        cached = self._cache.get(key)
+        if cached is None:
+            return None
+        self._saved_tokens += cached.tokens
+        return cached.result
+
+    async def put(
+        self, key: str, categories: CategorySnapshot, result: CourseFilterLLM
+    ) -> None:
+        if not result.is_decisive and not self._cache_indecisive:
+            return
+
+        payload = result.model_dump_json()
+        tokens = self._prompt_tokens + estimate_tokens(
+            key + categories.names_text + payload
+        )
+        if not self._store(key, _Inference(result, tokens), len(payload)):
+            return
+
+        if self._path is not None:
+            line = json.dumps(
+                {
+                    "key": key,
+                    "stored_at": time.time(),
+                    "tokens": tokens,
+                    "result": json.loads(payload),
+                },
+                ensure_ascii=False,
+            )
+            await asyncio.to_thread(self._append, self._path, line)
+
+    def stats(self) -> FilterInferenceCacheStats:
+        return FilterInferenceCacheStats(
+            cache=self._cache.stats(), saved_tokens=self._saved_tokens
+        )
+
+    def _store(self, key: str, inference: _Inference, size: int) -> bool:
+        return self._cache.put(key, inference, len(key.encode()) + size)
+
+    def _restore(self, path: Path) -> None:
+        if not path.exists():
+            return
+
+        cutoff = time.time() - self._ttl_seconds
+        kept: list[str] = []
+        for line in path.read_text(encoding="utf-8").splitlines():
+            try:
+                record = json.loads(line)
+                key, tokens = str(record["key"]), int(record["tokens"])
+                expired = record["stored_at"] < cutoff
+                result = CourseFilterLLM.model_validate(record["result"])
+            except (ValueError, KeyError, TypeError):
+                continue  # a torn or outdated line only costs one LLM call
+
+            size = len(result.model_dump_json())
+            if not expired and self._store(key, _Inference(result, tokens), size):
+                kept.append(line)
+
+        path.write_text("".join(f"{line}\n" for line in kept), encoding="utf-8")
+
+    @staticmethod
+    def _append(path: Path, line: str) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("a", encoding="utf-8") as file:
+            file.write(f"{line}\n")
+
+
+class CachedFilterInferenceService(IFilterInferenceService):
+    """Answers repeated queries from ``FilterInferenceCache``.
+
+    Results inferred while ``guard`` fell back to its non-LLM path are not
+    stored, so an outage does not leave queries marked indecisive.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        inner: IFilterInferenceService,
+        cache: FilterInferenceCache,
+        guard: LLMGuard | None = None,
+    ) -> None:
+        self._logger = logger
+        self.inner = inner
+        self.cache = cache
+        self.guard = guard
+
+    async def infer(self, query: str, categories: CategorySnapshot) -> CourseFilterLLM:
+        if not self.cache.enabled:
+            return await self.inner.infer(query, categories)
+
+        key = self.cache.key(query, categories)
+        cached = self.cache.get(key)
+        if cached is not None:
+            stats = self.cache.stats()
+            self._logger.debug(
+                "Filter served from cache",
+                extra={
+                    "service": "FilterInference",
+                    "is_decisive": cached.is_decisive,
+                    "hit_rate": round(stats.hit_rate, 3),
+                    "saved_tokens": stats.saved_tokens,
+                },
+            )
+            return cached
+
+        mark = self.guard.mark() if self.guard else 0
+        result = await self.inner.infer(query, categories)
+        if self.guard is None or not self.guard.degraded_since(mark):
+            await self.cache.put(key, categories, result)
+        return result
@@ -0,0 +1,182 @@
+"""Cache of recommendation results."""
+
+import hashlib
+import logging
+import time
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from common.infrastructure.cache import CacheStats, LRUCache
+from common.infrastructure.catalog import CatalogVersion
+from common.infrastructure.services.llama_index.guard import LLMGuard
+from pydantic import BaseModel
+from showcase.course.application.interfaces.repositories import ICourseReadRepository
+from showcase.course.application.interfaces.services.recommendation_service import (
+    GetRecommendationsDTO,
+    IRecommendationService,
+    RecommendationNotice,
+    RecommendationsDTO,
+)
+from showcase.course.infrastructure.config.course_config import (
+    RecommendationCacheConfig,
+)
+
+
+class CachedRecommendation(BaseModel):
+    """What is kept of a recommendation: ranked IDs, never course data."""
+
+    course_ids: list[UUID]
+    notices: list[RecommendationNotice]
+    ranking_weak: bool
+    skip: int
+
+    @classmethod
+    def from_result(cls, result: RecommendationsDTO) -> "CachedRecommendation":
+        return cls(
+            course_ids=[course.course_id for course in result.courses],
+            notices=result.notices,
+            ranking_weak=RecommendationNotice.RANKING_WEAK in result.notices,
+            skip=result.skip,
+        )
+
+
+class IRecommendationCacheBackend(ABC):
+    """Key/value store behind ``RecommendationCache``.
+
+    Values are JSON strings, so a store shared between processes can be
+    plugged in. Implementations expire entries on their own TTL.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> str | None: ...
+
+    @abstractmethod
+    async def set(self, key: str, value: str) -> None: ...
+
+
+class InMemoryRecommendationCacheBackend(IRecommendationCacheBackend):
+    """Per-process LRU/TTL backend."""
+
+    def __init__(self, config: RecommendationCacheConfig) -> None:
+        self._cache = LRUCache[str, str](
+            max_entries=config.max_entries,
+            max_bytes=config.max_bytes,
+            ttl_seconds=config.ttl_seconds,
+        )
+
+    async def get(self, key: str) -> str | None:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: str) -> None:
+        self._cache.put(key, value, len(value.encode()))
+
+    def stats(self) -> CacheStats:
+        return self._cache.stats()
+
+
+class RecommendationCache:
+    """Recommendations keyed by catalog version and request.
+
+    The request part is the normalized query, limit, skip and ranking mode.
+
+    A catalog change moves the version, so older entries are never read
+    again and age out of the backend. Take the key before computing a
+    result: if the catalog changes meanwhile, the result lands under the
+    old version.
+
+    ``CatalogVersion`` is per process, as is the TTL-bounded staleness of
+    the other course caches; with a shared backend, processes only share
+    entries while their versions agree.
+    """
+
+    def __init__(
+        self,
+        config: RecommendationCacheConfig,
+        catalog_version: CatalogVersion,
+        backend: IRecommendationCacheBackend,
+    ) -> None:
+        self.enabled = config.max_entries > 0
+        self._catalog_version = catalog_version
+        self._backend = backend
+
+    @staticmethod
+    def normalize(query: str) -> str:
+        """Lowercase and collapse whitespace, keeping the token order."""
+        return " ".join(query.lower().split())
+
+    def key(self, dto: GetRecommendationsDTO) -> str:
+        request = "\x1f".join(
+            [self.normalize(dto.query), str(dto.limit), str(dto.skip), dto.ranking]
+        )
+        digest = hashlib.sha256(request.encode()).hexdigest()
+        return f"recommendations:{self._catalog_version.value}:{digest}"
+
+    async def get(self, key: str) -> CachedRecommendation | None:
+        value = await self._backend.get(key)
+        if value is None:
+            return None
+        return CachedRecommendation.model_validate_json(value)
+
+    async def put(self, key: str, entry: CachedRecommendation) -> None:
+        await self._backend.set(key, entry.model_dump_json())
+
+
+class CachedRecommendationService(IRecommendationService):
+    """Serves repeated recommendation queries without calling the LLM.
+
+    Cached entries only hold course IDs, which are hydrated through the
+    read repository so prices and statuses stay current. Courses removed
+    since are dropped from the result.
+
+    Degraded results, where a stage timed out or ``guard`` fell back to its
+    non-LLM path, are returned but not stored.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        inner: IRecommendationService,
+        cache: RecommendationCache,
+        course_repository: ICourseReadRepository,
+        guard: LLMGuard | None = None,
+    ) -> None:
+        self._logger = logger
+        self.inner = inner
+        self.cache = cache
+        self.course_repository = course_repository
+        self.guard = guard
+
+    async def recommend(self, dto: GetRecommendationsDTO) -> RecommendationsDTO:
+        if not self.cache.enabled:
+            return await self.inner.recommend(dto)
+
+        started = time.perf_counter()
+        key = self.cache.key(dto)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            courses = await self.course_repository.get_by_ids(cached.course_ids)
+            elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+            self._logger.info(
+                "Recommendation served from cache",
+                extra={
+                    "action": "recommend",
+                    "query": dto.query[:200],
+                    "courses_count": len(courses),
+                    "elapsed_ms": elapsed_ms,
+                },
+            )
+            return RecommendationsDTO(
+                notices=cached.notices,
+                courses=courses,
+                skip=cached.skip,
+                stage_timings_ms={"cache": elapsed_ms, "total": elapsed_ms},
+            )
+
+        mark = self.guard.mark() if self.guard else 0
+        result = await self.inner.recommend(dto)
+        degraded = RecommendationNotice.STAGE_TIMED_OUT in result.notices or (
+            self.guard is not None and self.guard.degraded_since(mark)
+        )
+        if not degraded:
+            await self.cache.put(key, CachedRecommendation.from_result(result))
+        return result
@@ -0,0 +1,120 @@
+from enum import Enum
+
+from pydantic import BaseModel
+
+
+class CourseReadSource(str, Enum):
+    ORM = "orm"  # normalized tables hydrated through the ORM
+    CARDS = "cards"  # denormalized ``course_cards`` projection
+
+
+class CourseCacheConfig(BaseModel):
+    max_entries: int = 1000  # 0 disables the cache
+    max_bytes: int = 32 * 1024 * 1024
+    ttl_seconds: float = 300
+
+
+class CourseSearchCacheConfig(BaseModel):
+    max_entries: int = 500  # 0 disables the cache
+    max_results: int = 200  # ranked matches kept per query
+    max_bytes: int = 8 * 1024 * 1024
+    ttl_seconds: float = 600
+
+
+class CourseFacetsCacheConfig(BaseModel):
+    max_entries: int = 1000  # 0 disables the cache
+    max_bytes: int = 8 * 1024 * 1024
+    ttl_seconds: float = 30
+
+
+class RecommendationCacheConfig(BaseModel):
+    max_entries: int = 2000  # 0 disables the cache
+    max_bytes: int = 4 * 1024 * 1024
+    ttl_seconds: float = 900
+
+
+class FilterInferenceCacheConfig(BaseModel):
+    max_entries: int = 5000  # 0 disables the cache
+    max_bytes: int = 4 * 1024 * 1024
+    ttl_seconds: float = 7 * 24 * 3600
+    cache_indecisive: bool = True  # remember queries judged meaningless
+    persist_path: str | None = None  # JSON-lines file kept across restarts
+    prompt_tokens: int = 450  # fixed prompt size, for saved-token estimates
+
+
+class RecommendationTimeoutsConfig(BaseModel):
+    # Seconds per recommendation stage
+    categories: float = 5
+    inference: float = 30
+    retrieval: float = 5
+    fallback: float = 5
+    ranking: float = 60
+
+
+class CoalescingConfig(BaseModel):
+    # Identical concurrent requests share one computation
+    recommendations: bool = True
+    search: bool = True
+    course_by_id: bool = True
+
+
+class CourseVectorIndexConfig(BaseModel):
+    # Memory-mapped .npy files; None vectorizes candidates per request.
+    # Not named "path", which the PATH environment variable would override
+    directory: str | None = "data/course_vectors"
+    dimensions: int = 4096  # hashed term buckets
+    top_k: int = 12  # candidates passed on to LLM ranking; 0 disables
+
+
+class FilterRulesConfig(BaseModel):
+    # Plain queries are parsed locally instead of by the LLM
+    enabled: bool = True
+    # Extra phrases per category name, e.g. {"Анализ данных": ["data science"]}
+    synonyms: dict[str, list[str]] = {}
+
+
+class FallbackRankingConfig(BaseModel):
+    # Fallback courses are ranked in the background once per catalog version
+    enabled: bool = True
+    pool_size: int = 25  # first courses of the catalog that get ranked
+    refresh_interval_seconds: float = 30
+    # Re-ranked this often anyway: other processes' writes leave no version
+    max_age_seconds: float = 600
+    shuffle_tier_size: int = 5  # shuffled within tiers of ranks; 0 keeps order
+
+
+class RecommendationJobsConfig(BaseModel):
+    # Submit-and-poll recommendations computed by in-process workers
+    job_workers: int = 4  # recommendations computed at once
+    max_queued_jobs: int = 200  # submissions are refused past it
+    max_active_jobs_per_submitter: int = 3  # unfinished, per user or address
+    max_wait_seconds: float = 30  # longest long-poll
+    poll_interval_seconds: float = 0.5  # re-reads of jobs run elsewhere
+    # Job states, finished ones included; finished jobs expire after the TTL
+    max_entries: int = 10000
+    ttl_seconds: float = 600
+
+
+class RankingPromptConfig(BaseModel):
+    token_budget: int = 4000  # estimated tokens for the course table
+    # Rendered course rows, keyed by course ID and update time
+    cache_max_entries: int = 5000
+    cache_ttl_seconds: float = 3600
+
+
+class CourseConfig(BaseModel):
+    read_source: CourseReadSource = CourseReadSource.ORM
+    cache: CourseCacheConfig = CourseCacheConfig()
+    search_cache: CourseSearchCacheConfig = CourseSearchCacheConfig()
+    facets_cache: CourseFacetsCacheConfig = CourseFacetsCacheConfig()
+    recommendation_cache: RecommendationCacheConfig = RecommendationCacheConfig()
+    filter_inference_cache: FilterInferenceCacheConfig = FilterInferenceCacheConfig()
+    recommendation_timeouts: RecommendationTimeoutsConfig = (
+        RecommendationTimeoutsConfig()
+    )
+    vector_index: CourseVectorIndexConfig = CourseVectorIndexConfig()
+    ranking_prompt: RankingPromptConfig = RankingPromptConfig()
+    filter_rules: FilterRulesConfig = FilterRulesConfig()
+    fallback_ranking: FallbackRankingConfig = FallbackRankingConfig()
+    coalescing: CoalescingConfig = CoalescingConfig()
+    recommendation_jobs: RecommendationJobsConfig = RecommendationJobsConfig()
@@ -1,8 +1,17 @@
 """Course mappers."""
 
+from showcase.course.infrastructure.database.postgres.sqlalchemy.mappers.course_card_mapper import (
+    CourseCardMapper,
+)
+from showcase.course.infrastructure.database.postgres.sqlalchemy.mappers.course_facets_mapper import (
+    CourseFacetsMapper,
+)
 from showcase.course.infrastructure.database.postgres.sqlalchemy.mappers.course_read_mapper import (
     CourseReadMapper,
 )
+from showcase.course.infrastructure.database.postgres.sqlalchemy.mappers.course_summary_mapper import (
+    CourseSummaryMapper,
+)
 from showcase.course.infrastructure.database.postgres.sqlalchemy.mappers.skill_mapper import (
     SkillReadMapper,
 )
@@ -11,4 +20,11 @@ from showcase.course.infrastructure.database.postgres.sqlalchemy.mappers.tag_map
 )
 
 
-__all__ = ["CourseReadMapper", "SkillReadMapper", "TagReadMapper"]
+__all__ = [
+    "CourseCardMapper",
+    "CourseFacetsMapper",
+    "CourseReadMapper",
+    "CourseSummaryMapper",
+    "SkillReadMapper",
+    "TagReadMapper",
+]
@@ -0,0 +1,95 @@
+"""Course card mapper implementation."""
+
+from typing import Any
+from uuid import UUID
+
+from showcase.category.application.read_models.category_read_model import (
+    CategoryReadModel,
+)
+from showcase.course.application.read_models.course_read_model import (
+    CourseReadModel,
+    CourseSectionReadModel,
+)
+from showcase.course.application.read_models.skill_read_model import SkillReadModel
+from showcase.course.infrastructure.database.postgres.sqlalchemy.models import (
+    CourseCardBase,
+)
+from showcase.lecturer.application.read_models.lecturer_read_model import (
+    LecturerReadModel,
+)
+
+
+class CourseCardMapper:
+    """Maps course card rows to read models."""
+
+    @staticmethod
+    def category_to_read_model(data: dict[str, Any]) -> CategoryReadModel:
+        return CategoryReadModel(
+            category_id=UUID(data["category_id"]),
+            name=data["name"],
+            description=data["description"],
+        )
+
+    @staticmethod
+    def skill_to_read_model(data: dict[str, Any]) -> SkillReadModel:
+        return SkillReadModel(
+            skill_id=UUID(data["skill_id"]),
+            name=data["name"],
+            description=data["description"],
+        )
+
+    @staticmethod
+    def lecturer_to_read_model(data: dict[str, Any]) -> LecturerReadModel:
+        return LecturerReadModel(
+            lecturer_id=UUID(data["lecturer_id"]),
+            name=data["name"],
+            position=data["position"],
+            bio=data["bio"],
+            photo_url=data["photo_url"],
+            competencies=data["competencies"],
+        )
+
+    @staticmethod
+    def section_to_read_model(data: dict[str, Any]) -> CourseSectionReadModel:
+        return CourseSectionReadModel(
+            section_id=UUID(data["section_id"]),
+            name=data["name"],
+            description=data["description"],
+            order_num=data["order_num"],
+            hours=data["hours"],
+        )
+
+    @staticmethod
+    def to_read_model(model: CourseCardBase) -> CourseReadModel:
+        """Map a card to the same read model the normalized tables produce."""
+        return CourseReadModel(
+            course_id=model.course_id,
+            name=model.name,
+            description=model.description,
+            format=model.format,
+            education_format=model.education_format,
+            duration_hours=model.duration_hours,
+            cost=model.cost,
+            discounted_cost=model.discounted_cost,
+            start_date=model.start_date,
+            end_date=model.end_date,
+            certificate_type=model.certificate_type,
+            status=model.status,
+            is_published=model.is_published,
+            locations=model.locations,
+            categories=[
+                CourseCardMapper.category_to_read_model(c) for c in model.categories
+            ],
+            tags=list(model.tags),
+            acquired_skills=[
+                CourseCardMapper.skill_to_read_model(s) for s in model.acquired_skills
+            ],
+            lecturers=[
+                CourseCardMapper.lecturer_to_read_model(lec) for lec in model.lecturers
+            ],
+            sections=[
+                CourseCardMapper.section_to_read_model(s) for s in model.sections
+            ],
+            created_at=model.course_created_at,
+            updated_at=model.course_updated_at,
+        )
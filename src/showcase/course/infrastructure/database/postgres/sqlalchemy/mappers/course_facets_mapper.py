@@ -0,0 +1,114 @@
+"""Course facets mapper implementation."""
+
+from collections.abc import Iterable
+from enum import Enum
+from typing import Any, ClassVar
+
+from showcase.course.application.read_models.course_facets_read_model import (
+    CategoryFacetCount,
+    CourseFacets,
+    FacetCount,
+)
+from showcase.course.domain.value_objects import (
+    CourseStatus,
+    EducationFormat,
+    Format,
+)
+from sqlalchemy import (
+    CTE,
+    ColumnElement,
+    Row,
+    Select,
+    String,
+    case,
+    cast,
+    func,
+    literal,
+    null,
+    select,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+
+
+class CourseFacetsMapper:
+    """Builds and maps the ``(facet, value, ref, count)`` rows of facet queries.
+
+    Both read repositories select the filtered courses into a CTE exposing
+    ``format``, ``education_format`` and ``status``, count those with
+    ``scalar_counts`` and ``UNION ALL`` their own ``category`` and ``tag``
+    counts built with ``counts``.
+    """
+
+    # Enum columns are stored by member name and reported by value
+    SCALAR_FACETS: ClassVar[dict[str, type[Enum]]] = {
+        "format": Format,
+        "education_format": EducationFormat,
+        "status": CourseStatus,
+    }
+
+    @staticmethod
+    def counts(facet: str, value: Any, ref: Any = None) -> Select[Any]:
+        """Select one facet row per group: value, optional ID and row count."""
+        return select(
+            literal(facet).label("facet"),
+            cast(value, String).label("value"),
+            cast(ref if ref is not None else null(), PGUUID).label("ref"),
+            func.count().label("count"),
+        )
+
+    @classmethod
+    def scalar_counts(cls, matched: CTE) -> Select[Any]:
+        """Count every scalar facet and the total in one GROUPING SETS pass."""
+        columns = [matched.c[name] for name in cls.SCALAR_FACETS]
+        facet: ColumnElement[str] = case(
+            *(
+                (func.grouping(column) == 0, literal(name))
+                for name, column in zip(cls.SCALAR_FACETS, columns, strict=True)
+            ),
+            else_=literal("total"),
+        )
+        return select(
+            facet.label("facet"),
+            func.coalesce(*(cast(column, String) for column in columns)).label("value"),
+            cast(null(), PGUUID).label("ref"),
+            func.count().label("count"),
+        ).group_by(
+            func.grouping_sets(*(tuple_(column) for column in columns), tuple_())
+        )
+
+    @classmethod
+    def to_read_model(cls, rows: Iterable[Row[Any]]) -> CourseFacets:
+        """Collect facet rows, most frequent values first."""
+        total = 0
+        values: dict[str, list[FacetCount]] = {
+            name: [] for name in (*cls.SCALAR_FACETS, "tag")
+        }
+        categories: list[CategoryFacetCount] = []
+
+        for facet, value, ref, count in rows:
+            if facet == "total":
+                total = count
+            elif facet == "category":
+                categories.append(
+                    CategoryFacetCount(category_id=ref, name=value, count=count)
+                )
+            elif facet in cls.SCALAR_FACETS:
+                member = cls.SCALAR_FACETS[facet][value]
+                values[facet].append(FacetCount(value=member.value, count=count))
+            else:
+                values[facet].append(FacetCount(value=value, count=count))
+
+        def ranked(counts: list[FacetCount]) -> list[FacetCount]:
+            return sorted(counts, key=lambda c: (-c.count, c.value))
+
+        return CourseFacets(
+            total=total,
+            formats=ranked(values["format"]),
+            education_formats=ranked(values["education_format"]),
+            statuses=ranked(values["status"]),
+            categories=sorted(
+                categories, key=lambda c: (-c.count, c.name, c.category_id)
+            ),
+            tags=ranked(values["tag"]),
+        )
@@ -0,0 +1,47 @@
+"""Course summary mapper implementation."""
+
+from collections.abc import Sequence
+from typing import Any
+from uuid import UUID
+
+from showcase.course.application.read_models.course_read_model import (
+    CourseSummaryReadModel,
+)
+from showcase.course.infrastructure.database.postgres.sqlalchemy.models import (
+    CourseBase,
+    CourseCardBase,
+)
+from sqlalchemy import ColumnElement
+
+
+class CourseSummaryMapper:
+    """Maps selected summary columns to summary read models.
+
+    ``courses`` and ``course_cards`` share the column names, so both read
+    repositories select the same fields.
+    """
+
+    FIELDS = (
+        "name",
+        "format",
+        "duration_hours",
+        "cost",
+        "discounted_cost",
+        "start_date",
+        "status",
+    )
+
+    @classmethod
+    def columns(
+        cls, model: type[CourseBase] | type[CourseCardBase]
+    ) -> list[ColumnElement[Any]]:
+        """Columns to select, in the order ``to_read_model`` expects."""
+        return [getattr(model, name).expression for name in cls.FIELDS]
+
+    @classmethod
+    def to_read_model(
+        cls, course_id: UUID, values: Sequence[Any]
+    ) -> CourseSummaryReadModel:
+        return CourseSummaryReadModel(
+            course_id=course_id, **dict(zip(cls.FIELDS, values, strict=True))
+        )
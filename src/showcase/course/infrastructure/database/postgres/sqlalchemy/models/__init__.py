@@ -8,12 +8,14 @@ from .course import (
     CourseSkillBase,
     CourseTagBase,
 )
+from .course_card import CourseCardBase
 from .skill import SkillBase
 from .tag import TagBase
 
 
 __all__ = [
     "CourseBase",
+    "CourseCardBase",
     "CourseCategoryBase",
     "CourseLecturerBase",
     "CourseSectionBase",
@@ -78,6 +78,8 @@ class CourseBase(Base):
         ARRAY[str](String(255)), nullable=False, server_default=text("'{}'")
     )
 
+    # Maintained by database triggers (migration b3f19d6c8e27) from the name,
+    # description, sections and acquired skills
     search_vector: Mapped[str] = mapped_column(
         TSVECTOR, nullable=False, server_default=text("''::tsvector")
     )
@@ -110,6 +112,7 @@ class CourseSectionBase(Base):
     """SQLAlchemy model for Course Section."""
 
     __tablename__ = "course_sections"
+    __table_args__ = (Index("ix_course_sections_course_id", "course_id"),)
 
     section_id: Mapped[UUID] = mapped_column(PGUUID, primary_key=True, default=uuid4)
     course_id: Mapped[UUID] = mapped_column(
@@ -155,6 +158,7 @@ class CourseSkillBase(Base):
     """SQLAlchemy model for Course-Skill association."""
 
     __tablename__ = "course_skills"
+    __table_args__ = (Index("ix_course_skills_skill_id", "skill_id"),)
 
     course_id: Mapped[UUID] = mapped_column(
         ForeignKey("courses.course_id", ondelete="CASCADE"),
@@ -0,0 +1,122 @@
+"""SQLAlchemy model for the denormalized course card projection."""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from common.infrastructure.database.postgres.sqlalchemy.models import Base
+from showcase.course.domain.value_objects import (
+    CertificateType,
+    CourseStatus,
+    EducationFormat,
+    Format,
+)
+from sqlalchemy import (
+    Boolean,
+    DateTime as SQLDateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    Text,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR, UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class CourseCardBase(Base):
+    """One row per course with its collections pre-aggregated as JSONB.
+
+    Maintained by ``CourseCardProjector`` in the transaction of every catalog
+    write; ``version`` is bumped whenever the card content changes.
+    """
+
+    __tablename__ = "course_cards"
+    __table_args__ = (
+        Index("ix_course_cards_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_course_cards_categories",
+            "categories",
+            postgresql_using="gin",
+            postgresql_ops={"categories": "jsonb_path_ops"},
+        ),
+        Index(
+            "ix_course_cards_tags",
+            "tags",
+            postgresql_using="gin",
+            postgresql_ops={"tags": "jsonb_path_ops"},
+        ),
+        Index(
+            "ix_course_cards_start_date", "start_date", "duration_hours", "course_id"
+        ),
+    )
+
+    course_id: Mapped[UUID] = mapped_column(
+        PGUUID,
+        ForeignKey("courses.course_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    description: Mapped[str | None] = mapped_column(Text)
+    format: Mapped[Format] = mapped_column(Enum(Format), nullable=False)
+    education_format: Mapped[EducationFormat] = mapped_column(
+        Enum(EducationFormat), nullable=False
+    )
+    duration_hours: Mapped[int] = mapped_column(Integer, nullable=False)
+    cost: Mapped[Decimal] = mapped_column(Numeric[Decimal](10, 2), nullable=False)
+    discounted_cost: Mapped[Decimal | None] = mapped_column(
+        Numeric[Decimal](10, 2), nullable=True
+    )
+    start_date: Mapped[datetime | None] = mapped_column(
+        SQLDateTime(timezone=True), nullable=True
+    )
+    end_date: Mapped[datetime | None] = mapped_column(
+        SQLDateTime(timezone=True), nullable=True
+    )
+    certificate_type: Mapped[CertificateType] = mapped_column(
+        Enum(CertificateType), nullable=False
+    )
+    status: Mapped[CourseStatus] = mapped_column(Enum(CourseStatus), nullable=False)
+    is_published: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    locations: Mapped[list[str]] = mapped_column(
+        ARRAY[str](String(255)), nullable=False, server_default=text("'{}'")
+    )
+
+    # [{category_id, name, description}, ...] ordered by name
+    categories: Mapped[list[dict[str, Any]]] = mapped_column(
+        JSONB, nullable=False, server_default=text("'[]'::jsonb")
+    )
+    # [name, ...] ordered by name
+    tags: Mapped[list[str]] = mapped_column(
+        JSONB, nullable=False, server_default=text("'[]'::jsonb")
+    )
+    # [{skill_id, name, description}, ...] ordered by name
+    acquired_skills: Mapped[list[dict[str, Any]]] = mapped_column(
+        JSONB, nullable=False, server_default=text("'[]'::jsonb")
+    )
+    # [{lecturer_id, name, position, bio, photo_url, competencies}, ...]
+    lecturers: Mapped[list[dict[str, Any]]] = mapped_column(
+        JSONB, nullable=False, server_default=text("'[]'::jsonb")
+    )
+    # [{section_id, name, description, order_num, hours}, ...] by order_num
+    sections: Mapped[list[dict[str, Any]]] = mapped_column(
+        JSONB, nullable=False, server_default=text("'[]'::jsonb")
+    )
+
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR, nullable=False, server_default=text("''::tsvector")
+    )
+
+    course_created_at: Mapped[datetime] = mapped_column(
+        SQLDateTime(timezone=True), nullable=False
+    )
+    course_updated_at: Mapped[datetime] = mapped_column(
+        SQLDateTime(timezone=True), nullable=False
+    )
+    version: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default=text("1")
+    )
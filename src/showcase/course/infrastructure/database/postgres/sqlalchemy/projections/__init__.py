@@ -0,0 +1,9 @@
+"""Course read-side projections."""
+
+from showcase.course.infrastructure.database.postgres.sqlalchemy.projections.course_card_projector import (
+    CourseCardDrift,
+    CourseCardProjector,
+)
+
+
+__all__ = ["CourseCardDrift", "CourseCardProjector"]
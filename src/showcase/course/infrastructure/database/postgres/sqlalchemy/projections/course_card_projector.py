@@ -0,0 +1,342 @@
+"""Course card projection maintained from the normalized catalog tables."""
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any, cast
+from uuid import UUID
+
+from common.application.interfaces.catalog.catalog_change_listener import (
+    CatalogChange,
+    CatalogEntity,
+    ICatalogChangeListener,
+)
+from common.infrastructure.database.postgres.sqlalchemy.executor import QueryExecutor
+from showcase.category.infrastructure.database.postgres.sqlalchemy.models import (
+    CategoryBase,
+)
+from showcase.course.infrastructure.database.postgres.sqlalchemy.models import (
+    CourseBase,
+    CourseCardBase,
+    CourseCategoryBase,
+    CourseLecturerBase,
+    CourseSectionBase,
+    CourseSkillBase,
+    CourseTagBase,
+    SkillBase,
+    TagBase,
+)
+from showcase.lecturer.infrastructure.database.postgres.sqlalchemy.models import (
+    LecturerBase,
+)
+from sqlalchemy import (
+    ColumnElement,
+    ColumnExpressionArgument,
+    CompoundSelect,
+    CursorResult,
+    Select,
+    func,
+    literal_column,
+    or_,
+    select,
+    true,
+    union,
+)
+from sqlalchemy.dialects.postgresql import JSONB, Insert, aggregate_order_by, insert
+
+
+@dataclass
+class CourseCardDrift:
+    """Courses whose card is absent or differs from the normalized tables."""
+
+    missing: list[UUID] = field(default_factory=list[UUID])
+    stale: list[UUID] = field(default_factory=list[UUID])
+
+    @property
+    def course_ids(self) -> list[UUID]:
+        return [*self.missing, *self.stale]
+
+
+class CourseCardProjector(ICatalogChangeListener):
+    """Keeps ``course_cards`` in sync with courses and their related entities.
+
+    Cards are written with a single set-based ``INSERT ... SELECT ... ON
+    CONFLICT DO UPDATE``; a card's ``version`` only moves when its content
+    actually changes. Called by the write repositories inside their
+    transaction, so a card never disagrees with committed data.
+    """
+
+    # Card columns compared to detect changes, in projection order.
+    CONTENT_COLUMNS = (
+        "name",
+        "description",
+        "format",
+        "education_format",
+        "duration_hours",
+        "cost",
+        "discounted_cost",
+        "start_date",
+        "end_date",
+        "certificate_type",
+        "status",
+        "is_published",
+        "locations",
+        "categories",
+        "tags",
+        "acquired_skills",
+        "lecturers",
+        "sections",
+        "search_vector",
+        "course_created_at",
+        "course_updated_at",
+    )
+
+    def __init__(self, executor: QueryExecutor) -> None:
+        self.executor = executor
+
+    async def on_change(self, change: CatalogChange) -> None:
+        await self.refresh(self._affected_courses(change))
+
+    async def refresh(
+        self,
+        course_ids: Sequence[UUID] | Select[tuple[UUID]] | CompoundSelect[tuple[UUID]],
+    ) -> int:
+        """Project the cards of ``course_ids`` and return how many changed."""
+        return await self._upsert(CourseBase.course_id.in_(course_ids))
+
+    async def rebuild(self) -> int:
+        """Project every course and return how many cards changed."""
+        return await self._upsert(true())
+
+    async def find_drift(self, limit: int = 1000) -> CourseCardDrift:
+        """Compare cards with a fresh projection of up to ``limit`` courses."""
+        projected = self.projection().subquery("projected")
+        cards = CourseCardBase.__table__
+        card = cards.c
+
+        stmt = (
+            select(projected.c.course_id, card.course_id.is_(None).label("missing"))
+            .outerjoin(cards, card.course_id == projected.c.course_id)
+            .where(or_(card.course_id.is_(None), self._differs(card, projected.c)))
+            .order_by(projected.c.course_id)
+            .limit(limit)
+        )
+
+        drift = CourseCardDrift()
+        for course_id, missing in await self.executor.execute_many(stmt):
+            (drift.missing if missing else drift.stale).append(course_id)
+        return drift
+
+    @classmethod
+    def projection(cls) -> Select[Any]:
+        """Card rows computed from the normalized tables, one per course."""
+        categories = (
+            select(
+                cls._json_agg(
+                    cls._json_object(
+                        category_id=CategoryBase.category_id,
+                        name=CategoryBase.name,
+                        description=CategoryBase.description,
+                    ),
+                    CategoryBase.name,
+                    CategoryBase.category_id,
+                )
+            )
+            .select_from(CourseCategoryBase)
+            .join(
+                CategoryBase, CategoryBase.category_id == CourseCategoryBase.category_id
+            )
+            .where(CourseCategoryBase.course_id == CourseBase.course_id)
+            .scalar_subquery()
+        )
+        tags = (
+            select(cls._json_agg(TagBase.name, TagBase.name))
+            .select_from(CourseTagBase)
+            .join(TagBase, TagBase.tag_id == CourseTagBase.tag_id)
+            .where(CourseTagBase.course_id == CourseBase.course_id)
+            .scalar_subquery()
+        )
+        skills = (
+            select(
+                cls._json_agg(
+                    cls._json_object(
+                        skill_id=SkillBase.skill_id,
+                        name=SkillBase.name,
+                        description=SkillBase.description,
+                    ),
+                    SkillBase.name,
+                    SkillBase.skill_id,
+                )
+            )
+            .select_from(CourseSkillBase)
+            .join(SkillBase, SkillBase.skill_id == CourseSkillBase.skill_id)
+            .where(CourseSkillBase.course_id == CourseBase.course_id)
+            .scalar_subquery()
+        )
+        lecturers = (
+            select(
+                cls._json_agg(
+                    cls._json_object(
+                        lecturer_id=LecturerBase.lecturer_id,
+                        name=LecturerBase.name,
+                        position=LecturerBase.position,
+                        bio=LecturerBase.bio,
+                        photo_url=LecturerBase.photo_url,
+                        competencies=LecturerBase.competencies,
+                    ),
+                    LecturerBase.name,
+                    LecturerBase.lecturer_id,
+                )
+            )
+            .select_from(CourseLecturerBase)
+            .join(
+                LecturerBase,
+                LecturerBase.lecturer_id == CourseLecturerBase.lecturer_id,
+            )
+            .where(CourseLecturerBase.course_id == CourseBase.course_id)
+            .scalar_subquery()
+        )
+        sections = (
+            select(
+                cls._json_agg(
+                    cls._json_object(
+                        section_id=CourseSectionBase.section_id,
+                        name=CourseSectionBase.name,
+                        description=CourseSectionBase.description,
+                        order_num=CourseSectionBase.order_num,
+                        hours=CourseSectionBase.hours,
+                    ),
+                    CourseSectionBase.order_num,
+                    CourseSectionBase.section_id,
+                )
+            )
+            .where(CourseSectionBase.course_id == CourseBase.course_id)
+            .scalar_subquery()
+        )
+
+        return select(
+            CourseBase.course_id,
+            CourseBase.name,
+            CourseBase.description,
+            CourseBase.format,
+            CourseBase.education_format,
+            CourseBase.duration_hours,
+            CourseBase.cost,
+            CourseBase.discounted_cost,
+            CourseBase.start_date,
+            CourseBase.end_date,
+            CourseBase.certificate_type,
+            CourseBase.status,
+            CourseBase.is_published,
+            CourseBase.locations,
+            categories.label("categories"),
+            tags.label("tags"),
+            skills.label("acquired_skills"),
+            lecturers.label("lecturers"),
+            sections.label("sections"),
+            CourseBase.search_vector,
+            CourseBase.created_at.label("course_created_at"),
+            CourseBase.updated_at.label("course_updated_at"),
+        )
+
+    @classmethod
+    def upsert(cls, condition: ColumnElement[bool] | None = None) -> Insert:
+        """``INSERT ... ON CONFLICT`` projecting the courses matching ``condition``.
+
+        Also run by the migration that creates ``course_cards``, so the
+        backfill and the live projection share one definition of a card.
+        """
+        projection = cls.projection()
+        if condition is not None:
+            projection = projection.where(condition)
+
+        stmt = insert(CourseCardBase).from_select(
+            ["course_id", *cls.CONTENT_COLUMNS], projection
+        )
+        return stmt.on_conflict_do_update(
+            index_elements=[CourseCardBase.course_id],
+            set_={
+                **{name: stmt.excluded[name] for name in cls.CONTENT_COLUMNS},
+                "version": CourseCardBase.version + 1,
+                "updated_at": func.now(),
+            },
+            where=cls._differs(CourseCardBase.__table__.c, stmt.excluded),
+        )
+
+    async def _upsert(self, condition: ColumnElement[bool]) -> int:
+        # DML without RETURNING yields a cursor result, which has a row count
+        stmt = self.upsert(condition)
+        result = cast(CursorResult[Any], await self.executor.execute(stmt))
+        return result.rowcount
+
+    def _affected_courses(
+        self, change: CatalogChange
+    ) -> Select[tuple[UUID]] | CompoundSelect[tuple[UUID]]:
+        """Courses whose card mentions the changed entity.
+
+        Cards are matched by ID as well as associations, so the cards of
+        courses that lost the entity through a cascading delete are found too.
+        """
+        entity_id = change.entity_id
+        match change.entity:
+            case CatalogEntity.COURSE:
+                return select(CourseBase.course_id).where(
+                    CourseBase.course_id == entity_id
+                )
+            case CatalogEntity.CATEGORY:
+                return union(
+                    select(CourseCategoryBase.course_id).where(
+                        CourseCategoryBase.category_id == entity_id
+                    ),
+                    self._cards_containing("categories", category_id=entity_id),
+                )
+            case CatalogEntity.SKILL:
+                return union(
+                    select(CourseSkillBase.course_id).where(
+                        CourseSkillBase.skill_id == entity_id
+                    ),
+                    self._cards_containing("acquired_skills", skill_id=entity_id),
+                )
+            case CatalogEntity.LECTURER:
+                return union(
+                    select(CourseLecturerBase.course_id).where(
+                        CourseLecturerBase.lecturer_id == entity_id
+                    ),
+                    self._cards_containing("lecturers", lecturer_id=entity_id),
+                )
+            case CatalogEntity.TAG:
+                return select(CourseTagBase.course_id).where(
+                    CourseTagBase.tag_id == entity_id
+                )
+
+    @staticmethod
+    def _cards_containing(column: str, **key: UUID) -> Select[tuple[UUID]]:
+        document = [{name: str(value) for name, value in key.items()}]
+        return select(CourseCardBase.course_id).where(
+            getattr(CourseCardBase, column).contains(document)
+        )
+
+    @classmethod
+    def _differs(cls, target: Any, source: Any) -> ColumnElement[bool]:
+        return or_(
+            *(
+                target[name].is_distinct_from(source[name])
+                for name in cls.CONTENT_COLUMNS
+            )
+        )
+
+    @staticmethod
+    def _json_object(**fields: ColumnExpressionArgument[Any]) -> ColumnElement[Any]:
+        args: list[ColumnExpressionArgument[Any]] = []
+        for name, value in fields.items():
+            args.extend((literal_column(f"'{name}'"), value))
+        return func.jsonb_build_object(*args, type_=JSONB)
+
+    @staticmethod
+    def _json_agg(
+        value: ColumnExpressionArgument[Any], *order_by: ColumnExpressionArgument[Any]
+    ) -> ColumnElement[Any]:
+        return func.coalesce(
+            func.jsonb_agg(aggregate_order_by(value, *order_by), type_=JSONB),
+            literal_column("'[]'::jsonb"),
+            type_=JSONB,
+        )
@@ -1,5 +1,8 @@
 """Course repositories."""
 
+from showcase.course.infrastructure.database.postgres.sqlalchemy.repositories.course_card_read_repository import (
+    CourseCardReadRepository,
+)
 from showcase.course.infrastructure.database.postgres.sqlalchemy.repositories.course_read_repository import (
     CourseReadRepository,
 )
@@ -21,6 +24,7 @@ from showcase.course.infrastructure.database.postgres.sqlalchemy.repositories.ta
 
 
 __all__ = [
+    "CourseCardReadRepository",
     "CourseReadRepository",
     "CourseRepository",
     "SkillReadRepository",
@@ -0,0 +1,137 @@
+"""Course read repository backed by the ``course_cards`` projection."""
+
+from collections.abc import Sequence
+from typing import Any
+from uuid import UUID
+
+from common.infrastructure.database.postgres.sqlalchemy.executor import (
+    QueryExecutor,
+)
+from common.infrastructure.database.postgres.sqlalchemy.keyset import SortKey
+from showcase.course.application.read_models.course_read_model import (
+    CoursePage,
+    CourseReadModel,
+)
+from showcase.course.infrastructure.database.postgres.sqlalchemy.mappers import (
+    CourseCardMapper,
+    CourseFacetsMapper,
+)
+from showcase.course.infrastructure.database.postgres.sqlalchemy.models import (
+    CourseCardBase,
+)
+from showcase.course.infrastructure.database.postgres.sqlalchemy.repositories.course_table_read_repository import (
+    CourseTableReadRepository,
+)
+from sqlalchemy import (
+    CTE,
+    ColumnElement,
+    Select,
+    String,
+    column,
+    func,
+    or_,
+    select,
+    true,
+)
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+
+
+class CourseCardReadRepository(CourseTableReadRepository):
+    """Read repository for courses served from denormalized course cards.
+
+    Every query reads a single table: collections are stored on the card, so
+    there are no joins and no follow-up loads. Tag and category filters are
+    JSONB containment checks served by the GIN indexes on the card
+    collections.
+    """
+
+    def __init__(self, executor: QueryExecutor) -> None:
+        super().__init__(executor, CourseCardBase)
+
+    async def get_by_id(self, course_id: UUID) -> CourseReadModel:
+        """Get a course by ID."""
+        stmt = select(CourseCardBase).where(CourseCardBase.course_id == course_id)
+        model = await self.executor.execute_scalar_one(stmt)
+        if not model:
+            raise ValueError(f"Course with id {course_id} not found")
+        return CourseCardMapper.to_read_model(model)
+
+    async def get_by_ids(self, course_ids: Sequence[UUID]) -> list[CourseReadModel]:
+        """Get courses by ID, in the given order."""
+        if not course_ids:
+            return []
+
+        stmt = select(CourseCardBase).where(CourseCardBase.course_id.in_(course_ids))
+        models = await self.executor.execute_scalar_many(stmt)
+
+        by_id = {model.course_id: model for model in models}
+        return [
+            CourseCardMapper.to_read_model(by_id[course_id])
+            for course_id in course_ids
+            if course_id in by_id
+        ]
+
+    def _has_category_ids(self, category_ids: Sequence[UUID]) -> ColumnElement[bool]:
+        return or_(
+            *(
+                CourseCardBase.categories.contains([{"category_id": str(cid)}])
+                for cid in category_ids
+            )
+        )
+
+    def _has_category_names(self, names: Sequence[str]) -> ColumnElement[bool]:
+        return or_(
+            *(CourseCardBase.categories.contains([{"name": name}]) for name in names)
+        )
+
+    def _has_tags(self, names: Sequence[str]) -> ColumnElement[bool]:
+        return or_(*(CourseCardBase.tags.contains([name]) for name in names))
+
+    def _facet_columns(self) -> Sequence[ColumnElement[Any]]:
+        return [CourseCardBase.categories.expression, CourseCardBase.tags.expression]
+
+    def _collection_counts(self, matched: CTE) -> Sequence[Select[Any]]:
+        """Count categories and tags by unnesting the card's JSONB arrays."""
+        category = (
+            func.jsonb_to_recordset(matched.c.categories)
+            .table_valued(column("category_id", PGUUID), column("name", String))
+            .render_derived(with_types=True)
+            .lateral("category")
+        )
+        tag = (
+            func.jsonb_array_elements_text(matched.c.tags)
+            .table_valued("value")
+            .lateral("tag")
+        )
+        categories = (
+            CourseFacetsMapper.counts(
+                "category", category.c.name, category.c.category_id
+            )
+            .select_from(matched)
+            .join(category, true())
+            .group_by(category.c.category_id, category.c.name)
+        )
+        tags = (
+            CourseFacetsMapper.counts("tag", tag.c.value)
+            .select_from(matched)
+            .join(tag, true())
+            .group_by(tag.c.value)
+        )
+        return categories, tags
+
+    async def _fetch_page(
+        self,
+        conditions: Sequence[ColumnElement[bool]],
+        keys: Sequence[SortKey],
+        skip: int,
+        limit: int,
+        after: str | None,
+    ) -> CoursePage:
+        """Read a page of cards together with their sort keys."""
+        rows, next_cursor = await self._fetch_rows(
+            conditions, keys, skip, limit, after, CourseCardBase
+        )
+        return CoursePage(
+            courses=[CourseCardMapper.to_read_model(row[-1]) for row in rows],
+            next_cursor=next_cursor,
+        )
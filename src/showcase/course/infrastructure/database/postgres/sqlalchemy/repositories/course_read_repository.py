@@ -1,273 +1,151 @@
 """Course read repository implementation."""
 
-from typing import Any, cast
+from collections.abc import Sequence
+from typing import Any
 from uuid import UUID
 
 from common.infrastructure.database.postgres.sqlalchemy.executor import (
     QueryExecutor,
 )
+from common.infrastructure.database.postgres.sqlalchemy.keyset import SortKey
 from showcase.category.infrastructure.database.postgres.sqlalchemy.models.category import (
     CategoryBase,
 )
-from showcase.course.application.interfaces.repositories import ICourseReadRepository
-from showcase.course.application.interfaces.repositories.course_read_repository import (
-    CoursesFilter,
-    CourseSortField,
-    CourseSortOrder,
-    SimpleCoursesFilter,
+from showcase.course.application.read_models.course_read_model import (
+    CoursePage,
+    CourseReadModel,
 )
-from showcase.course.application.read_models.course_read_model import CourseReadModel
-from showcase.course.domain.value_objects import CourseStatus, Format
 from showcase.course.infrastructure.database.postgres.sqlalchemy.mappers import (
+    CourseFacetsMapper,
     CourseReadMapper,
 )
 from showcase.course.infrastructure.database.postgres.sqlalchemy.models import (
     CourseBase,
+    CourseCategoryBase,
+    CourseTagBase,
 )
 from showcase.course.infrastructure.database.postgres.sqlalchemy.models.tag import (
     TagBase,
 )
-from sqlalchemy import ColumnElement, func, select
-from sqlalchemy.orm import joinedload
+from showcase.course.infrastructure.database.postgres.sqlalchemy.repositories.course_table_read_repository import (
+    CourseTableReadRepository,
+)
+from sqlalchemy import CTE, ColumnElement, Select, select
+from sqlalchemy.orm import selectinload
+from sqlalchemy.sql.base import ExecutableOption
+
 
+class CourseReadRepository(CourseTableReadRepository):
+    """Read repository for courses.
 
-class CourseReadRepository(ICourseReadRepository):
-    """Read repository for courses."""
+    Tag and category filters are EXISTS semi-joins, so each course matches
+    at most once regardless of how many tags or categories it has.
+    """
 
     def __init__(self, executor: QueryExecutor) -> None:
-        self.executor = executor
+        super().__init__(executor, CourseBase)
 
-    def make_prefix_tsquery(self, query: str) -> str:
-        tokens = query.strip().split()
-        return " & ".join(f"{token}:*" for token in tokens)
+    @staticmethod
+    def relation_loaders() -> tuple[ExecutableOption, ...]:
+        """Eager loaders for course collections.
+
+        Each collection is fetched by a separate ``IN (course_id, ...)`` query
+        keyed by the page of courses, so the main query returns one row per
+        course instead of a sections x categories x tags x skills x lecturers
+        cartesian product.
+        """
+        return (
+            selectinload(CourseBase.sections),
+            selectinload(CourseBase.categories),
+            selectinload(CourseBase.tags),
+            selectinload(CourseBase.acquired_skills),
+            selectinload(CourseBase.lecturers),
+        )
 
     async def get_by_id(self, course_id: UUID) -> CourseReadModel:
         """Get a course by ID."""
         stmt = (
             select(CourseBase)
             .where(CourseBase.course_id == course_id)
-            .options(
-                joinedload(CourseBase.sections),
-                joinedload(CourseBase.categories),
-                joinedload(CourseBase.tags),
-                joinedload(CourseBase.acquired_skills),
-                joinedload(CourseBase.lecturers),
-            )
+            .options(*self.relation_loaders())
         )
         model = await self.executor.execute_scalar_one(stmt)
         if not model:
             raise ValueError(f"Course with id {course_id} not found")
         return CourseReadMapper.to_read_model(model)
 
-    async def get_all(
-        self,
-        status: CourseStatus | None = None,
-        is_published: bool | None = None,
-        category_id: UUID | None = None,
-        format: Format | None = None,
-        skip: int = 0,
-        limit: int = 100,
-    ) -> list[CourseReadModel]:
-        """Get all courses with optional filters."""
-        stmt = select(CourseBase)
+    async def get_by_ids(self, course_ids: Sequence[UUID]) -> list[CourseReadModel]:
+        """Get courses by ID, in the given order."""
+        return await self._hydrate(course_ids)
 
-        if status is not None:
-            stmt = stmt.where(CourseBase.status == status)
+    def _has_category_ids(self, category_ids: Sequence[UUID]) -> ColumnElement[bool]:
+        return CourseBase.categories.any(CategoryBase.category_id.in_(category_ids))
 
-        if is_published is not None:
-            stmt = stmt.where(CourseBase.is_published == is_published)
+    def _has_category_names(self, names: Sequence[str]) -> ColumnElement[bool]:
+        return CourseBase.categories.any(CategoryBase.name.in_(names))
 
-        if format is not None:
-            stmt = stmt.where(CourseBase.format == format)
+    def _has_tags(self, names: Sequence[str]) -> ColumnElement[bool]:
+        return CourseBase.tags.any(TagBase.name.in_(names))
 
-        if category_id is not None:
-            stmt = stmt.join(CourseBase.categories).where(
-                CategoryBase.category_id == category_id
-            )
+    def _facet_columns(self) -> Sequence[ColumnElement[Any]]:
+        return [CourseBase.course_id.expression]
 
-        stmt = (
-            stmt.options(
-                joinedload(CourseBase.sections),
-                joinedload(CourseBase.categories),
-                joinedload(CourseBase.tags),
-                joinedload(CourseBase.acquired_skills),
-                joinedload(CourseBase.lecturers),
+    def _collection_counts(self, matched: CTE) -> Sequence[Select[Any]]:
+        """Count categories and tags through their link tables."""
+        categories = (
+            CourseFacetsMapper.counts(
+                "category", CategoryBase.name, CategoryBase.category_id
             )
-            .offset(skip)
-            .limit(limit)
-        )
-
-        models = await self.executor.execute_scalar_many(stmt)
-        return [CourseReadMapper.to_read_model(model) for model in models]
-
-    async def search(
-        self, query: str, skip: int = 0, limit: int = 50
-    ) -> list[CourseReadModel]:
-        """Full-text search for courses using PostgreSQL tsvector in SELECT."""
-        vector = CourseBase.search_vector
-        ts_query = func.to_tsquery("russian", self.make_prefix_tsquery(query))
-
-        rank = func.ts_rank(vector, ts_query)
-
-        stmt = (
-            select(CourseBase)
-            .where(vector.op("@@")(ts_query))
-            .where(CourseBase.is_published.is_(True))
-            .order_by(rank.desc())
-            .options(
-                joinedload(CourseBase.sections),
-                joinedload(CourseBase.categories),
-                joinedload(CourseBase.tags),
-                joinedload(CourseBase.acquired_skills),
-                joinedload(CourseBase.lecturers),
+            .select_from(matched)
+            .join(
+                CourseCategoryBase, CourseCategoryBase.course_id == matched.c.course_id
             )
-            .offset(skip)
-            .limit(limit)
-        )
-
-        models = await self.executor.execute_scalar_many(stmt)
-        return [CourseReadMapper.to_read_model(model) for model in models]
-
-    async def filter(self, filter: SimpleCoursesFilter) -> list[CourseReadModel]:
-        """Deterministic filtering.
-
-        Returns top-N courses strictly matching filters.
-        """
-        stmt = select(CourseBase).distinct()
-
-        stmt = stmt.where(CourseBase.is_published == filter.is_published)
-
-        if filter.status is not None:
-            stmt = stmt.where(CourseBase.status == filter.status)
-
-        if filter.format is not None:
-            stmt = stmt.where(CourseBase.format == filter.format)
-
-        if filter.max_duration_hours is not None:
-            stmt = stmt.where(CourseBase.duration_hours <= filter.max_duration_hours)
-
-        if filter.certificate_required is True:
-            stmt = stmt.where(CourseBase.certificate_type.isnot(None))
-
-        if filter.categories:
-            stmt = stmt.join(CourseBase.categories).where(
-                CategoryBase.name.in_(filter.categories)
+            .join(
+                CategoryBase, CategoryBase.category_id == CourseCategoryBase.category_id
             )
-
-        stmt = stmt.order_by(
-            CourseBase.start_date.asc().nulls_last(),
-            CourseBase.duration_hours.asc(),
+            .group_by(CategoryBase.category_id, CategoryBase.name)
         )
-
-        stmt = (
-            stmt.options(
-                joinedload(CourseBase.sections),
-                joinedload(CourseBase.categories),
-                joinedload(CourseBase.tags),
-                joinedload(CourseBase.acquired_skills),
-                joinedload(CourseBase.lecturers),
-            )
-            .offset(filter.skip)
-            .limit(filter.limit)
+        tags = (
+            CourseFacetsMapper.counts("tag", TagBase.name)
+            .select_from(matched)
+            .join(CourseTagBase, CourseTagBase.course_id == matched.c.course_id)
+            .join(TagBase, TagBase.tag_id == CourseTagBase.tag_id)
+            .group_by(TagBase.name)
         )
+        return categories, tags
 
-        models = await self.executor.execute_scalar_many(stmt)
-        return [CourseReadMapper.to_read_model(model) for model in models]
-
-    async def filter_extended(self, filter: CoursesFilter) -> list[CourseReadModel]:
-        stmt = select(CourseBase).distinct()
-
-        # Base visibility filters
-        if filter.status is not None:
-            stmt = stmt.where(CourseBase.status == filter.status)
-        if filter.is_published is not None:
-            stmt = stmt.where(CourseBase.is_published == filter.is_published)
-
-        # Full-text search
-        rank = None
-        if filter.search and filter.search.strip():
-            vector = CourseBase.search_vector
-            ts_query = func.to_tsquery(
-                "russian", self.make_prefix_tsquery(filter.search)
-            )
-
-            rank = func.ts_rank(vector, ts_query)
-
-            stmt = stmt.where(vector.op("@@")(ts_query))
-
-        # Formats and education types
-        if filter.formats:
-            stmt = stmt.where(CourseBase.format.in_(filter.formats))
-        if filter.education_types:
-            stmt = stmt.where(CourseBase.education_format.in_(filter.education_types))
-
-        # Tags
-        if filter.tags:
-            stmt = stmt.join(CourseBase.tags).where(TagBase.name.in_(filter.tags))
-
-        # Category ids
-        if filter.category_ids:
-            stmt = stmt.join(CourseBase.categories).where(
-                CategoryBase.category_id.in_(filter.category_ids)
-            )
-
-        # Price filters
-        if filter.price_min is not None:
-            stmt = stmt.where(CourseBase.cost >= filter.price_min)
-        if filter.price_max is not None:
-            stmt = stmt.where(CourseBase.cost <= filter.price_max)
-
-        # Duration filters
-        if filter.duration_min is not None:
-            stmt = stmt.where(CourseBase.duration_hours >= filter.duration_min)
-        if filter.duration_max is not None:
-            stmt = stmt.where(CourseBase.duration_hours <= filter.duration_max)
-
-        # Has discount
-        if filter.has_discount is True:
-            stmt = stmt.where(CourseBase.discounted_cost.isnot(None))
-
-        # Upcoming: courses with start_date in the future
-        if filter.is_upcoming is True:
-            stmt = stmt.where(CourseBase.start_date > func.now())
-
-        # Sorting
-        order_by_cols: list[ColumnElement[Any]] = []
-
-        if rank is not None:
-            order_by_cols.append(rank.desc())
-
-        sort_col = cast(
-            dict[CourseSortField, ColumnElement[Any]],
-            {
-                CourseSortField.TITLE: CourseBase.name,
-                CourseSortField.PRICE: CourseBase.cost,
-                CourseSortField.DURATION: CourseBase.duration_hours,
-            },
-        ).get(filter.sort_field, CourseBase.start_date)
-
-        if filter.sort_order == CourseSortOrder.DESC:
-            order_by_cols.append(sort_col.desc())
-        else:
-            order_by_cols.append(sort_col.asc())
-
-        # Default ordering to keep stable results
-        order_by_cols.append(CourseBase.start_date.asc().nulls_last())
-        order_by_cols.append(CourseBase.duration_hours.asc())
+    async def _fetch_page(
+        self,
+        conditions: Sequence[ColumnElement[bool]],
+        keys: Sequence[SortKey],
+        skip: int,
+        limit: int,
+        after: str | None,
+    ) -> CoursePage:
+        """Run a narrow ordered ``course_id`` query, then hydrate the page.
+
+        Sorting and paging happen on rows holding only the sort ``keys``, and
+        only the selected IDs are loaded with their collections.
+        """
+        rows, next_cursor = await self._fetch_rows(conditions, keys, skip, limit, after)
+        courses = await self._hydrate([row.course_id for row in rows])
+        return CoursePage(courses=courses, next_cursor=next_cursor)
 
-        stmt = stmt.order_by(*order_by_cols)
+    async def _hydrate(self, course_ids: Sequence[UUID]) -> list[CourseReadModel]:
+        """Load courses by ID and return them in the order of ``course_ids``."""
+        if not course_ids:
+            return []
 
         stmt = (
-            stmt.options(
-                joinedload(CourseBase.sections),
-                joinedload(CourseBase.categories),
-                joinedload(CourseBase.tags),
-                joinedload(CourseBase.acquired_skills),
-                joinedload(CourseBase.lecturers),
-            )
-            .offset(filter.skip)
-            .limit(filter.limit)
+            select(CourseBase)
+            .where(CourseBase.course_id.in_(course_ids))
+            .options(*self.relation_loaders())
         )
-
         models = await self.executor.execute_scalar_many(stmt)
-        return [CourseReadMapper.to_read_model(model) for model in models]
+
+        by_id = {model.course_id: model for model in models}
+        return [
+            CourseReadMapper.to_read_model(by_id[course_id])
+            for course_id in course_ids
+            if course_id in by_id
+        ]
@@ -2,6 +2,11 @@
 
 from uuid import UUID
 
+from common.application.interfaces.catalog.catalog_change_listener import (
+    CatalogChange,
+    CatalogEntity,
+    ICatalogChangeListener,
+)
 from common.domain.value_objects.datetime import DateTime
 from common.infrastructure.database.postgres.sqlalchemy.executor import QueryExecutor
 from showcase.course.application.interfaces.repositories.course_repository import (
@@ -16,19 +21,18 @@ from showcase.course.infrastructure.database.postgres.sqlalchemy.models.course i
     CourseSkillBase,
     CourseTagBase,
 )
-from showcase.course.infrastructure.database.postgres.sqlalchemy.models.skill import (
-    SkillBase,
-)
-from sqlalchemy import delete, func, literal_column, select, update
-from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy import delete, select
 from sqlalchemy.orm import joinedload
 
 
 class CourseRepository(ICourseRepository):
     """Write repository for courses."""
 
-    def __init__(self, executor: QueryExecutor) -> None:
+    def __init__(
+        self, executor: QueryExecutor, catalog_listener: ICatalogChangeListener
+    ) -> None:
         self.executor = executor
+        self.catalog_listener = catalog_listener
 
     async def get_by_id(self, course_id: UUID) -> Course:
         """Get a course by ID."""
@@ -51,46 +55,52 @@ class CourseRepository(ICourseRepository):
     async def add(self, course: Course) -> None:
         """Add a new course."""
         model = self._to_persistence(course)
-        await self.executor.add(model)
-        await self._add(course)
-        await self._update_search_vector(course)
+        async with self.executor.uow:
+            await self.executor.add(model)
+            await self._add(course)
+            await self._notify(course.course_id)
 
     async def delete(self, course_id: UUID) -> None:
         """Delete a course and its associations by ID."""
-        # Finally delete the course record
-        await self.executor.execute(
-            delete(CourseBase).where(CourseBase.course_id == course_id)
-        )
+        # Associations and the course card are removed by ON DELETE CASCADE
+        async with self.executor.uow:
+            await self.executor.execute(
+                delete(CourseBase).where(CourseBase.course_id == course_id)
+            )
+            await self._notify(course_id, deleted=True)
 
     async def update(self, course: Course) -> None:
         """Update an existing course."""
         model = self._to_persistence(course)
 
-        # Delete all associations before update
-        await self.executor.execute(
-            delete(CourseSectionBase).where(
-                CourseSectionBase.course_id == course.course_id
+        async with self.executor.uow:
+            # Delete all associations before update
+            await self.executor.execute(
+                delete(CourseSectionBase).where(
+                    CourseSectionBase.course_id == course.course_id
+                )
             )
-        )
-        await self.executor.execute(
-            delete(CourseCategoryBase).where(
-                CourseCategoryBase.course_id == course.course_id
+            await self.executor.execute(
+                delete(CourseCategoryBase).where(
+                    CourseCategoryBase.course_id == course.course_id
+                )
             )
-        )
-        await self.executor.execute(
-            delete(CourseTagBase).where(CourseTagBase.course_id == course.course_id)
-        )
-        await self.executor.execute(
-            delete(CourseSkillBase).where(CourseSkillBase.course_id == course.course_id)
-        )
-        await self.executor.execute(
-            delete(CourseLecturerBase).where(
-                CourseLecturerBase.course_id == course.course_id
+            await self.executor.execute(
+                delete(CourseTagBase).where(CourseTagBase.course_id == course.course_id)
             )
-        )
-        await self.executor.save(model)
-        await self._add(course)
-        await self._update_search_vector(course)
+            await self.executor.execute(
+                delete(CourseSkillBase).where(
+                    CourseSkillBase.course_id == course.course_id
+                )
+            )
+            await self.executor.execute(
+                delete(CourseLecturerBase).where(
+                    CourseLecturerBase.course_id == course.course_id
+                )
+            )
+            await self.executor.save(model)
+            await self._add(course)
+            await self._notify(course.course_id)
 
     async def _add(self, course: Course) -> None:
         """Add sections and associations for course."""
@@ -136,76 +146,11 @@ class CourseRepository(ICourseRepository):
             ]
         )
 
-    async def _update_search_vector(self, course: Course):
-        sections_text_subq = (
-            select(
-                func.coalesce(
-                    func.string_agg(
-                        func.concat_ws(
-                            " ", CourseSectionBase.name, CourseSectionBase.description
-                        ),
-                        " ",
-                    ),
-                    "",
-                )
-            )
-            .where(CourseSectionBase.course_id == course.course_id)
-            .scalar_subquery()
-        )
-
-        skills_text_subq = (
-            select(
-                func.coalesce(
-                    func.string_agg(
-                        func.concat_ws(" ", SkillBase.name, SkillBase.description),
-                        " ",
-                    ),
-                    "",
-                )
-            )
-            .select_from(CourseSkillBase)
-            .join(SkillBase, CourseSkillBase.skill_id == SkillBase.skill_id)
-            .where(CourseSkillBase.course_id == course.course_id)
-            .scalar_subquery()
+    async def _notify(self, course_id: UUID, deleted: bool = False) -> None:
+        await self.catalog_listener.on_change(
+            CatalogChange(CatalogEntity.COURSE, course_id, deleted=deleted)
         )
 
-        search_vector = (
-            func.setweight(
-                func.to_tsvector("russian", func.coalesce(CourseBase.name, "")).cast(
-                    TSVECTOR
-                ),
-                literal_column("'A'"),
-            )
-            .op("||")(
-                func.setweight(
-                    func.to_tsvector(
-                        "russian", func.coalesce(CourseBase.description, "")
-                    ).cast(TSVECTOR),
-                    literal_column("'B'"),
-                )
-            )
-            .op("||")(
-                func.setweight(
-                    func.to_tsvector("russian", sections_text_subq).cast(TSVECTOR),
-                    literal_column("'C'"),
-                )
-            )
-            .op("||")(
-                func.setweight(
-                    func.to_tsvector("russian", skills_text_subq).cast(TSVECTOR),
-                    literal_column("'C'"),
-                )
-            )
-        )
-
-        stmt = (
-            update(CourseBase)
-            .where(CourseBase.course_id == course.course_id)
-            .values(search_vector=search_vector)
-        )
-
-        await self.executor.execute(stmt)
-
     @staticmethod
     def _to_domain(model: CourseBase) -> Course:
         """Map ORM model to domain entity."""
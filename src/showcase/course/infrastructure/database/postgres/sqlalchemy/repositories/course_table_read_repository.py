@@ -0,0 +1,456 @@
+"""Paging, filtering, search and facets shared by the course read repositories."""
+
+from abc import abstractmethod
+from collections.abc import Sequence
+from typing import Any, cast
+from uuid import UUID
+
+from common.infrastructure.database.postgres.sqlalchemy.executor import (
+    QueryExecutor,
+)
+from common.infrastructure.database.postgres.sqlalchemy.keyset import (
+    SortKey,
+    decode_cursor,
+    encode_cursor,
+    keyset_condition,
+)
+from showcase.course.application.interfaces.repositories import ICourseReadRepository
+from showcase.course.application.interfaces.repositories.course_read_repository import (
+    CoursesFilter,
+    CourseSortField,
+    CourseSortOrder,
+    SimpleCoursesFilter,
+)
+from showcase.course.application.read_models.course_facets_read_model import (
+    CourseFacets,
+)
+from showcase.course.application.read_models.course_read_model import (
+    CoursePage,
+    CourseReadModel,
+    CourseSearchRanking,
+    CourseSummaryPage,
+    CourseSummaryReadModel,
+    RankedCourse,
+)
+from showcase.course.domain.value_objects import CourseStatus, Format
+from showcase.course.infrastructure.database.postgres.sqlalchemy.mappers import (
+    CourseFacetsMapper,
+    CourseSummaryMapper,
+)
+from showcase.course.infrastructure.database.postgres.sqlalchemy.models import (
+    CourseBase,
+    CourseCardBase,
+)
+from sqlalchemy import CTE, ColumnElement, Row, Select, func, select, union_all
+
+
+class CourseTableReadRepository(ICourseReadRepository):
+    """Read repository over one table holding the scalar course columns.
+
+    Conditions, sort keys, keyset paging, summaries and scalar facets only
+    use columns that ``courses`` and ``course_cards`` share, so they are
+    written once against ``model``. Subclasses decide how full courses are
+    loaded and how the category and tag collections are matched and counted.
+    """
+
+    def __init__(
+        self, executor: QueryExecutor, model: type[CourseBase] | type[CourseCardBase]
+    ) -> None:
+        self.executor = executor
+        self.model = model
+
+    def make_prefix_tsquery(self, query: str) -> str:
+        tokens = query.strip().split()
+        return " & ".join(f"{token}:*" for token in tokens)
+
+    async def get_summaries_by_ids(
+        self, course_ids: Sequence[UUID]
+    ) -> list[CourseSummaryReadModel]:
+        """Get course summaries by ID, in the given order."""
+        if not course_ids:
+            return []
+
+        stmt = select(
+            self.model.course_id, *CourseSummaryMapper.columns(self.model)
+        ).where(self.model.course_id.in_(course_ids))
+        rows = await self.executor.execute_many(stmt)
+
+        by_id = {row.course_id: row for row in rows}
+        return [
+            CourseSummaryMapper.to_read_model(course_id, by_id[course_id][1:])
+            for course_id in course_ids
+            if course_id in by_id
+        ]
+
+    async def get_all(
+        self,
+        status: CourseStatus | None = None,
+        is_published: bool | None = None,
+        category_id: UUID | None = None,
+        format: Format | None = None,
+        skip: int = 0,
+        limit: int = 100,
+        after: str | None = None,
+    ) -> CoursePage:
+        """Get all courses with optional filters."""
+        conditions = self._all_conditions(status, is_published, category_id, format)
+        keys = [self._course_id_key()]
+
+        return await self._fetch_page(conditions, keys, skip, limit, after)
+
+    async def get_all_summaries(
+        self,
+        status: CourseStatus | None = None,
+        is_published: bool | None = None,
+        category_id: UUID | None = None,
+        format: Format | None = None,
+        skip: int = 0,
+        limit: int = 100,
+        after: str | None = None,
+    ) -> CourseSummaryPage:
+        """Get course summaries with optional filters."""
+        conditions = self._all_conditions(status, is_published, category_id, format)
+        keys = [self._course_id_key()]
+
+        return await self._fetch_summary_page(conditions, keys, skip, limit, after)
+
+    async def search(
+        self, query: str, skip: int = 0, limit: int = 50, after: str | None = None
+    ) -> CoursePage:
+        """Full-text search for courses using PostgreSQL tsvector in SELECT."""
+        conditions, keys = self._search_query(query)
+        return await self._fetch_page(conditions, keys, skip, limit, after)
+
+    async def search_summaries(
+        self, query: str, skip: int = 0, limit: int = 50, after: str | None = None
+    ) -> CourseSummaryPage:
+        """Full-text search for course summaries."""
+        conditions, keys = self._search_query(query)
+        return await self._fetch_summary_page(conditions, keys, skip, limit, after)
+
+    async def search_ranking(self, query: str, limit: int) -> CourseSearchRanking:
+        """Rank search matches, keeping only IDs and sort keys."""
+        conditions, keys = self._search_query(query)
+        rows, next_cursor = await self._fetch_rows(conditions, keys, 0, limit, None)
+        return CourseSearchRanking(
+            courses=[
+                RankedCourse(
+                    course_id=row.course_id,
+                    cursor=encode_cursor(keys, tuple(row)[: len(keys)]),
+                )
+                for row in rows
+            ],
+            complete=next_cursor is None,
+        )
+
+    async def filter(self, filter: SimpleCoursesFilter) -> list[CourseReadModel]:
+        """Deterministic filtering.
+
+        Returns top-N courses strictly matching filters.
+        """
+        conditions: list[ColumnElement[bool]] = [
+            self.model.is_published == filter.is_published
+        ]
+
+        if filter.status is not None:
+            conditions.append(self.model.status == filter.status)
+
+        if filter.format is not None:
+            conditions.append(self.model.format == filter.format)
+
+        if filter.max_duration_hours is not None:
+            conditions.append(self.model.duration_hours <= filter.max_duration_hours)
+
+        if filter.certificate_required is True:
+            conditions.append(self.model.certificate_type.isnot(None))
+
+        if filter.categories:
+            conditions.append(self._has_category_names(filter.categories))
+
+        keys = [
+            SortKey("start_date", self.model.start_date.expression, nullable=True),
+            SortKey("duration_hours", self.model.duration_hours.expression),
+            self._course_id_key(),
+        ]
+
+        page = await self._fetch_page(conditions, keys, filter.skip, filter.limit, None)
+        return page.courses
+
+    async def filter_extended(self, filter: CoursesFilter) -> CoursePage:
+        return await self._fetch_page(
+            self.extended_conditions(filter),
+            self._extended_keys(filter),
+            filter.skip,
+            filter.limit,
+            filter.after,
+        )
+
+    async def filter_extended_summaries(
+        self, filter: CoursesFilter
+    ) -> CourseSummaryPage:
+        return await self._fetch_summary_page(
+            self.extended_conditions(filter),
+            self._extended_keys(filter),
+            filter.skip,
+            filter.limit,
+            filter.after,
+        )
+
+    async def facets(self, filter: CoursesFilter) -> CourseFacets:
+        """Count facet values of the filtered courses in one statement.
+
+        The filtered courses are selected once into a CTE; scalar facets are
+        counted over it with GROUPING SETS, categories and tags by
+        ``_collection_counts``, all combined with ``UNION ALL``.
+        """
+        matched = (
+            select(
+                self.model.format,
+                self.model.education_format,
+                self.model.status,
+                *self._facet_columns(),
+            )
+            .where(*self.extended_conditions(filter))
+            .cte("matched")
+        )
+
+        stmt = union_all(
+            CourseFacetsMapper.scalar_counts(matched),
+            *self._collection_counts(matched),
+        )
+        return CourseFacetsMapper.to_read_model(await self.executor.execute_many(stmt))
+
+    def extended_conditions(self, filter: CoursesFilter) -> list[ColumnElement[bool]]:
+        """WHERE predicates of ``filter_extended`` without sorting and paging."""
+        conditions: list[ColumnElement[bool]] = []
+
+        # Base visibility filters
+        if filter.status is not None:
+            conditions.append(self.model.status == filter.status)
+        if filter.is_published is not None:
+            conditions.append(self.model.is_published == filter.is_published)
+
+        # Full-text search
+        if filter.search and filter.search.strip():
+            ts_query = func.to_tsquery(
+                "russian", self.make_prefix_tsquery(filter.search)
+            )
+            conditions.append(self.model.search_vector.op("@@")(ts_query))
+
+        # Formats and education types
+        if filter.formats:
+            conditions.append(self.model.format.in_(filter.formats))
+        if filter.education_types:
+            conditions.append(self.model.education_format.in_(filter.education_types))
+
+        # Tags
+        if filter.tags:
+            conditions.append(self._has_tags(filter.tags))
+
+        # Category ids
+        if filter.category_ids:
+            conditions.append(self._has_category_ids(filter.category_ids))
+
+        conditions += self._range_conditions(filter)
+        return conditions
+
+    def _range_conditions(self, filter: CoursesFilter) -> list[ColumnElement[bool]]:
+        """Price, duration, discount and start date predicates of ``filter``."""
+        conditions: list[ColumnElement[bool]] = []
+
+        # Price filters
+        if filter.price_min is not None:
+            conditions.append(self.model.cost >= filter.price_min)
+        if filter.price_max is not None:
+            conditions.append(self.model.cost <= filter.price_max)
+
+        # Duration filters
+        if filter.duration_min is not None:
+            conditions.append(self.model.duration_hours >= filter.duration_min)
+        if filter.duration_max is not None:
+            conditions.append(self.model.duration_hours <= filter.duration_max)
+
+        # Has discount
+        if filter.has_discount is True:
+            conditions.append(self.model.discounted_cost.isnot(None))
+
+        # Upcoming: courses with start_date in the future
+        if filter.is_upcoming is True:
+            conditions.append(self.model.start_date > func.now())
+
+        return conditions
+
+    def _all_conditions(
+        self,
+        status: CourseStatus | None,
+        is_published: bool | None,
+        category_id: UUID | None,
+        format: Format | None,
+    ) -> list[ColumnElement[bool]]:
+        conditions: list[ColumnElement[bool]] = []
+
+        if status is not None:
+            conditions.append(self.model.status == status)
+
+        if is_published is not None:
+            conditions.append(self.model.is_published == is_published)
+
+        if format is not None:
+            conditions.append(self.model.format == format)
+
+        if category_id is not None:
+            conditions.append(self._has_category_ids([category_id]))
+
+        return conditions
+
+    def _search_query(
+        self, query: str
+    ) -> tuple[list[ColumnElement[bool]], list[SortKey]]:
+        vector = self.model.search_vector
+        ts_query = func.to_tsquery("russian", self.make_prefix_tsquery(query))
+
+        conditions: list[ColumnElement[bool]] = [
+            vector.op("@@")(ts_query),
+            self.model.is_published.is_(True),
+        ]
+        keys = [
+            SortKey("rank", func.ts_rank(vector, ts_query), descending=True),
+            self._course_id_key(),
+        ]
+        return conditions, keys
+
+    def _extended_keys(self, filter: CoursesFilter) -> list[SortKey]:
+        """Ordering of ``filter_extended``, closed by the course ID."""
+        descending = filter.sort_order == CourseSortOrder.DESC
+        keys: list[SortKey] = []
+
+        # Full-text search relevance goes first
+        if filter.search and filter.search.strip():
+            ts_query = func.to_tsquery(
+                "russian", self.make_prefix_tsquery(filter.search)
+            )
+            keys.append(
+                SortKey(
+                    "rank",
+                    func.ts_rank(self.model.search_vector, ts_query),
+                    descending=True,
+                )
+            )
+
+        # Sorting
+        sort_col = cast(
+            dict[CourseSortField, ColumnElement[Any]],
+            {
+                CourseSortField.TITLE: self.model.name,
+                CourseSortField.PRICE: self.model.cost,
+                CourseSortField.DURATION: self.model.duration_hours,
+            },
+        ).get(filter.sort_field)
+
+        if sort_col is not None:
+            keys.append(SortKey("sort_col", sort_col, descending=descending))
+            descending = False
+
+        # Default ordering to keep stable results
+        keys.append(
+            SortKey(
+                "start_date",
+                self.model.start_date.expression,
+                descending=descending,
+                nullable=True,
+            )
+        )
+        keys.append(SortKey("duration_hours", self.model.duration_hours.expression))
+        keys.append(self._course_id_key())
+
+        return keys
+
+    def _course_id_key(self) -> SortKey:
+        """Return the unique tiebreaker that must close every ordering."""
+        return SortKey("course_id", self.model.course_id.expression)
+
+    @abstractmethod
+    def _has_category_ids(self, category_ids: Sequence[UUID]) -> ColumnElement[bool]:
+        """Match courses in any of the categories ``category_ids``."""
+
+    @abstractmethod
+    def _has_category_names(self, names: Sequence[str]) -> ColumnElement[bool]:
+        """Match courses in any of the categories named ``names``."""
+
+    @abstractmethod
+    def _has_tags(self, names: Sequence[str]) -> ColumnElement[bool]:
+        """Match courses tagged with any of ``names``."""
+
+    @abstractmethod
+    def _facet_columns(self) -> Sequence[ColumnElement[Any]]:
+        """Extra columns ``_collection_counts`` needs in the matched CTE."""
+
+    @abstractmethod
+    def _collection_counts(self, matched: CTE) -> Sequence[Select[Any]]:
+        """Category and tag facet counts over the matched courses."""
+
+    @abstractmethod
+    async def _fetch_page(
+        self,
+        conditions: Sequence[ColumnElement[bool]],
+        keys: Sequence[SortKey],
+        skip: int,
+        limit: int,
+        after: str | None,
+    ) -> CoursePage:
+        """Read one page of full courses in the order of ``keys``."""
+
+    async def _fetch_summary_page(
+        self,
+        conditions: Sequence[ColumnElement[bool]],
+        keys: Sequence[SortKey],
+        skip: int,
+        limit: int,
+        after: str | None,
+    ) -> CourseSummaryPage:
+        """Read a page of summaries straight from the scalar course columns."""
+        rows, next_cursor = await self._fetch_rows(
+            conditions,
+            keys,
+            skip,
+            limit,
+            after,
+            *CourseSummaryMapper.columns(self.model),
+        )
+        courses = [
+            CourseSummaryMapper.to_read_model(row.course_id, row[len(keys) :])
+            for row in rows
+        ]
+        return CourseSummaryPage(courses=courses, next_cursor=next_cursor)
+
+    async def _fetch_rows(
+        self,
+        conditions: Sequence[ColumnElement[bool]],
+        keys: Sequence[SortKey],
+        skip: int,
+        limit: int,
+        after: str | None,
+        *columns: Any,
+    ) -> tuple[list[Row[Any]], str | None]:
+        """Select the sort ``keys`` and ``columns`` of one page of courses.
+
+        With an ``after`` cursor the page continues past the cursor row and
+        ``skip`` is ignored; otherwise ``skip`` is applied as an offset. One
+        extra row is fetched to tell whether a next page exists.
+        """
+        stmt = select(*(key.column() for key in keys), *columns).where(*conditions)
+
+        if after is not None:
+            stmt = stmt.where(keyset_condition(keys, decode_cursor(keys, after)))
+        else:
+            stmt = stmt.offset(skip)
+
+        stmt = stmt.order_by(*(key.order_by() for key in keys)).limit(limit + 1)
+
+        rows = list(await self.executor.execute_many(stmt))
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(keys, tuple(rows[-1])[: len(keys)])
+
+        return rows, next_cursor
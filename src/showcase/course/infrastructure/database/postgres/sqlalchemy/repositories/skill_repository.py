@@ -2,6 +2,11 @@
 
 from uuid import UUID
 
+from common.application.interfaces.catalog.catalog_change_listener import (
+    CatalogChange,
+    CatalogEntity,
+    ICatalogChangeListener,
+)
 from common.infrastructure.database.postgres.sqlalchemy.executor import QueryExecutor
 from showcase.course.application.interfaces.repositories.skill_repository import (
     ISkillRepository,
@@ -16,8 +21,11 @@ from sqlalchemy import delete, select
 class SkillRepository(ISkillRepository):
     """Write repository for skills."""
 
-    def __init__(self, executor: QueryExecutor) -> None:
+    def __init__(
+        self, executor: QueryExecutor, catalog_listener: ICatalogChangeListener
+    ) -> None:
         self.executor = executor
+        self.catalog_listener = catalog_listener
 
     async def get_by_id(self, skill_id: UUID) -> Skill:
         """Get a skill by ID."""
@@ -30,17 +38,28 @@ class SkillRepository(ISkillRepository):
     async def add(self, skill: Skill) -> None:
         """Add a new skill."""
         model = self._to_persistence(skill)
-        await self.executor.add(model)
+        async with self.executor.uow:
+            await self.executor.add(model)
+            await self._notify(skill.skill_id)
 
     async def update(self, skill: Skill) -> None:
         """Update an existing skill."""
         model = self._to_persistence(skill)
-        await self.executor.save(model)
+        async with self.executor.uow:
+            await self.executor.save(model)
+            await self._notify(skill.skill_id)
 
     async def delete(self, skill_id: UUID) -> None:
         """Delete a skill by ID."""
-        await self.executor.execute(
-            delete(SkillBase).where(SkillBase.skill_id == skill_id)
+        async with self.executor.uow:
+            await self.executor.execute(
+                delete(SkillBase).where(SkillBase.skill_id == skill_id)
+            )
+            await self._notify(skill_id, deleted=True)
+
+    async def _notify(self, skill_id: UUID, deleted: bool = False) -> None:
+        await self.catalog_listener.on_change(
+            CatalogChange(CatalogEntity.SKILL, skill_id, deleted=deleted)
         )
 
     @staticmethod
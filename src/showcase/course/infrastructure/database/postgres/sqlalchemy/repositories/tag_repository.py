@@ -3,6 +3,11 @@
 from collections.abc import Iterable, Sequence
 from uuid import UUID
 
+from common.application.interfaces.catalog.catalog_change_listener import (
+    CatalogChange,
+    CatalogEntity,
+    ICatalogChangeListener,
+)
 from common.infrastructure.database.postgres.sqlalchemy.executor import QueryExecutor
 from showcase.course.application.interfaces.repositories.tag_repository import (
     ITagRepository,
@@ -17,8 +22,11 @@ from sqlalchemy import delete, select
 class TagRepository(ITagRepository):
     """Write repository for tags."""
 
-    def __init__(self, executor: QueryExecutor) -> None:
+    def __init__(
+        self, executor: QueryExecutor, catalog_listener: ICatalogChangeListener
+    ) -> None:
         self.executor = executor
+        self.catalog_listener = catalog_listener
 
     async def get_by_id(self, tag_id: UUID) -> Tag:
         """Get a tag by ID."""
@@ -31,7 +39,9 @@ class TagRepository(ITagRepository):
     async def add(self, tag: Tag) -> None:
         """Add a new tag."""
         model = self._to_persistence(tag)
-        await self.executor.add(model)
+        async with self.executor.uow:
+            await self.executor.add(model)
+            await self._notify(tag.tag_id)
 
     async def add_all(self, tags: Iterable[Tag]) -> None:
         """Add new tags."""
@@ -44,11 +54,15 @@ class TagRepository(ITagRepository):
     async def update(self, tag: Tag) -> None:
         """Update an existing tag."""
         model = self._to_persistence(tag)
-        await self.executor.save(model)
+        async with self.executor.uow:
+            await self.executor.save(model)
+            await self._notify(tag.tag_id)
 
     async def delete(self, tag_id: UUID) -> None:
         """Delete a tag by ID."""
-        await self.executor.execute(delete(TagBase).where(TagBase.tag_id == tag_id))
+        async with self.executor.uow:
+            await self.executor.execute(delete(TagBase).where(TagBase.tag_id == tag_id))
+            await self._notify(tag_id, deleted=True)
 
     async def get_by_values(self, tags: Iterable[str]) -> Sequence[Tag]:
         """Get existing tags by their values."""
@@ -59,6 +73,11 @@ class TagRepository(ITagRepository):
         models = await self.executor.execute_scalar_many(stmt)
         return [self._to_domain(m) for m in models]
 
+    async def _notify(self, tag_id: UUID, deleted: bool = False) -> None:
+        await self.catalog_listener.on_change(
+            CatalogChange(CatalogEntity.TAG, tag_id, deleted=deleted)
+        )
+
     @staticmethod
     def _to_domain(model: TagBase) -> Tag:
         """Map ORM model to domain entity."""
@@ -1,13 +1,24 @@
 """Course bounded context DI container."""
 
+from collections.abc import Hashable
 from typing import Any
 
+from common.infrastructure.cache import SingleFlight
+from common.infrastructure.catalog import (
+    CatalogVersion,
+    CompositeCatalogChangeListener,
+)
+from common.infrastructure.services.llama_index.guard import LLMGuard
 from dependency_injector import containers, providers
+from showcase.course.application.interfaces.services.recommendation_service import (
+    RecommendationsDTO,
+)
 from showcase.course.application.services.course_retrieval_service import (
     CourseRetrievalService,
 )
 from showcase.course.application.services.recommendation_service import (
     RecommendationService,
+    RecommendationTimeouts,
 )
 from showcase.course.application.usecases import (
     CreateCourseUseCase,
@@ -17,6 +28,7 @@ from showcase.course.application.usecases import (
     DeleteSkillUseCase,
     DeleteTagUseCase,
     GetCourseByIdUseCase,
+    GetCourseFacetsUseCase,
     GetCoursesSearchUseCase,
     GetCoursesUseCase,
     GetSkillByIdUseCase,
@@ -39,7 +51,25 @@ from showcase.course.application.usecases.query.list_enrollments_by_course_use_c
 from showcase.course.application.usecases.query.list_enrollments_by_user_use_case import (
     ListEnrollmentsByUserUseCase,
 )
+from showcase.course.infrastructure.cache import (
+    CachedCourseReadRepository,
+    CachedFilterInferenceService,
+    CachedRecommendationService,
+    CoalescingGetCourseByIdUseCase,
+    CoalescingGetCoursesSearchUseCase,
+    CoalescingRecommendationService,
+    CourseFacetsCache,
+    CourseReadCache,
+    CourseSearchCache,
+    FilterInferenceCache,
+    InMemoryRecommendationCacheBackend,
+    RecommendationCache,
+)
+from showcase.course.infrastructure.database.postgres.sqlalchemy.projections import (
+    CourseCardProjector,
+)
 from showcase.course.infrastructure.database.postgres.sqlalchemy.repositories import (
+    CourseCardReadRepository,
     CourseReadRepository,
     CourseRepository,
     SkillReadRepository,
@@ -50,44 +80,137 @@ from showcase.course.infrastructure.database.postgres.sqlalchemy.repositories im
 from showcase.course.infrastructure.database.postgres.sqlalchemy.repositories.enrollment_repository import (
     EnrollmentRepository,
 )
+from showcase.course.infrastructure.services.fallback.precomputed_fallback_service import (
+    PrecomputedFallbackService,
+)
+from showcase.course.infrastructure.services.jobs.recommendation_job_backend import (
+    InMemoryRecommendationJobBackend,
+)
+from showcase.course.infrastructure.services.jobs.recommendation_job_service import (
+    RecommendationJobService,
+)
+from showcase.course.infrastructure.services.llama_index.course_prompt_encoder import (
+    CoursePromptEncoder,
+)
 from showcase.course.infrastructure.services.llama_index.course_ranking_service import (
     CourseRankingService,
 )
 from showcase.course.infrastructure.services.llama_index.filter_inference_service import (
     FilterInferenceService,
 )
+from showcase.course.infrastructure.services.llama_index.llm_breakdown_service import (
+    LLMBreakdownRecommendationService,
+)
+from showcase.course.infrastructure.services.rules.rule_filter_inference_service import (
+    RuleFilterInferenceService,
+)
+from showcase.course.infrastructure.services.vectors.course_vector_index import (
+    CourseVectorIndex,
+)
+from showcase.course.infrastructure.services.vectors.hashing_vectorizer import (
+    HashingVectorizer,
+)
+from showcase.course.infrastructure.services.vectors.local_ranking_service import (
+    LocalCourseRankingService,
+)
+from showcase.course.infrastructure.services.vectors.vector_pre_ranking_service import (
+    VectorPreRankingService,
+)
 
 
 class CourseContainer(containers.DeclarativeContainer):
     """Dependency injection container for course bounded context."""
 
     # Explicit dependency declarations
+    logger: providers.Dependency[Any] = providers.Dependency()
     uuid_generator: providers.Dependency[Any] = providers.Dependency()
     query_executor: providers.Dependency[Any] = providers.Dependency()
     clock: providers.Dependency[Any] = providers.Dependency()
+    course_config: providers.Dependency[Any] = providers.Dependency()
+
+    # Projections
+    course_card_projector = providers.Factory(CourseCardProjector, query_executor)
+
+    # Caches
+    catalog_version = providers.Singleton(CatalogVersion)
+    course_read_cache = providers.Singleton(
+        CourseReadCache, course_config.provided.cache
+    )
+    course_search_cache = providers.Singleton(
+        CourseSearchCache, course_config.provided.search_cache, catalog_version
+    )
+    course_facets_cache = providers.Singleton(
+        CourseFacetsCache, course_config.provided.facets_cache, catalog_version
+    )
 
     # Read repositories
-    course_read_repository = providers.Factory(CourseReadRepository, query_executor)
+    course_read_repository = providers.Factory(
+        CachedCourseReadRepository,
+        providers.Selector(
+            course_config.provided.read_source.value,
+            orm=providers.Factory(CourseReadRepository, query_executor),
+            cards=providers.Factory(CourseCardReadRepository, query_executor),
+        ),
+        course_read_cache,
+        course_search_cache,
+        course_facets_cache,
+    )
+
+    # Course vectors for recommendation pre-ranking
+    course_vector_index = providers.Singleton(
+        CourseVectorIndex,
+        logger=logger,
+        path=course_config.provided.vector_index.directory,
+        vectorizer=providers.Factory(
+            HashingVectorizer, course_config.provided.vector_index.dimensions
+        ),
+        course_repository=course_read_repository,
+    )
+
+    # Committed catalog changes reach every in-process cache; the vector
+    # index comes last so it re-reads courses the read cache has dropped
+    catalog_cache = providers.Singleton(
+        CompositeCatalogChangeListener,
+        logger,
+        course_read_cache,
+        catalog_version,
+        course_vector_index,
+    )
     skill_read_repository = providers.Factory(SkillReadRepository, query_executor)
     tag_read_repository = providers.Factory(TagReadRepository, query_executor)
 
     # Write repositories
-    course_repository = providers.Factory(CourseRepository, query_executor)
-    skill_repository = providers.Factory(SkillRepository, query_executor)
-    tag_repository = providers.Factory(TagRepository, query_executor)
+    course_repository = providers.Factory(
+        CourseRepository, query_executor, course_card_projector
+    )
+    skill_repository = providers.Factory(
+        SkillRepository, query_executor, course_card_projector
+    )
+    tag_repository = providers.Factory(
+        TagRepository, query_executor, course_card_projector
+    )
     enrollment_repository = providers.Factory(EnrollmentRepository, query_executor)
 
     # Read use cases
     get_courses_usecase = providers.Factory(GetCoursesUseCase, course_read_repository)
     get_course_by_id_usecase = providers.Factory(
-        GetCourseByIdUseCase, course_read_repository
+        CoalescingGetCourseByIdUseCase,
+        inner=providers.Factory(GetCourseByIdUseCase, course_read_repository),
+        flight=providers.Singleton(SingleFlight),
+        enabled=course_config.provided.coalescing.course_by_id,
     )
     get_courses_search_usecase = providers.Factory(
-        GetCoursesSearchUseCase, course_read_repository
+        CoalescingGetCoursesSearchUseCase,
+        inner=providers.Factory(GetCoursesSearchUseCase, course_read_repository),
+        flight=providers.Singleton(SingleFlight),
+        enabled=course_config.provided.coalescing.search,
     )
     filter_courses_usecase = providers.Factory(
         GetCoursesExtendedUseCase, course_read_repository
     )
+    course_facets_usecase = providers.Factory(
+        GetCourseFacetsUseCase, course_read_repository
+    )
     get_skills_usecase = providers.Factory(GetSkillsUseCase, skill_read_repository)
     get_skill_by_id_usecase = providers.Factory(
         GetSkillByIdUseCase, skill_read_repository
@@ -108,28 +231,40 @@ class CourseContainer(containers.DeclarativeContainer):
         course_repository=course_repository,
         uuid_generator=uuid_generator,
         tag_repository=tag_repository,
+        catalog_cache=catalog_cache,
     )
     update_course_usecase = providers.Factory(
         UpdateCourseUseCase,
         course_repository=course_repository,
         uuid_generator=uuid_generator,
         tag_repository=tag_repository,
+        catalog_cache=catalog_cache,
+    )
+    delete_course_usecase = providers.Factory(
+        DeleteCourseUseCase, course_repository, catalog_cache
     )
-    delete_course_usecase = providers.Factory(DeleteCourseUseCase, course_repository)
     create_skill_usecase = providers.Factory(
         CreateSkillUseCase,
         skill_repository=skill_repository,
         uuid_generator=uuid_generator,
     )
-    update_skill_usecase = providers.Factory(UpdateSkillUseCase, skill_repository)
-    delete_skill_usecase = providers.Factory(DeleteSkillUseCase, skill_repository)
+    update_skill_usecase = providers.Factory(
+        UpdateSkillUseCase, skill_repository, catalog_cache
+    )
+    delete_skill_usecase = providers.Factory(
+        DeleteSkillUseCase, skill_repository, catalog_cache
+    )
     create_tag_usecase = providers.Factory(
         CreateTagUseCase,
         tag_repository=tag_repository,
         uuid_generator=uuid_generator,
     )
-    update_tag_usecase = providers.Factory(UpdateTagUseCase, tag_repository)
-    delete_tag_usecase = providers.Factory(DeleteTagUseCase, tag_repository)
+    update_tag_usecase = providers.Factory(
+        UpdateTagUseCase, tag_repository, catalog_cache
+    )
+    delete_tag_usecase = providers.Factory(
+        DeleteTagUseCase, tag_repository, catalog_cache
+    )
 
     enroll_use_case = providers.Factory(EnrollUserUseCase, enrollment_repository)
 
@@ -139,33 +274,180 @@ class RecommendationContainer(containers.DeclarativeContainer):
 
     # Explicit dependency declarations
     logger: providers.Dependency[Any] = providers.Dependency()
+    uuid_generator: providers.Dependency[Any] = providers.Dependency()
+    clock: providers.Dependency[Any] = providers.Dependency()
     llm: providers.Dependency[Any] = providers.Dependency()
     course_read_repository: providers.Dependency[Any] = providers.Dependency()
-    category_read_repository: providers.Dependency[Any] = providers.Dependency()
+    category_catalog: providers.Dependency[Any] = providers.Dependency()
+    catalog_version: providers.Dependency[Any] = providers.Dependency()
+    course_config: providers.Dependency[Any] = providers.Dependency()
+    llm_config: providers.Dependency[Any] = providers.Dependency()
+    course_vector_index: providers.Dependency[Any] = providers.Dependency()
+    llm_metrics: providers.Dependency[Any] = providers.Dependency()
+
+    # Result cache; override the backend to share entries between processes
+    recommendation_cache_backend = providers.Singleton(
+        InMemoryRecommendationCacheBackend,
+        course_config.provided.recommendation_cache,
+    )
+    recommendation_cache = providers.Singleton(
+        RecommendationCache,
+        course_config.provided.recommendation_cache,
+        catalog_version,
+        recommendation_cache_backend,
+    )
+
+    # Deadlines, hedging and the circuit breaker shared by all LLM calls
+    llm_guard = providers.Singleton(
+        LLMGuard, logger=logger, config=llm_config.provided.resilience
+    )
+
+    filter_inference_cache = providers.Singleton(
+        FilterInferenceCache, course_config.provided.filter_inference_cache
+    )
+
+    ranking_prompt_encoder = providers.Singleton(
+        CoursePromptEncoder,
+        max_entries=course_config.provided.ranking_prompt.cache_max_entries,
+        ttl_seconds=course_config.provided.ranking_prompt.cache_ttl_seconds,
+    )
 
-    # Sub-services for recommendation pipeline
-    filter_inference_service = providers.Factory(
-        FilterInferenceService,
+    # Sub-services for recommendation pipeline; a singleton so the rules
+    # matcher and its counters outlive a request
+    filter_inference_service = providers.Singleton(
+        RuleFilterInferenceService,
         logger=logger,
-        llm=llm,
+        inner=providers.Factory(
+            CachedFilterInferenceService,
+            logger=logger,
+            inner=providers.Factory(
+                FilterInferenceService,
+                logger=logger,
+                llm=llm,
+                guard=llm_guard,
+                metrics=llm_metrics,
+            ),
+            cache=filter_inference_cache,
+            guard=llm_guard,
+        ),
+        enabled=course_config.provided.filter_rules.enabled,
+        synonyms=course_config.provided.filter_rules.synonyms,
     )
     course_retrieval_service = providers.Factory(
         CourseRetrievalService,
         logger=logger,
         course_repository=course_read_repository,
     )
-    course_ranking_service = providers.Factory(
+    # Ranks without the LLM: on request, or when the LLM is unavailable
+    local_course_ranking_service = providers.Singleton(
+        LocalCourseRankingService,
+        logger=logger,
+        index=course_vector_index,
+        clock=clock,
+    )
+    # A singleton, like filter inference, so its structured LLM wrapper is
+    # built once
+    llm_course_ranking_service = providers.Singleton(
         CourseRankingService,
         logger=logger,
         llm=llm,
+        encoder=ranking_prompt_encoder,
+        token_budget=course_config.provided.ranking_prompt.token_budget,
+        chunk_size=llm_config.provided.ranking_chunk_size,
+        concurrency=llm_config.provided.ranking_concurrency,
+        tiebreak_size=llm_config.provided.ranking_tiebreak_size,
+        guard=llm_guard,
+        fallback=local_course_ranking_service,
+        metrics=llm_metrics,
+    )
+    course_ranking_service = providers.Factory(
+        VectorPreRankingService,
+        logger=logger,
+        inner=llm_course_ranking_service,
+        index=course_vector_index,
+        top_k=course_config.provided.vector_index.top_k,
+    )
+    # Fallback courses ranked once per catalog version; the whole pool goes
+    # to the LLM since the query is fixed. Start ``run`` with the app
+    fallback_recommendation_service = providers.Singleton(
+        PrecomputedFallbackService,
+        logger=logger,
+        course_repository=course_read_repository,
+        ranking=llm_course_ranking_service,
+        catalog_version=catalog_version,
+        query=RecommendationService.FALLBACK_RANKING_QUERY,
+        guard=llm_guard,
+        enabled=course_config.provided.fallback_ranking.enabled,
+        pool_size=course_config.provided.fallback_ranking.pool_size,
+        refresh_interval_seconds=(
+            course_config.provided.fallback_ranking.refresh_interval_seconds
+        ),
+        max_age_seconds=course_config.provided.fallback_ranking.max_age_seconds,
+        shuffle_tier_size=course_config.provided.fallback_ranking.shuffle_tier_size,
+    )
+
+    recommendation_timeouts = providers.Factory(
+        RecommendationTimeouts,
+        categories=course_config.provided.recommendation_timeouts.categories,
+        inference=course_config.provided.recommendation_timeouts.inference,
+        retrieval=course_config.provided.recommendation_timeouts.retrieval,
+        fallback=course_config.provided.recommendation_timeouts.fallback,
+        ranking=course_config.provided.recommendation_timeouts.ranking,
     )
 
-    # Orchestrator
+    # Orchestrator; concurrent identical requests share one cached run
+    recommendation_flight: providers.Singleton[
+        SingleFlight[Hashable, RecommendationsDTO]
+    ] = providers.Singleton(SingleFlight)
     recommendation_service = providers.Factory(
-        RecommendationService,
+        CoalescingRecommendationService,
+        inner=providers.Factory(
+            LLMBreakdownRecommendationService,
+            inner=providers.Factory(
+                CachedRecommendationService,
+                logger=logger,
+                inner=providers.Factory(
+                    RecommendationService,
+                    logger=logger,
+                    category_catalog=category_catalog,
+                    filter_inference=filter_inference_service,
+                    course_retrieval=course_retrieval_service,
+                    course_ranking=course_ranking_service,
+                    timeouts=recommendation_timeouts,
+                    local_ranking=local_course_ranking_service,
+                    fallback_recommendations=fallback_recommendation_service,
+                ),
+                cache=recommendation_cache,
+                course_repository=course_read_repository,
+                guard=llm_guard,
+            ),
+            metrics=llm_metrics,
+        ),
+        flight=recommendation_flight,
+        enabled=course_config.provided.coalescing.recommendations,
+    )
+
+    # Submit-and-poll recommendations through the same chain; start ``run``
+    # with the app. Override the backend to share the queue between processes
+    recommendation_job_backend = providers.Singleton(
+        InMemoryRecommendationJobBackend,
+        max_entries=course_config.provided.recommendation_jobs.max_entries,
+        ttl_seconds=course_config.provided.recommendation_jobs.ttl_seconds,
+    )
+    recommendation_job_service = providers.Singleton(
+        RecommendationJobService,
         logger=logger,
-        category_repository=category_read_repository,
-        filter_inference=filter_inference_service,
-        course_retrieval=course_retrieval_service,
-        course_ranking=course_ranking_service,
+        recommendations=recommendation_service.provider,
+        backend=recommendation_job_backend,
+        uuid_generator=uuid_generator,
+        clock=clock,
+        workers=course_config.provided.recommendation_jobs.job_workers,
+        max_queued=course_config.provided.recommendation_jobs.max_queued_jobs,
+        max_active_per_submitter=(
+            course_config.provided.recommendation_jobs.max_active_jobs_per_submitter
+        ),
+        max_wait_seconds=course_config.provided.recommendation_jobs.max_wait_seconds,
+        poll_interval_seconds=(
+            course_config.provided.recommendation_jobs.poll_interval_seconds
+        ),
     )
@@ -0,0 +1,175 @@
+"""Fallback recommendations ranked once per catalog version."""
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Callable
+from contextlib import suppress
+from dataclasses import dataclass
+from uuid import UUID
+
+from common.infrastructure.catalog import CatalogVersion
+from common.infrastructure.services.llama_index.guard import LLMGuard
+from showcase.course.application.interfaces.repositories import ICourseReadRepository
+from showcase.course.application.interfaces.services.course_ranking_service import (
+    ICourseRankingService,
+)
+from showcase.course.application.interfaces.services.fallback_recommendation_service import (
+    IFallbackRecommendationService,
+)
+from showcase.course.application.read_models.course_read_model import CourseReadModel
+
+
+@dataclass(frozen=True)
+class _Ranking:
+    catalog_version: int
+    course_ids: tuple[UUID, ...]
+    ranked_at: float  # ``timer`` reading
+
+
+class PrecomputedFallbackService(IFallbackRecommendationService):
+    """Ranks the fallback courses in the background instead of per request.
+
+    ``run`` checks ``CatalogVersion`` every ``refresh_interval_seconds``, or
+    as soon as ``get`` finds the ranking outdated, and when it has moved
+    ranks the first ``pool_size`` courses with ``query``, the request the
+    fallback path ranks with.
+    Only course IDs are kept; ``get`` hydrates them through the read
+    repository so prices and statuses stay current.
+
+    ``CatalogVersion`` only sees writes made in this process, so a ranking
+    is also redone once it is ``max_age_seconds`` old; until then ``get``
+    keeps serving the aged one. That is how the bot and other workers pick
+    up courses added elsewhere.
+
+    Until the ranking for the current version is ready ``get`` returns
+    None. A ranking that is weak, fell back to a non-LLM path or raced a
+    catalog change is dropped and retried after the interval.
+
+    With ``shuffle_tier_size`` above 1, every ``get`` shuffles courses
+    within consecutive tiers of that many ranks, so repeated fallbacks vary
+    while better courses stay ahead.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        logger: logging.Logger,
+        course_repository: ICourseReadRepository,
+        ranking: ICourseRankingService,
+        catalog_version: CatalogVersion,
+        query: str,
+        guard: LLMGuard | None = None,
+        enabled: bool = True,
+        pool_size: int = 25,
+        refresh_interval_seconds: float = 30,
+        max_age_seconds: float = 600,
+        shuffle_tier_size: int = 0,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._logger = logger
+        self._course_repository = course_repository
+        self._ranking_service = ranking
+        self._catalog_version = catalog_version
+        self._query = query
+        self._guard = guard
+        self.enabled = enabled
+        self._pool_size = pool_size
+        self._interval = refresh_interval_seconds
+        self._max_age = max_age_seconds
+        self._tier_size = shuffle_tier_size
+        self._timer = timer
+        self._ranking: _Ranking | None = None
+        self._wake = asyncio.Event()
+        self._rng = random.Random()
+
+    async def get(self, limit: int) -> list[CourseReadModel] | None:
+        if not self.enabled:
+            return None
+        ranking = self._ranking
+        if ranking is None or self._outdated(ranking):
+            self._wake.set()
+            return None
+        if self._expired(ranking):
+            self._wake.set()
+
+        course_ids = list(ranking.course_ids)
+        if self._tier_size > 1:
+            for start in range(0, len(course_ids), self._tier_size):
+                tier = course_ids[start : start + self._tier_size]
+                self._rng.shuffle(tier)
+                course_ids[start : start + self._tier_size] = tier
+        return await self._course_repository.get_by_ids(course_ids[:limit])
+
+    async def refresh(self) -> bool:
+        """Rank the fallback courses now; return whether the ranking is kept."""
+        version = self._catalog_version.value
+        mark = self._guard.mark() if self._guard else 0
+        ranked_at = self._timer()
+        started = time.perf_counter()
+
+        page = await self._course_repository.get_all(limit=self._pool_size)
+        ranked, ranking_weak = await self._ranking_service.rank(
+            self._query, page.courses, fallback=True
+        )
+        degraded = self._guard is not None and self._guard.degraded_since(mark)
+        elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+
+        if ranking_weak or degraded or version != self._catalog_version.value:
+            self._logger.warning(
+                "Fallback ranking dropped",
+                extra={
+                    "service": "PrecomputedFallback",
+                    "ranking_weak": ranking_weak,
+                    "degraded": degraded,
+                    "catalog_changed": version != self._catalog_version.value,
+                    "elapsed_ms": elapsed_ms,
+                },
+            )
+            return False
+
+        self._ranking = _Ranking(version, tuple(c.course_id for c in ranked), ranked_at)
+        self._logger.info(
+            "Fallback ranking precomputed",
+            extra={
+                "service": "PrecomputedFallback",
+                "catalog_version": version,
+                "input_count": len(page.courses),
+                "ranked_count": len(ranked),
+                "elapsed_ms": elapsed_ms,
+            },
+        )
+        return True
+
+    async def run(self) -> None:
+        """Keep the ranking current until cancelled."""
+        if not self.enabled:
+            return
+
+        while True:
+            kept = True
+            ranking = self._ranking
+            if ranking is None or self._outdated(ranking) or self._expired(ranking):
+                try:
+                    kept = await self.refresh()
+                except Exception:
+                    kept = False
+                    self._logger.exception(
+                        "Fallback ranking failed",
+                        extra={"service": "PrecomputedFallback"},
+                    )
+
+            self._wake.clear()
+            if not kept:
+                # Not woken early, so an outage costs one attempt per interval
+                await asyncio.sleep(self._interval)
+                continue
+            with suppress(TimeoutError):
+                async with asyncio.timeout(self._interval):
+                    await self._wake.wait()
+
+    def _outdated(self, ranking: _Ranking) -> bool:
+        return ranking.catalog_version != self._catalog_version.value
+
+    def _expired(self, ranking: _Ranking) -> bool:
+        return self._timer() - ranking.ranked_at >= self._max_age
@@ -0,0 +1,78 @@
+"""Queue and state store of recommendation jobs."""
+
+import asyncio
+from abc import ABC, abstractmethod
+
+from common.infrastructure.cache import LRUCache
+
+
+class IRecommendationJobBackend(ABC):
+    """Job queue and job states behind ``RecommendationJobService``.
+
+    States are JSON strings and jobs are queued by ID, so a store shared
+    between processes can be plugged in; workers of every process then take
+    jobs submitted to any of them. Implementations expire job states on
+    their own TTL.
+    """
+
+    @abstractmethod
+    async def push(self, job_id: str) -> None: ...
+
+    @abstractmethod
+    async def pop(self) -> str:
+        """Take the oldest queued job ID, waiting for one if none is queued."""
+        ...
+
+    @abstractmethod
+    async def queued(self) -> int: ...
+
+    @abstractmethod
+    async def load(self, job_id: str) -> str | None: ...
+
+    @abstractmethod
+    async def save(self, job_id: str, state: str) -> None: ...
+
+    @abstractmethod
+    async def claim(self, key: str, job_id: str) -> str:
+        """Bind ``key`` to ``job_id`` unless it is bound; return the bound job."""
+        ...
+
+    @abstractmethod
+    async def release(self, key: str, job_id: str) -> None:
+        """Unbind ``key`` if it is still bound to ``job_id``."""
+        ...
+
+
+class InMemoryRecommendationJobBackend(IRecommendationJobBackend):
+    """Per-process queue with an LRU/TTL state store."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self._queue: asyncio.Queue[str] = asyncio.Queue()
+        self._states = LRUCache[str, str](
+            max_entries=max_entries,
+            max_bytes=256 * 1024 * 1024,
+            ttl_seconds=ttl_seconds,
+        )
+        self._keys: dict[str, str] = {}
+
+    async def push(self, job_id: str) -> None:
+        self._queue.put_nowait(job_id)
+
+    async def pop(self) -> str:
+        return await self._queue.get()
+
+    async def queued(self) -> int:
+        return self._queue.qsize()
+
+    async def load(self, job_id: str) -> str | None:
+        return self._states.get(job_id)
+
+    async def save(self, job_id: str, state: str) -> None:
+        self._states.put(job_id, state, len(state.encode()))
+
+    async def claim(self, key: str, job_id: str) -> str:
+        return self._keys.setdefault(key, job_id)
+
+    async def release(self, key: str, job_id: str) -> None:
+        if self._keys.get(key) == job_id:
+            del self._keys[key]
@@ -0,0 +1,282 @@
+"""Submit-and-poll recommendations run by a bounded worker pool."""
+
+import asyncio
+import hashlib
+import logging
+import math
+import statistics
+from collections import defaultdict, deque
+from collections.abc import Callable
+from contextlib import suppress
+from uuid import UUID
+
+from common.domain.interfaces.clock import IClock
+from common.domain.interfaces.uuid_generator import IUUIDGenerator
+from pydantic import BaseModel
+from showcase.course.application.exceptions import (
+    RecommendationJobNotFoundError,
+    RecommendationJobRejectedError,
+)
+from showcase.course.application.interfaces.services.recommendation_job_service import (
+    IRecommendationJobService,
+    RecommendationJobDTO,
+    RecommendationJobStatus,
+)
+from showcase.course.application.interfaces.services.recommendation_service import (
+    GetRecommendationsDTO,
+    IRecommendationService,
+    RecommendationsDTO,
+)
+from showcase.course.infrastructure.cache.recommendation_cache import (
+    RecommendationCache,
+)
+from showcase.course.infrastructure.services.jobs.recommendation_job_backend import (
+    IRecommendationJobBackend,
+)
+
+
+FINISHED = (RecommendationJobStatus.SUCCEEDED, RecommendationJobStatus.FAILED)
+
+
+class RecommendationJob(BaseModel):
+    """Job state as kept by the backend."""
+
+    job_id: UUID
+    key: str  # identical unfinished requests share a job
+    submitter: str
+    request: GetRecommendationsDTO
+    status: RecommendationJobStatus = RecommendationJobStatus.QUEUED
+    result: RecommendationsDTO | None = None
+    error: str | None = None
+    submitted_at: float  # Unix time
+    started_at: float | None = None
+    finished_at: float | None = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED
+
+    def to_dto(self) -> RecommendationJobDTO:
+        return RecommendationJobDTO(
+            job_id=self.job_id,
+            status=self.status,
+            result=self.result,
+            error=self.error,
+        )
+
+
+class RecommendationJobService(IRecommendationJobService):
+    """Runs recommendation jobs on a bounded pool of in-process workers.
+
+    ``submit`` stores a job and queues its ID; ``run`` keeps ``workers``
+    tasks taking jobs off the queue, so however many clients wait, at most
+    that many recommendations are computed at once. Unfinished jobs are
+    shared by requests with the same normalized query, limit, skip, ranking
+    mode and debug flag, as in coalescing.
+
+    A submitter may have ``max_active_per_submitter`` unfinished jobs and
+    the queue holds ``max_queued`` jobs; past either limit ``submit`` raises
+    ``RecommendationJobRejectedError`` with a retry delay based on recent
+    job durations. Joining an unfinished job is always admitted.
+
+    ``get`` wakes up when a worker of this process finishes a job and
+    re-reads the backend every ``poll_interval_seconds``, which covers jobs
+    run by other processes on a shared backend. Jobs left running when the
+    process stops keep that status until they expire.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        logger: logging.Logger,
+        recommendations: Callable[[], IRecommendationService],
+        backend: IRecommendationJobBackend,
+        uuid_generator: IUUIDGenerator,
+        clock: IClock,
+        workers: int = 4,
+        max_queued: int = 200,
+        max_active_per_submitter: int = 3,
+        max_wait_seconds: float = 30,
+        poll_interval_seconds: float = 0.5,
+    ) -> None:
+        self._logger = logger
+        self._recommendations = recommendations
+        self._backend = backend
+        self._uuid_generator = uuid_generator
+        self._clock = clock
+        self._workers = workers
+        self._max_queued = max_queued
+        self._max_active = max_active_per_submitter
+        self._max_wait = max_wait_seconds
+        self._poll_interval = poll_interval_seconds
+        self._submitted: defaultdict[str, set[UUID]] = defaultdict(set)
+        self._durations: deque[float] = deque(maxlen=50)
+        self._finished = asyncio.Event()
+
+    @staticmethod
+    def key(dto: GetRecommendationsDTO) -> str:
+        request = "\x1f".join(
+            [
+                RecommendationCache.normalize(dto.query),
+                str(dto.limit),
+                str(dto.skip),
+                dto.ranking,
+                str(dto.debug),
+            ]
+        )
+        return f"recommendation-job:{hashlib.sha256(request.encode()).hexdigest()}"
+
+    async def submit(
+        self, dto: GetRecommendationsDTO, submitter: str
+    ) -> RecommendationJobDTO:
+        job = RecommendationJob(
+            job_id=self._uuid_generator.create(),
+            key=self.key(dto),
+            submitter=submitter,
+            request=dto,
+            submitted_at=self._clock.now().timestamp(),
+        )
+        joined = await self._claim(job)
+        if joined is not None:
+            self._logger.info(
+                "Recommendation job joined",
+                extra={"action": "submit", "job_id": str(joined.job_id)},
+            )
+            return joined.to_dto()
+
+        try:
+            await self._admit(submitter)
+        except RecommendationJobRejectedError as e:
+            await self._backend.release(job.key, str(job.job_id))
+            self._logger.warning(
+                "Recommendation job rejected",
+                extra={"action": "submit", "submitter": submitter, "reason": e.reason},
+            )
+            raise
+
+        await self._save(job)
+        await self._backend.push(str(job.job_id))
+        self._submitted[submitter].add(job.job_id)
+        self._logger.info(
+            "Recommendation job queued",
+            extra={
+                "action": "submit",
+                "job_id": str(job.job_id),
+                "query": dto.query[:200],
+            },
+        )
+        return job.to_dto()
+
+    async def get(self, job_id: UUID, wait_seconds: float = 0) -> RecommendationJobDTO:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + min(max(wait_seconds, 0), self._max_wait)
+        while True:
+            # Taken before reading, so a job finishing in between wakes us
+            finished = self._finished
+            job = await self._load(job_id)
+            if job is None:
+                raise RecommendationJobNotFoundError(job_id)
+
+            remaining = deadline - loop.time()
+            if job.finished or remaining <= 0:
+                return job.to_dto()
+            with suppress(TimeoutError):
+                async with asyncio.timeout(min(remaining, self._poll_interval)):
+                    await finished.wait()
+
+    async def run(self) -> None:
+        """Run the workers until cancelled."""
+        async with asyncio.TaskGroup() as workers:
+            for _ in range(self._workers):
+                workers.create_task(self._work())
+
+    async def _work(self) -> None:
+        while True:
+            job_id = UUID(await self._backend.pop())
+            job = await self._load(job_id)
+            if job is None or job.status != RecommendationJobStatus.QUEUED:
+                continue  # expired while queued
+
+            started_at = self._clock.now().timestamp()
+            job = job.model_copy(
+                update={
+                    "status": RecommendationJobStatus.RUNNING,
+                    "started_at": started_at,
+                }
+            )
+            await self._save(job)
+            try:
+                result = await self._recommendations().recommend(job.request)
+                update = {"status": RecommendationJobStatus.SUCCEEDED, "result": result}
+            except Exception as e:
+                self._logger.exception(
+                    "Recommendation job failed",
+                    extra={"action": "run", "job_id": str(job.job_id)},
+                )
+                update = {
+                    "status": RecommendationJobStatus.FAILED,
+                    "error": type(e).__name__,
+                }
+
+            finished_at = self._clock.now().timestamp()
+            job = job.model_copy(update={**update, "finished_at": finished_at})
+            await self._save(job)
+            await self._backend.release(job.key, str(job.job_id))
+            self._durations.append(finished_at - started_at)
+            self._wake()
+            self._logger.info(
+                "Recommendation job finished",
+                extra={
+                    "action": "run",
+                    "job_id": str(job.job_id),
+                    "status": job.status.value,
+                    "queued_ms": round((started_at - job.submitted_at) * 1000, 1),
+                    "run_ms": round((finished_at - started_at) * 1000, 1),
+                },
+            )
+
+    async def _claim(self, job: RecommendationJob) -> RecommendationJob | None:
+        """Bind the job's key to it, or return the unfinished job holding it."""
+        job_id = str(job.job_id)
+        for _ in range(2):
+            bound = await self._backend.claim(job.key, job_id)
+            if bound == job_id:
+                return None
+            holder = await self._load(UUID(bound))
+            if holder is not None and not holder.finished:
+                return holder
+            # Expired or stuck after a crash; take the key over
+            await self._backend.release(job.key, bound)
+        raise RecommendationJobRejectedError("job key contended", self._retry_after())
+
+    async def _admit(self, submitter: str) -> None:
+        active = self._submitted[submitter]
+        for job_id in list(active):
+            job = await self._load(job_id)
+            if job is None or job.finished:
+                active.discard(job_id)
+        if not active:
+            del self._submitted[submitter]
+
+        if len(active) >= self._max_active:
+            raise RecommendationJobRejectedError(
+                "too many unfinished jobs", self._retry_after()
+            )
+        if await self._backend.queued() >= self._max_queued:
+            raise RecommendationJobRejectedError("queue is full", self._retry_after())
+
+    def _retry_after(self) -> int:
+        typical = statistics.median(self._durations) if self._durations else 1
+        return max(math.ceil(typical), 1)
+
+    def _wake(self) -> None:
+        finished, self._finished = self._finished, asyncio.Event()
+        finished.set()
+
+    async def _load(self, job_id: UUID) -> RecommendationJob | None:
+        state = await self._backend.load(str(job_id))
+        if state is None:
+            return None
+        return RecommendationJob.model_validate_json(state)
+
+    async def _save(self, job: RecommendationJob) -> None:
+        await self._backend.save(str(job.job_id), job.model_dump_json())
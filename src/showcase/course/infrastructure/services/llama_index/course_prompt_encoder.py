@@ -0,0 +1,139 @@
+"""Compact, token-budgeted encoding of courses for the ranking prompt."""
+
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from common.infrastructure.cache import LRUCache
+from common.infrastructure.services.llama_index.tokens import estimate_tokens
+from showcase.course.application.read_models.course_read_model import CourseReadModel
+
+
+# Section titles such as "Модуль 3" say nothing about the content
+GENERIC_SECTION = re.compile(
+    r"^(модуль|раздел|урок|занятие|неделя|тема|часть|module|section|lesson|week|part)"
+    r"\s*\d+\.?$",
+    re.IGNORECASE,
+)
+
+
+@dataclass(frozen=True)
+class EncodedCourses:
+    table: str  # TSV header and one line per course
+    aliases: dict[str, UUID]  # first column back to course IDs
+    level: int  # detail level that fit the budget, 0 is the richest
+    tokens: int  # estimated tokens of ``table``
+
+
+@dataclass(frozen=True)
+class _Level:
+    columns: tuple[str, ...]
+    description_chars: int  # 0 drops the description
+    section_chars: int | None  # None drops sections, 0 keeps titles only
+
+
+class CoursePromptEncoder:
+    """Renders courses as a TSV table that fits a token budget.
+
+    Courses are referred to by short positional aliases (``c1``, ``c2``, …)
+    instead of UUIDs; ``EncodedCourses.aliases`` maps them back. Empty
+    fields, skill descriptions and generic section titles are left out.
+
+    Every course is rendered at each detail level once per version
+    (``course_id`` and ``updated_at``) and cached. ``encode`` then picks the
+    richest level whose table fits ``budget``, falling back to the leanest.
+    """
+
+    LEVELS = (
+        _Level(
+            ("id", "название", "категории", "навыки", "описание", "модули"), 400, 60
+        ),
+        _Level(("id", "название", "категории", "навыки", "описание", "модули"), 160, 0),
+        _Level(("id", "название", "категории", "навыки", "описание"), 80, None),
+        _Level(("id", "название", "категории", "навыки"), 0, None),
+    )
+
+    def __init__(self, max_entries: int = 5000, ttl_seconds: float = 3600) -> None:
+        self._cache = LRUCache[tuple[UUID, datetime], tuple[tuple[str, int], ...]](
+            max_entries=max_entries,
+            max_bytes=64 * 1024 * 1024,
+            ttl_seconds=ttl_seconds,
+        )
+
+    def encode(self, courses: Sequence[CourseReadModel], budget: int) -> EncodedCourses:
+        aliases = {f"c{i}": c.course_id for i, c in enumerate(courses, start=1)}
+        rows = [self._rows(course) for course in courses]
+
+        def tokens(level: int) -> int:
+            header = estimate_tokens("\t".join(self.LEVELS[level].columns))
+            return header + sum(row[level][1] for row in rows)
+
+        level = next(
+            (i for i in range(len(self.LEVELS)) if tokens(i) <= budget),
+            len(self.LEVELS) - 1,
+        )
+        lines = [
+            f"{alias}\t{row[level][0]}"
+            for alias, row in zip(aliases, rows, strict=True)
+        ]
+        return EncodedCourses(
+            table="\n".join(["\t".join(self.LEVELS[level].columns), *lines]),
+            aliases=aliases,
+            level=level,
+            tokens=tokens(level),
+        )
+
+    def _rows(self, course: CourseReadModel) -> tuple[tuple[str, int], ...]:
+        """Course lines at every level, without the alias, with token counts."""
+        key = (course.course_id, course.updated_at)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        # One extra token per line for the alias and line break
+        rows = tuple(
+            (row, estimate_tokens(row) + 2)
+            for row in (self._row(course, level) for level in self.LEVELS)
+        )
+        self._cache.put(key, rows, sum(len(row.encode()) for row, _ in rows))
+        return rows
+
+    @classmethod
+    def _row(cls, course: CourseReadModel, level: _Level) -> str:
+        fields = [
+            _clean(course.name),
+            "; ".join(_clean(c.name) for c in course.categories),
+            "; ".join(_clean(s.name) for s in course.acquired_skills),
+        ]
+        if level.description_chars:
+            fields.append(_clip(course.description or "", level.description_chars))
+        if level.section_chars is not None:
+            fields.append(cls._sections(course, level.section_chars))
+        return "\t".join(fields)
+
+    @staticmethod
+    def _sections(course: CourseReadModel, chars: int) -> str:
+        sections = []
+        for section in course.sections:
+            title = _clean(section.name)
+            title = "" if GENERIC_SECTION.match(title) else title
+            description = _clip(section.description or "", chars or 40)
+            if chars and title and description:
+                sections.append(f"{title}: {description}")
+            elif title or description:
+                sections.append(title or description)
+        return "; ".join(sections)
+
+
+def _clean(text: str) -> str:
+    """Collapse whitespace, which also keeps tabs and newlines out of cells."""
+    return " ".join(text.split())
+
+
+def _clip(text: str, chars: int) -> str:
+    text = _clean(text)
+    if len(text) <= chars:
+        return text
+    return text[:chars].rsplit(" ", 1)[0] + "…"
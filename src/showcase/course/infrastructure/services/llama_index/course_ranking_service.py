@@ -1,23 +1,37 @@
 """Course ranking: LLM-based ordering by relevance to user goal."""
 
+import asyncio
+import itertools
 import logging
+from collections.abc import Sequence
 from functools import reduce
 from uuid import UUID
 
+from common.infrastructure.config.llm_config import LLMResilienceConfig
+from common.infrastructure.services.llama_index.guard import (
+    LLMGuard,
+    LLMUnavailableError,
+)
+from common.infrastructure.services.llama_index.instrumentation import LLMMetrics
 from llama_index.core import PromptTemplate
 from llama_index.core.llms import LLM
 from pydantic import BaseModel
 from showcase.course.application.interfaces.services.course_ranking_service import (
     ICourseRankingService,
 )
-from showcase.course.application.read_models.course_read_model import (
-    CourseRankingReadModel,
-    CourseReadModel,
+from showcase.course.application.read_models.course_read_model import CourseReadModel
+from showcase.course.infrastructure.services.llama_index.course_prompt_encoder import (
+    CoursePromptEncoder,
+    EncodedCourses,
 )
 
 
+_Scored = tuple[CourseReadModel, float]  # course and confidence
+_Merged = tuple[CourseReadModel, float, int]  # with the index of its chunk
+
+
 class CourseRankingItem(BaseModel):
-    course_id: UUID
+    id: str  # alias from the first column of the course table
     confidence: float
 
 
@@ -30,18 +44,20 @@ class CourseRankingLLM(BaseModel):
 class CourseRankingService(ICourseRankingService):
     """Ranks courses by relevance to user query using LLM."""
 
+    LLM_STAGE = "ranking"
     MIN_CONFIDENCE: float = 0.5
+    TIEBREAK_MARGIN: float = 0.05
     RANKING_WEAK_THRESHOLD: int = 3
     RANKING_PROMPT = PromptTemplate(
         """
         Пользовательская цель:
         "{query}"
 
-        Курсы:
+        Курсы (TSV, первая строка — заголовок, id — первая колонка):
         {courses}
 
         Верни JSON:
-        - courses: list[{"course_id": UUID, "confidence": float}]
+        - courses: list[{"id": str, "confidence": float}]
 
         Отсортируй курсы от наиболее подходящего к наименее подходящему, исключи полностью неподходящие.
         Курс должен быть ИСКЛЮЧЁН из списка, если:
@@ -59,16 +75,50 @@ class CourseRankingService(ICourseRankingService):
         """
     )
 
-    def __init__(self, logger: logging.Logger, llm: LLM) -> None:
+    def __init__(  # noqa: PLR0913
+        self,
+        logger: logging.Logger,
+        llm: LLM,
+        encoder: CoursePromptEncoder | None = None,
+        token_budget: int = 4000,
+        chunk_size: int = 25,
+        concurrency: int = 4,
+        tiebreak_size: int = 10,
+        guard: LLMGuard | None = None,
+        fallback: ICourseRankingService | None = None,
+        metrics: LLMMetrics | None = None,
+    ) -> None:
         self._logger = logger
-        self._llm = llm
+        self._ranking_llm = llm.as_structured_llm(CourseRankingLLM)
+        self._encoder = encoder or CoursePromptEncoder()
+        self._token_budget = token_budget
+        self._chunk_size = max(chunk_size, 1)
+        self._concurrency = max(concurrency, 1)
+        self._tiebreak_size = tiebreak_size
+        self._guard = guard or LLMGuard(logger, LLMResilienceConfig())
+        self._fallback = fallback
+        self._metrics = metrics or LLMMetrics()
 
     async def rank(
-        self, query: str, courses: list[CourseReadModel]
+        self,
+        query: str,
+        courses: list[CourseReadModel],
+        category_names: Sequence[str] | None = None,
+        limit: int | None = None,
+        fallback: bool = False,
     ) -> tuple[list[CourseReadModel], bool]:
         """Rank courses by relevance. Returns (ranked_courses, ranking_weak).
 
         ranking_weak=True if LLM returned no/empty IDs → keep original order.
+        Without a usable LLM answer (deadline passed, circuit open, provider
+        error or malformed answer), ``fallback`` ranks the courses instead, or
+        the original order is kept as a weak ranking.
+
+        More than ``chunk_size`` courses are split into even chunks ranked
+        concurrently, at most ``concurrency`` at a time, and merged by
+        confidence. When courses from different chunks end up within
+        ``TIEBREAK_MARGIN`` of each other among the first ``tiebreak_size``,
+        those courses are ranked once more in a single prompt.
         """
         if not courses:
             self._logger.warning(
@@ -77,42 +127,41 @@ class CourseRankingService(ICourseRankingService):
             )
             return [], False
 
-        ranking_courses = [
-            CourseRankingReadModel.from_course_read_model(c) for c in courses
-        ]
-        courses_json = [c.model_dump(mode="json") for c in ranking_courses]
-
+        chunks = self._chunks(courses)
         self._logger.debug(
             "Sending ranking request to LLM",
             extra={
                 "service": "CourseRanking",
                 "query": query[:200],
                 "courses_count": len(courses),
+                "chunks_count": len(chunks),
             },
         )
 
-        ranking_llm = self._llm.as_structured_llm(CourseRankingLLM)
-        formatted = self.RANKING_PROMPT.format(query=query, courses=courses_json)
-        response = await ranking_llm.acomplete(formatted)
-        result = CourseRankingLLM.model_validate_json(response.text)
-
-        self._logger.info(
-            "Ranking received",
-            extra={
-                "service": "CourseRanking",
-                "ranked_count": len(result.courses),
-                "ranked_ids": [str(c.course_id) for c in result.courses],
-                "ranked_confidence": [c.confidence for c in result.courses],
-            },
-        )
-
-        course_by_id = {c.course_id: c for c in courses}
-        ranked = [
-            course_by_id[c.course_id]
-            for c in result.courses
-            if c.course_id in course_by_id
-        ]
+        try:
+            if len(chunks) == 1:
+                scored = await self._rank_chunk(query, courses)
+            else:
+                scored = await self._rank_chunks(query, chunks)
+        except LLMUnavailableError as e:
+            self._logger.warning(
+                "Ranking skipped: LLM unavailable",
+                extra={
+                    "service": "CourseRanking",
+                    "reason": str(e),
+                    "fallback": type(self._fallback).__name__
+                    if self._fallback
+                    else None,
+                },
+            )
+            if self._fallback is not None:
+                return await self._fallback.rank(
+                    query, courses, category_names, limit, fallback
+                )
+            return courses, True
 
+        ranked = [course for course, _ in scored]
+        confidences = [confidence for _, confidence in scored]
         ranking_weak = not ranked
 
         if not ranked:
@@ -122,31 +171,170 @@ class CourseRankingService(ICourseRankingService):
             )
             ranked = courses
             ranking_weak = True
-        elif self.is_below_threshold(result.courses):
+        elif self.is_below_threshold(confidences):
             self._logger.warning(
                 "Ranking weak: confidence level is below threshold for all courses",
                 extra={
                     "service": "CourseRanking",
                     "min_confidence": self.MIN_CONFIDENCE,
-                    "ranked_confidence": [c.confidence for c in result.courses],
+                    "ranked_confidence": confidences,
                 },
             )
             ranking_weak = True
 
         return ranked, ranking_weak
 
+    async def _rank_chunks(
+        self, query: str, chunks: list[list[CourseReadModel]]
+    ) -> list[_Scored]:
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def rank_chunk(chunk: list[CourseReadModel]) -> list[_Scored] | Exception:
+            async with semaphore:
+                try:
+                    return await self._rank_chunk(query, chunk)
+                except Exception as e:
+                    return e  # raised below, outside the task group
+
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(rank_chunk(chunk)) for chunk in chunks]
+        results: list[list[_Scored]] = []
+        for task in tasks:
+            result = task.result()
+            if isinstance(result, Exception):
+                raise result
+            results.append(self._non_increasing(result))
+
+        # Confidences are non-increasing within a chunk, so a stable sort
+        # keeps every chunk's own order
+        merged = sorted(
+            (
+                (course, confidence, index)
+                for index, result in enumerate(results)
+                for course, confidence in result
+            ),
+            key=lambda item: -item[1],
+        )
+
+        head = merged[: self._tiebreak_size]
+        if len(head) > 1 and self._needs_tiebreak(head):
+            head = await self._tiebreak(query, head)
+
+        return [
+            (course, confidence)
+            for course, confidence, _ in [*head, *merged[len(head) :]]
+        ]
+
+    async def _tiebreak(self, query: str, head: list[_Merged]) -> list[_Merged]:
+        """Reorder ``head`` with one more prompt; courses it omits go last."""
+        try:
+            reranked = await self._rank_chunk(query, [c for c, _, _ in head])
+        except Exception as e:
+            self._logger.warning(
+                "Ranking tie-break failed, keeping merged order",
+                extra={"service": "CourseRanking", "error": str(e)},
+            )
+            return head
+
+        position = {c.course_id: i for i, (c, _) in enumerate(reranked)}
+        self._logger.debug(
+            "Ranking tie-break applied",
+            extra={"service": "CourseRanking", "courses_count": len(head)},
+        )
+        # Chunk confidences are kept, the tie-break only decides the order
+        return sorted(head, key=lambda item: position.get(item[0].course_id, len(head)))
+
+    async def _rank_chunk(
+        self, query: str, courses: list[CourseReadModel]
+    ) -> list[_Scored]:
+        """Ranked courses of one prompt with the confidences the LLM gave."""
+        prompt, encoded = self.build_prompt(query, courses)
+        with self._metrics.call(self.LLM_STAGE):
+            result = await self._guard.run(lambda: self._complete(prompt))
+
+        # Map aliases back; unknown and repeated ones are dropped
+        course_by_id = {c.course_id: c for c in courses}
+        confidence_by_id: dict[UUID, float] = {}
+        for item in result.courses:
+            course_id = encoded.aliases.get(item.id.strip())
+            if course_id is not None:
+                confidence_by_id.setdefault(course_id, item.confidence)
+
+        self._logger.info(
+            "Ranking received",
+            extra={
+                "service": "CourseRanking",
+                "ranked_count": len(result.courses),
+                "ranked_ids": [str(course_id) for course_id in confidence_by_id],
+                "ranked_confidence": [c.confidence for c in result.courses],
+                "prompt_level": encoded.level,
+                "prompt_tokens": encoded.tokens,
+            },
+        )
+
+        return [
+            (course_by_id[course_id], confidence)
+            for course_id, confidence in confidence_by_id.items()
+        ]
+
+    @staticmethod
+    def _non_increasing(scored: list[_Scored]) -> list[_Scored]:
+        """Clamp to [0, 1] and never let a course outscore one ranked above it.
+
+        Only applied before merging chunks, so a single prompt is judged by
+        the confidences the LLM gave.
+        """
+        calibrated: list[_Scored] = []
+        ceiling = 1.0
+        for course, confidence in scored:
+            ceiling = min(ceiling, max(confidence, 0.0))
+            calibrated.append((course, ceiling))
+        return calibrated
+
+    async def _complete(self, prompt: str) -> CourseRankingLLM:
+        # Parsed inside the guard, so a malformed answer counts as a failure
+        response = await self._ranking_llm.acomplete(prompt)
+        return CourseRankingLLM.model_validate_json(response.text)
+
+    def _chunks(self, courses: list[CourseReadModel]) -> list[list[CourseReadModel]]:
+        """Split ``courses`` into the fewest chunks of near-equal size."""
+        count = -(-len(courses) // self._chunk_size)
+        size, extra = divmod(len(courses), count)
+        chunks, start = [], 0
+        for index in range(count):
+            end = start + size + (index < extra)
+            chunks.append(courses[start:end])
+            start = end
+        return chunks
+
     @classmethod
-    def is_below_threshold(cls, courses: list[CourseRankingItem]) -> bool:
-        if not courses:
+    def _needs_tiebreak(cls, head: list[_Merged]) -> bool:
+        """Whether neighbours from different chunks are too close to order."""
+        return any(
+            a[2] != b[2] and a[1] - b[1] < cls.TIEBREAK_MARGIN
+            for a, b in itertools.pairwise(head)
+        )
+
+    def build_prompt(
+        self, query: str, courses: list[CourseReadModel]
+    ) -> tuple[str, EncodedCourses]:
+        """Format the ranking prompt for ``courses`` within the token budget."""
+        encoded = self._encoder.encode(courses, self._token_budget)
+        prompt = self.RANKING_PROMPT.format(query=query, courses=encoded.table)
+        return prompt, encoded
+
+    @classmethod
+    def is_below_threshold(cls, confidences: list[float]) -> bool:
+        if not confidences:
             return True
 
-        if len(courses) <= cls.RANKING_WEAK_THRESHOLD:
-            return not any(c.confidence >= cls.MIN_CONFIDENCE for c in courses)
+        if len(confidences) <= cls.RANKING_WEAK_THRESHOLD:
+            return not any(c >= cls.MIN_CONFIDENCE for c in confidences)
 
         return (
             reduce(
                 lambda count, x: count + (x >= cls.MIN_CONFIDENCE),
-                [c.confidence for c in courses],
+                confidences,
                 0,
             )
             <= cls.RANKING_WEAK_THRESHOLD
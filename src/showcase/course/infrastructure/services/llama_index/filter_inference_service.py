@@ -2,8 +2,17 @@
 
 import logging
 
+from common.infrastructure.config.llm_config import LLMResilienceConfig
+from common.infrastructure.services.llama_index.guard import (
+    LLMGuard,
+    LLMUnavailableError,
+)
+from common.infrastructure.services.llama_index.instrumentation import LLMMetrics
 from llama_index.core import PromptTemplate
 from llama_index.core.llms import LLM
+from showcase.category.application.read_models.category_snapshot import (
+    CategorySnapshot,
+)
 from showcase.course.application.interfaces.services.filter_inference_service import (
     IFilterInferenceService,
 )
@@ -13,6 +22,8 @@ from showcase.course.application.read_models.filter_inference import CourseFilte
 class FilterInferenceService(IFilterInferenceService):
     """Infers structured course filter from user query using LLM."""
 
+    LLM_STAGE = "filter_inference"
+
     FILTER_PROMPT = PromptTemplate(
         """
         Ты — ассистент подбора образовательных курсов.
@@ -48,27 +59,45 @@ class FilterInferenceService(IFilterInferenceService):
         """
     )
 
-    def __init__(self, logger: logging.Logger, llm: LLM) -> None:
+    def __init__(
+        self,
+        logger: logging.Logger,
+        llm: LLM,
+        guard: LLMGuard | None = None,
+        metrics: LLMMetrics | None = None,
+    ) -> None:
         self._logger = logger
-        self._llm = llm
+        self._filter_llm = llm.as_structured_llm(CourseFilterLLM)
+        self._guard = guard or LLMGuard(logger, LLMResilienceConfig())
+        self._metrics = metrics or LLMMetrics()
 
-    async def infer(self, query: str, category_names: set[str]) -> CourseFilterLLM:
-        """Infers CourseFilterLLM from user query and available categories."""
-        categories_str = "\n".join(sorted(category_names)) if category_names else "нет"
+    async def infer(self, query: str, categories: CategorySnapshot) -> CourseFilterLLM:
+        """Infers CourseFilterLLM from user query and available categories.
+
+        Without a usable LLM answer (deadline passed, circuit open, provider
+        error or malformed answer) the query is treated as indecisive.
+        """
+        categories_str = categories.names_text or "нет"
 
         self._logger.debug(
             "Inferring filter from query",
             extra={
                 "service": "FilterInference",
                 "query": query[:200],
-                "categories_count": len(category_names),
+                "categories_count": len(categories.names),
             },
         )
 
-        filter_llm = self._llm.as_structured_llm(CourseFilterLLM)
         formatted = self.FILTER_PROMPT.format(query=query, categories=categories_str)
-        response = await filter_llm.acomplete(formatted)
-        result = CourseFilterLLM.model_validate_json(response.text)
+        try:
+            with self._metrics.call(self.LLM_STAGE):
+                result = await self._guard.run(lambda: self._complete(formatted))
+        except LLMUnavailableError as e:
+            self._logger.warning(
+                "Filter inference skipped: LLM unavailable",
+                extra={"service": "FilterInference", "reason": str(e)},
+            )
+            return CourseFilterLLM(is_decisive=False)
 
         self._logger.info(
             "Filter inferred",
@@ -83,3 +112,8 @@ class FilterInferenceService(IFilterInferenceService):
         )
 
         return result
+
+    async def _complete(self, prompt: str) -> CourseFilterLLM:
+        # Parsed inside the guard, so a malformed answer counts as a failure
+        response = await self._filter_llm.acomplete(prompt)
+        return CourseFilterLLM.model_validate_json(response.text)
@@ -0,0 +1,34 @@
+"""Per-request breakdown of LLM calls for debug recommendations."""
+
+from dataclasses import asdict, replace
+
+from common.infrastructure.services.llama_index.instrumentation import LLMMetrics
+from showcase.course.application.interfaces.services.recommendation_service import (
+    GetRecommendationsDTO,
+    IRecommendationService,
+    LLMCallBreakdown,
+    RecommendationsDTO,
+)
+
+
+class LLMBreakdownRecommendationService(IRecommendationService):
+    """Attaches the LLM calls made for a ``debug`` request to its result.
+
+    Calls are gathered with ``LLMMetrics.collect`` around ``inner``, so only
+    calls made while computing this request are listed: none when the
+    result came from the cache.
+    """
+
+    def __init__(self, inner: IRecommendationService, metrics: LLMMetrics) -> None:
+        self.inner = inner
+        self.metrics = metrics
+
+    async def recommend(self, dto: GetRecommendationsDTO) -> RecommendationsDTO:
+        if not dto.debug:
+            return await self.inner.recommend(dto)
+
+        with self.metrics.collect() as calls:
+            result = await self.inner.recommend(dto)
+        return replace(
+            result, llm_calls=[LLMCallBreakdown(**asdict(call)) for call in calls]
+        )
@@ -0,0 +1,82 @@
+"""Dictionary matching of category names in free text."""
+
+import re
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+
+
+TOKEN_PATTERN = re.compile(r"\w+")
+STEM_LENGTH = 5  # folds most Russian inflections: "анализу", "анализ"
+
+
+@dataclass(frozen=True)
+class Token:
+    word: str  # lowercased, as matched against FILLER
+    stem: str
+    start: int  # character span in the source text
+    end: int
+
+
+def tokenize(text: str) -> list[Token]:
+    """Lowercased, crudely stemmed words with their spans."""
+    text = text.lower().replace("ё", "е")
+    return [
+        Token(m.group(), m.group()[:STEM_LENGTH], m.start(), m.end())
+        for m in TOKEN_PATTERN.finditer(text)
+    ]
+
+
+def stems(text: str) -> tuple[str, ...]:
+    return tuple(token.stem for token in tokenize(text))
+
+
+@dataclass
+class _Node:
+    children: dict[str, "_Node"]
+    category: str | None = None
+
+
+class CategoryMatcher:
+    """Trie over stemmed words of category names and their synonyms.
+
+    ``match`` scans a query left to right, taking the longest phrase that
+    starts at each word, so "анализ данных" wins over "анализ" and phrases
+    never overlap.
+    """
+
+    def __init__(
+        self, names: Iterable[str], synonyms: Mapping[str, Iterable[str]]
+    ) -> None:
+        self._root = _Node({})
+        for name in names:
+            for phrase in [name, *synonyms.get(name, ())]:
+                self._add(stems(phrase), name)
+
+    def match(self, tokens: list[Token]) -> tuple[set[str], set[int]]:
+        """Return the matched categories and the indices of the covered tokens."""
+        categories: set[str] = set()
+        covered: set[int] = set()
+        start = 0
+        while start < len(tokens):
+            node, end, found = self._root, start, None
+            while end < len(tokens) and tokens[end].stem in node.children:
+                node = node.children[tokens[end].stem]
+                end += 1
+                if node.category is not None:
+                    found = (node.category, end)
+
+            if found is None:
+                start += 1
+                continue
+            categories.add(found[0])
+            covered.update(range(start, found[1]))
+            start = found[1]
+        return categories, covered
+
+    def _add(self, phrase: tuple[str, ...], category: str) -> None:
+        if not phrase:
+            return
+        node = self._root
+        for stem in phrase:
+            node = node.children.setdefault(stem, _Node({}))
+        node.category = category
@@ -0,0 +1,175 @@
+"""Filter inference fast path: dictionary and pattern rules before the LLM."""
+
+import logging
+import re
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+
+from showcase.category.application.read_models.category_snapshot import (
+    CategorySnapshot,
+)
+from showcase.course.application.interfaces.services.filter_inference_service import (
+    IFilterInferenceService,
+)
+from showcase.course.application.read_models.filter_inference import CourseFilterLLM
+from showcase.course.domain.value_objects.format import Format
+from showcase.course.infrastructure.services.rules.category_matcher import (
+    CategoryMatcher,
+    Token,
+    tokenize,
+)
+
+
+FORMAT_PATTERNS = {
+    Format.ONLINE: re.compile(r"\b(онлайн\w*|online|дистанционн\w*|удал[её]нн\w*)"),
+    Format.OFFLINE: re.compile(r"\b(офлайн\w*|оффлайн\w*|offline|очн\w*)"),
+    Format.MIXED: re.compile(r"\b(смешанн\w*|гибридн\w*|blended|mixed)"),
+}
+DURATION_PATTERN = re.compile(
+    r"\b(до|не более|не больше|не дольше|меньше|максимум)\s+(\d{1,4})\s*(час\w*|ч)\b"
+)
+CERTIFICATE_PATTERN = re.compile(r"\b(с\s+)?(сертификат\w*|диплом\w*|удостоверени\w*)")
+NEGATED_CERTIFICATE = re.compile(r"\bбез\s+(сертификат|диплом|удостоверени)")
+
+# Words that carry no filter of their own; anything else left over after
+# categories and constraints are matched sends the query to the LLM.
+# Compared as whole words, not stems: "программа" shares its stem with
+# "программирование", which names a topic
+FILLER = frozenset(
+    (
+        "хочу хотел хотела хотелось бы мне меня нужен нужна нужно нужны ищу "
+        "найти подбери подберите посоветуй посоветуйте покажи покажите курс "
+        "курса курсы курсов курсу курсе курсам обучение обучения обучиться "
+        "научиться изучить изучение изучения освоить программа программы "
+        "программу какой какие хороший хорошие лучший лучшие по на в во и "
+        "или для с со о об про от а"
+    ).split()
+)
+
+
+@dataclass(frozen=True)
+class RuleFilterStats:
+    answered: int  # LLM calls avoided
+    deferred: int  # queries passed on to the inner service
+
+    @property
+    def answer_rate(self) -> float:
+        total = self.answered + self.deferred
+        return self.answered / total if total else 0.0
+
+
+class RuleFilterInferenceService(IFilterInferenceService):
+    """Infers filters for plain queries without calling ``inner``.
+
+    Category names and their configured ``synonyms`` are matched with
+    ``CategoryMatcher``; format, a maximum duration ("до 20 часов") and a
+    certificate requirement are matched with patterns. The result is
+    returned only when every word of the query is accounted for, by a
+    match or as a filler word, and at least one filter was found. Anything
+    else, including conflicting formats and negations, goes to ``inner``.
+
+    The matcher is rebuilt whenever the category snapshot changes.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        inner: IFilterInferenceService,
+        enabled: bool = True,
+        synonyms: Mapping[str, Sequence[str]] | None = None,
+    ) -> None:
+        self._logger = logger
+        self.inner = inner
+        self.enabled = enabled
+        self._synonyms = synonyms or {}
+        self._matcher: CategoryMatcher | None = None
+        self._matcher_digest: str | None = None
+        self._answered = 0
+        self._deferred = 0
+
+    async def infer(self, query: str, categories: CategorySnapshot) -> CourseFilterLLM:
+        result = self.parse(query, categories) if self.enabled else None
+        if result is None:
+            self._deferred += 1
+            return await self.inner.infer(query, categories)
+
+        self._answered += 1
+        stats = self.stats()
+        self._logger.debug(
+            "Filter inferred by rules",
+            extra={
+                "service": "FilterInference",
+                "category_names": result.category_names,
+                "format": result.format.value if result.format else None,
+                "max_duration_hours": result.max_duration_hours,
+                "certificate_required": result.certificate_required,
+                "llm_calls_avoided": stats.answered,
+                "answer_rate": round(stats.answer_rate, 3),
+            },
+        )
+        return result
+
+    def parse(self, query: str, categories: CategorySnapshot) -> CourseFilterLLM | None:
+        """Decisive filter for ``query``, or None when the rules are unsure."""
+        text = query.lower().replace("ё", "е")
+        if NEGATED_CERTIFICATE.search(text):
+            return None
+
+        spans: list[tuple[int, int]] = []
+
+        formats = set()
+        for format_, pattern in FORMAT_PATTERNS.items():
+            for match in pattern.finditer(text):
+                formats.add(format_)
+                spans.append(match.span())
+        if len(formats) > 1:
+            return None
+
+        max_duration_hours = None
+        durations = list(DURATION_PATTERN.finditer(text))
+        if len(durations) > 1:
+            return None
+        if durations:
+            max_duration_hours = int(durations[0].group(2))
+            spans.append(durations[0].span())
+
+        certificate = list(CERTIFICATE_PATTERN.finditer(text))
+        spans += [match.span() for match in certificate]
+
+        tokens = tokenize(query)
+        category_names, covered = self._matcher_for(categories).match(tokens)
+        leftover = [
+            token
+            for index, token in enumerate(tokens)
+            if index not in covered and not _within(token, spans)
+        ]
+        if any(token.word not in FILLER for token in leftover):
+            return None
+
+        result = CourseFilterLLM(
+            is_decisive=True,
+            category_names=sorted(category_names) or None,
+            format=formats.pop() if formats else None,
+            max_duration_hours=max_duration_hours,
+            certificate_required=True if certificate else None,
+        )
+        has_filter = (
+            result.category_names
+            or result.format
+            or result.max_duration_hours
+            or result.certificate_required
+        )
+        return result if has_filter else None
+
+    def stats(self) -> RuleFilterStats:
+        return RuleFilterStats(answered=self._answered, deferred=self._deferred)
+
+    def _matcher_for(self, categories: CategorySnapshot) -> CategoryMatcher:
+        if self._matcher is None or self._matcher_digest != categories.names_digest:
+            self._matcher = CategoryMatcher(categories.names, self._synonyms)
+            self._matcher_digest = categories.names_digest
+        return self._matcher
+
+
+def _within(token: Token, spans: list[tuple[int, int]]) -> bool:
+    return any(start <= token.start and token.end <= end for start, end in spans)
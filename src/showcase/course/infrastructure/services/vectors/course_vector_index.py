@@ -0,0 +1,319 @@
+"""Memory-mapped index of course text vectors."""
+
+import asyncio
+import fcntl
+import logging
+import shutil
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import IO, Literal
+from uuid import UUID
+
+import numpy as np
+import numpy.typing as npt
+from common.application.interfaces.catalog.catalog_change_listener import (
+    CatalogChange,
+    CatalogEntity,
+    ICatalogChangeListener,
+)
+from showcase.course.application.interfaces.repositories import ICourseReadRepository
+from showcase.course.application.read_models.course_read_model import CourseReadModel
+from showcase.course.infrastructure.services.vectors.hashing_vectorizer import (
+    HashingVectorizer,
+)
+
+
+def course_document(course: CourseReadModel) -> str:
+    """Text a course is matched on: what the LLM ranking prompt shows."""
+    parts = [course.name, course.description or ""]
+    parts += [category.name for category in course.categories]
+    parts += course.tags
+    for skill in course.acquired_skills:
+        parts += [skill.name, skill.description or ""]
+    for section in course.sections:
+        parts += [section.name, section.description or ""]
+    return "\n".join(part for part in parts if part)
+
+
+class CourseVectorIndex(ICatalogChangeListener):
+    """Hashed TF vectors of every course, memory-mapped from ``path``.
+
+    The directory holds three ``.npy`` files: ``vectors`` (one row per slot),
+    ``ids`` (16 UUID bytes per slot, zeros for a free slot) and ``df``
+    (document frequency per bucket). Rows are only paged in when scored.
+
+    ``rebuild`` writes the index offline. Committed course changes update the
+    course's row in place through ``on_change``, with the file writes run in
+    a worker thread. Changes to categories, skills and tags are left to the
+    next rebuild.
+
+    Only one process writes a directory: a ``writable`` index takes an
+    exclusive lock on ``<path>.lock`` and, when another process holds it,
+    falls back to reading. A read-only index maps the files read-only and
+    ignores changes; courses it has not seen are vectorized on the fly.
+
+    ``score`` weights both sides by IDF and returns cosine similarities.
+    Candidates missing from the index are vectorized on the fly; without a
+    ``path`` that is every candidate, with uniform IDF.
+    """
+
+    INITIAL_CAPACITY = 1024
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        path: str | None,
+        vectorizer: HashingVectorizer,
+        course_repository: ICourseReadRepository,
+        writable: bool = True,
+    ) -> None:
+        self._logger = logger
+        self._path = Path(path) if path else None
+        self._vectorizer = vectorizer
+        self._course_repository = course_repository
+        self._write_lock = asyncio.Lock()
+        self._lock_file = (
+            self._acquire_writer(self._path)
+            if writable and self._path is not None
+            else None
+        )
+
+        dimensions = vectorizer.dimensions
+        self._vectors: npt.NDArray[np.float32] = np.zeros(
+            (0, dimensions), dtype=np.float32
+        )
+        self._ids: npt.NDArray[np.uint8] = np.zeros((0, 16), dtype=np.uint8)
+        self._df: npt.NDArray[np.float32] = np.zeros(dimensions, dtype=np.float32)
+        self._rows: dict[UUID, int] = {}
+        self._free: list[int] = []
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @property
+    def vectorizer(self) -> HashingVectorizer:
+        return self._vectorizer
+
+    @property
+    def writable(self) -> bool:
+        return self._lock_file is not None
+
+    def document_frequencies(
+        self, buckets: npt.NDArray[np.intp]
+    ) -> npt.NDArray[np.float32]:
+        """Indexed courses containing each bucket; see ``len`` for the total."""
+        frequencies: npt.NDArray[np.float32] = self._df[buckets]
+        return frequencies
+
+    def score(
+        self, query: str, courses: Sequence[CourseReadModel]
+    ) -> npt.NDArray[np.float32]:
+        """Similarity of each course to ``query``, in the given order."""
+        if not courses:
+            return np.zeros(0, dtype=np.float32)
+
+        idf = self._idf()
+        documents = np.stack([self._vector(course) for course in courses]) * idf
+        documents /= np.maximum(np.linalg.norm(documents, axis=1, keepdims=True), 1e-9)
+
+        query_vector = self._vectorizer.vector(query) * idf
+        query_vector /= max(float(np.linalg.norm(query_vector)), 1e-9)
+        return documents @ query_vector
+
+    def rebuild(self, courses: Iterable[CourseReadModel]) -> int:
+        """Replace the index with ``courses`` and return how many were written."""
+        if self._path is None:
+            raise ValueError("Course vector index has no path")
+        if not self.writable:
+            raise ValueError(
+                f"Course vector index {self._path} is written by another process"
+            )
+
+        vectors = [
+            (course.course_id, self._vectorizer.vector(course_document(course)))
+            for course in courses
+        ]
+        capacity = max(self.INITIAL_CAPACITY, len(vectors))
+
+        staging = self._path.with_name(f"{self._path.name}.tmp")
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir(parents=True)
+        matrix, ids = self._create(staging, capacity)
+        df = np.zeros(self._vectorizer.dimensions, dtype=np.float32)
+        for row, (course_id, vector) in enumerate(vectors):
+            matrix[row] = vector
+            ids[row] = np.frombuffer(course_id.bytes, dtype=np.uint8)
+            df += vector > 0
+        matrix.flush()
+        ids.flush()
+        np.save(staging / "df.npy", df)
+        del matrix, ids
+
+        self._reset()
+        shutil.rmtree(self._path, ignore_errors=True)
+        staging.rename(self._path)
+        self._load()
+        return len(vectors)
+
+    async def on_change(self, change: CatalogChange) -> None:
+        path = self._path
+        if path is None or not self.writable or change.entity != CatalogEntity.COURSE:
+            return
+
+        courses = (
+            []
+            if change.deleted
+            else await self._course_repository.get_by_ids([change.entity_id])
+        )
+
+        # Slots are only assigned under the lock, the files are written in a
+        # thread and swapped in on the event loop, where ``score`` reads them
+        async with self._write_lock:
+            if not courses:
+                if not self._remove(change.entity_id):
+                    return
+            else:
+                vector = self._vectorizer.vector(course_document(courses[0]))
+                if change.entity_id not in self._rows and not self._free:
+                    staging = await asyncio.to_thread(self._stage_growth, path)
+                    self._swap_in(path, staging)
+                self._upsert(change.entity_id, vector)
+            await asyncio.to_thread(self._flush, path, self._df.copy())
+
+    def _vector(self, course: CourseReadModel) -> npt.NDArray[np.float32]:
+        row = self._rows.get(course.course_id)
+        if row is not None:
+            return np.asarray(self._vectors[row])
+        return self._vectorizer.vector(course_document(course))
+
+    def _idf(self) -> npt.NDArray[np.float32]:
+        idf: npt.NDArray[np.float32] = (
+            np.log((1 + len(self._rows)) / (1 + self._df)) + 1
+        )
+        return idf
+
+    def _upsert(self, course_id: UUID, vector: npt.NDArray[np.float32]) -> None:
+        """Write ``vector`` to the course's slot; a free slot must exist."""
+        row = self._rows.get(course_id)
+        if row is None:
+            row = self._free.pop()
+            self._rows[course_id] = row
+        else:
+            self._df -= self._vectors[row] > 0
+
+        self._vectors[row] = vector
+        self._ids[row] = np.frombuffer(course_id.bytes, dtype=np.uint8)
+        self._df += vector > 0
+
+    def _remove(self, course_id: UUID) -> bool:
+        row = self._rows.pop(course_id, None)
+        if row is None:
+            return False
+
+        self._df -= self._vectors[row] > 0
+        self._vectors[row] = 0
+        self._ids[row] = 0
+        self._free.append(row)
+        return True
+
+    def _load(self) -> None:
+        if self._path is None or not (self._path / "ids.npy").exists():
+            return
+
+        mode: Literal["r+", "r"] = "r+" if self.writable else "r"
+        try:
+            vectors = np.load(self._path / "vectors.npy", mmap_mode=mode)
+            ids = np.load(self._path / "ids.npy", mmap_mode=mode)
+            df = np.load(self._path / "df.npy")
+        except (OSError, ValueError):
+            self._logger.warning(
+                "Course vector index unreadable, starting empty",
+                extra={"service": "CourseVectorIndex", "path": str(self._path)},
+            )
+            return
+
+        if vectors.shape[1] != self._vectorizer.dimensions:
+            self._logger.warning(
+                "Course vector index dimensions differ, starting empty",
+                extra={
+                    "service": "CourseVectorIndex",
+                    "dimensions": vectors.shape[1],
+                    "expected": self._vectorizer.dimensions,
+                },
+            )
+            return
+
+        self._vectors, self._ids, self._df = vectors, ids, df
+        occupied = ids.any(axis=1)
+        self._rows = {
+            UUID(bytes=ids[row].tobytes()): int(row) for row in np.flatnonzero(occupied)
+        }
+        self._free = [int(row) for row in np.flatnonzero(~occupied)[::-1]]
+
+    def _stage_growth(self, path: Path) -> Path:
+        """Copy the index into files with double the slots; returns their directory."""
+        capacity = max(self.INITIAL_CAPACITY, 2 * len(self._vectors))
+        path.mkdir(parents=True, exist_ok=True)
+
+        staging = path.with_name(f"{path.name}.tmp")
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir(parents=True)
+        matrix, ids = self._create(staging, capacity)
+        matrix[: len(self._vectors)] = self._vectors
+        ids[: len(self._ids)] = self._ids
+        matrix.flush()
+        ids.flush()
+        del matrix, ids
+        np.save(staging / "df.npy", self._df)
+        return staging
+
+    def _swap_in(self, path: Path, staging: Path) -> None:
+        """Replace the index files with the grown ones and map them."""
+        self._reset()
+        for name in ("vectors.npy", "ids.npy", "df.npy"):
+            (staging / name).replace(path / name)
+        staging.rmdir()
+        self._load()
+
+    def _create(self, directory: Path, capacity: int) -> tuple[np.memmap, np.memmap]:
+        matrix = np.lib.format.open_memmap(
+            directory / "vectors.npy",
+            mode="w+",
+            dtype=np.float32,
+            shape=(capacity, self._vectorizer.dimensions),
+        )
+        ids = np.lib.format.open_memmap(
+            directory / "ids.npy", mode="w+", dtype=np.uint8, shape=(capacity, 16)
+        )
+        return matrix, ids
+
+    def _flush(self, path: Path, df: npt.NDArray[np.float32]) -> None:
+        for array in (self._vectors, self._ids):
+            if isinstance(array, np.memmap):
+                array.flush()
+        np.save(path / "df.npy", df)
+
+    def _reset(self) -> None:
+        """Drop the memory maps; an empty index has zero slots."""
+        dimensions = self._vectorizer.dimensions
+        self._rows = {}
+        self._free = []
+        self._vectors = np.zeros((0, dimensions), dtype=np.float32)
+        self._ids = np.zeros((0, 16), dtype=np.uint8)
+        self._df = np.zeros(dimensions, dtype=np.float32)
+
+    def _acquire_writer(self, path: Path) -> IO[bytes] | None:
+        """Lock ``path`` for writing; ``None`` when another process holds it."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        lock_file = path.with_name(f"{path.name}.lock").open("ab")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock_file.close()
+            self._logger.warning(
+                "Course vector index is written by another process, reading only",
+                extra={"service": "CourseVectorIndex", "path": str(path)},
+            )
+            return None
+        return lock_file
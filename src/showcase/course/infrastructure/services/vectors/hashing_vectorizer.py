@@ -0,0 +1,45 @@
+"""Hashed term-frequency vectors for course text."""
+
+import math
+import re
+import zlib
+from collections import Counter
+
+import numpy as np
+import numpy.typing as npt
+
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+class HashingVectorizer:
+    """Maps text to a fixed-size, L2-normalized term-frequency vector.
+
+    Tokens are lowercased and cut to ``stem_length`` characters, a crude
+    stemmer that folds most Russian inflections together, then hashed into
+    ``dimensions`` buckets with CRC32 so vectors agree across processes.
+    Term frequencies are dampened with ``1 + log(tf)``; IDF weighting is left
+    to the caller, which knows the document frequencies.
+    """
+
+    def __init__(self, dimensions: int, stem_length: int = 6) -> None:
+        self.dimensions = dimensions
+        self.stem_length = stem_length
+
+    def tokens(self, text: str) -> list[str]:
+        return [
+            token[: self.stem_length] for token in TOKEN_PATTERN.findall(text.lower())
+        ]
+
+    def bucket(self, token: str) -> int:
+        return zlib.crc32(token.encode()) % self.dimensions
+
+    def vector(self, text: str) -> npt.NDArray[np.float32]:
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        for token, count in Counter(self.tokens(text)).items():
+            vector[self.bucket(token)] += 1 + math.log(count)
+
+        norm = np.linalg.norm(vector)
+        if norm:
+            vector /= norm
+        return vector
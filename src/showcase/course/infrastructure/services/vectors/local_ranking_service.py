@@ -0,0 +1,202 @@
+"""Course ranking without an LLM: BM25, category overlap and start dates."""
+
+import logging
+import time
+from collections import Counter
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+import numpy as np
+import numpy.typing as npt
+from common.domain.interfaces.clock import IClock
+from common.infrastructure.cache import LRUCache
+from showcase.course.application.interfaces.services.course_ranking_service import (
+    ICourseRankingService,
+)
+from showcase.course.application.read_models.course_read_model import CourseReadModel
+from showcase.course.infrastructure.services.vectors.course_vector_index import (
+    CourseVectorIndex,
+    course_document,
+)
+
+
+@dataclass(frozen=True)
+class _Terms:
+    buckets: npt.NDArray[np.intp]  # distinct term buckets, ascending
+    counts: npt.NDArray[np.float32]  # occurrences of each bucket
+    length: int  # tokens in the document
+
+
+class LocalCourseRankingService(ICourseRankingService):
+    """Ranks courses on the CPU, without network calls.
+
+    The score is BM25 of the query against the course text, normalized to
+    the best candidate, plus ``CATEGORY_WEIGHT`` times the share of inferred
+    categories the course belongs to and ``RECENCY_WEIGHT`` for a start date
+    within ``RECENCY_HORIZON_DAYS``. Courses matching neither the query nor
+    a category are dropped; when no course matches the query the original
+    order is kept and the ranking is weak.
+
+    Term counts are computed once per course version (``course_id`` and
+    ``updated_at``) and cached; document frequencies come from
+    ``CourseVectorIndex`` and, while it is empty, from the candidates. Text
+    is split by the index's own vectorizer, numbers included, so the two
+    count the same terms.
+    """
+
+    K1: float = 1.2
+    B: float = 0.75
+    CATEGORY_WEIGHT: float = 0.3
+    RECENCY_WEIGHT: float = 0.1
+    RECENCY_HORIZON_DAYS: float = 180
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        index: CourseVectorIndex,
+        clock: IClock,
+        max_entries: int = 20_000,
+        ttl_seconds: float = 3600,
+    ) -> None:
+        self._logger = logger
+        self._index = index
+        self._vectorizer = index.vectorizer
+        self._clock = clock
+        self._terms_cache = LRUCache[tuple[UUID, datetime], _Terms](
+            max_entries=max_entries,
+            max_bytes=256 * 1024 * 1024,
+            ttl_seconds=ttl_seconds,
+        )
+
+    async def rank(
+        self,
+        query: str,
+        courses: list[CourseReadModel],
+        category_names: Sequence[str] | None = None,
+        limit: int | None = None,
+        fallback: bool = False,
+    ) -> tuple[list[CourseReadModel], bool]:
+        if not courses:
+            return [], False
+
+        started = time.perf_counter()
+        text = self.bm25(query, courses)
+        overlap = self._category_overlap(courses, category_names)
+        best = float(text.max())
+
+        if best <= 0:
+            self._logger.warning(
+                "Local ranking weak: no course matches the query",
+                extra={"service": "LocalCourseRanking", "input_count": len(courses)},
+            )
+            return courses, True
+
+        scores = (
+            text / best
+            + self.CATEGORY_WEIGHT * overlap
+            + self.RECENCY_WEIGHT * self._recency(courses)
+        )
+        relevant = np.flatnonzero((text > 0) | (overlap > 0))
+        order = relevant[np.argsort(-scores[relevant], kind="stable")]
+        ranked = [courses[i] for i in order]
+
+        self._logger.debug(
+            "Courses ranked locally",
+            extra={
+                "service": "LocalCourseRanking",
+                "input_count": len(courses),
+                "ranked_count": len(ranked),
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+            },
+        )
+        return ranked, False
+
+    def bm25(
+        self, query: str, courses: Sequence[CourseReadModel]
+    ) -> npt.NDArray[np.float32]:
+        """BM25 of each course against ``query``, in the given order."""
+        query_buckets = np.unique(
+            np.array(
+                [self._vectorizer.bucket(t) for t in self._vectorizer.tokens(query)],
+                dtype=np.intp,
+            )
+        )
+        if not len(query_buckets) or not courses:
+            return np.zeros(len(courses), dtype=np.float32)
+
+        terms = [self._terms(course) for course in courses]
+        buckets = np.concatenate([t.buckets for t in terms])
+        counts = np.concatenate([t.counts for t in terms])
+        documents = np.repeat(np.arange(len(terms)), [len(t.buckets) for t in terms])
+
+        # Term frequency of every query bucket in every document
+        position = np.searchsorted(query_buckets, buckets)
+        position[position == len(query_buckets)] = 0
+        hit = query_buckets[position] == buckets
+        tf = np.zeros((len(terms), len(query_buckets)), dtype=np.float32)
+        tf[documents[hit], position[hit]] = counts[hit]
+
+        total = len(self._index)
+        if total:
+            df = self._index.document_frequencies(query_buckets)
+        else:
+            df, total = (tf > 0).sum(axis=0).astype(np.float32), len(terms)
+        idf = np.log1p((total - df + 0.5) / (df + 0.5)).astype(np.float32)
+
+        lengths = np.array([t.length for t in terms], dtype=np.float32)
+        norm = self.K1 * (1 - self.B + self.B * lengths / max(lengths.mean(), 1.0))
+        scores: npt.NDArray[np.float32] = (
+            (tf * (self.K1 + 1)) / (tf + norm[:, None])
+        ) @ idf
+        return scores
+
+    def _terms(self, course: CourseReadModel) -> _Terms:
+        key = (course.course_id, course.updated_at)
+        cached = self._terms_cache.get(key)
+        if cached is not None:
+            return cached
+
+        tokens = self._vectorizer.tokens(course_document(course))
+        counter = Counter(self._vectorizer.bucket(token) for token in tokens)
+        buckets = np.array(sorted(counter), dtype=np.intp)
+        terms = _Terms(
+            buckets=buckets,
+            counts=np.array([counter[b] for b in buckets], dtype=np.float32),
+            length=len(tokens),
+        )
+        self._terms_cache.put(key, terms, terms.buckets.nbytes + terms.counts.nbytes)
+        return terms
+
+    @staticmethod
+    def _category_overlap(
+        courses: Sequence[CourseReadModel], category_names: Sequence[str] | None
+    ) -> npt.NDArray[np.float32]:
+        """Share of ``category_names`` each course belongs to."""
+        wanted = set(category_names or ())
+        if not wanted:
+            return np.zeros(len(courses), dtype=np.float32)
+        return np.array(
+            [
+                len(wanted.intersection(c.name for c in course.categories))
+                / len(wanted)
+                for course in courses
+            ],
+            dtype=np.float32,
+        )
+
+    def _recency(self, courses: Sequence[CourseReadModel]) -> npt.NDArray[np.float32]:
+        """1 for a course starting now, falling to 0 at the horizon."""
+        now = self._clock.now().timestamp()
+        days = np.array(
+            [
+                (course.start_date.timestamp() - now) / 86400
+                if course.start_date
+                else -1.0
+                for course in courses
+            ],
+            dtype=np.float32,
+        )
+        recency = 1 - days / self.RECENCY_HORIZON_DAYS
+        return np.where((days >= 0) & (recency > 0), recency, 0).astype(np.float32)
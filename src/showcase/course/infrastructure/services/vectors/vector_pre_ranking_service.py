@@ -0,0 +1,67 @@
+"""Course pre-ranking: local vector similarity ahead of LLM ranking."""
+
+import logging
+from collections.abc import Sequence
+
+import numpy as np
+from showcase.course.application.interfaces.services.course_ranking_service import (
+    ICourseRankingService,
+)
+from showcase.course.application.read_models.course_read_model import CourseReadModel
+from showcase.course.infrastructure.services.vectors.course_vector_index import (
+    CourseVectorIndex,
+)
+
+
+class VectorPreRankingService(ICourseRankingService):
+    """Sends only the candidates closest to the query to the LLM.
+
+    Candidates are scored against the query with ``CourseVectorIndex`` and
+    the closest ``max(top_k, limit)`` are kept, so a caller still gets as
+    many courses as it asked for; the rest are dropped before the prompt is
+    built. Lists no longer than that, every list when ``top_k`` is 0, and
+    lists ranked for the ``fallback`` query, whose words say nothing about
+    the courses, are passed through.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        inner: ICourseRankingService,
+        index: CourseVectorIndex,
+        top_k: int,
+    ) -> None:
+        self._logger = logger
+        self.inner = inner
+        self.index = index
+        self.top_k = top_k
+
+    async def rank(
+        self,
+        query: str,
+        courses: list[CourseReadModel],
+        category_names: Sequence[str] | None = None,
+        limit: int | None = None,
+        fallback: bool = False,
+    ) -> tuple[list[CourseReadModel], bool]:
+        keep = max(self.top_k, limit or 0)
+        if fallback or self.top_k <= 0 or len(courses) <= keep:
+            return await self.inner.rank(
+                query, courses, category_names, limit, fallback
+            )
+
+        scores = self.index.score(query, courses)
+        order = np.argsort(-scores, kind="stable")[:keep]
+        shortlisted = [courses[i] for i in order]
+
+        self._logger.debug(
+            "Candidates pre-ranked",
+            extra={
+                "service": "CoursePreRanking",
+                "input_count": len(courses),
+                "kept_count": len(shortlisted),
+                "top_score": float(scores[order[0]]),
+            },
+        )
+
+        return await self.inner.rank(query, shortlisted, category_names, limit)
@@ -4,11 +4,15 @@ from collections.abc import Sequence
 from typing import Annotated
 from uuid import UUID
 
+from common.application.exceptions import InvalidCursorError
 from common.presentation.http.dto.response import IDResponse
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from fastapi_utils.cbv import cbv
 from idp.identity.domain.value_objects.descriptor import IdentityDescriptor
-from idp.identity.presentation.http.fastapi.auth import get_descriptor
+from idp.identity.presentation.http.fastapi.auth import (
+    get_descriptor,
+    get_optional_descriptor,
+)
 from showcase.course.application.dtos.commands.create_course_command import (
     CreateCourseCommand,
     CreateCourseSectionDTO,
@@ -41,12 +45,21 @@ from showcase.course.application.dtos.queries import (
     GetTagByIdQuery,
     GetTagsQuery,
 )
+from showcase.course.application.exceptions import (
+    RecommendationJobNotFoundError,
+    RecommendationJobRejectedError,
+)
 from showcase.course.application.interfaces.repositories.course_read_repository import (
     CoursesFilter,
 )
+from showcase.course.application.interfaces.services.recommendation_job_service import (
+    IRecommendationJobService,
+    RecommendationJobDTO,
+)
 from showcase.course.application.interfaces.services.recommendation_service import (
     GetRecommendationsDTO,
     IRecommendationService,
+    RankingMode,
     RecommendationsDTO,
 )
 from showcase.course.application.interfaces.usecases.command.create_course_use_case import (
@@ -81,6 +94,7 @@ from showcase.course.application.interfaces.usecases.command.update_tag_use_case
 )
 from showcase.course.application.interfaces.usecases.query import (
     IGetCourseByIdUseCase,
+    IGetCourseFacetsUseCase,
     IGetCoursesExtendedUseCase,
     IGetCoursesSearchUseCase,
     IGetCoursesUseCase,
@@ -95,7 +109,16 @@ from showcase.course.application.interfaces.usecases.query.list_enrollments_by_c
 from showcase.course.application.interfaces.usecases.query.list_enrollments_by_user_use_case import (
     IListEnrollmentsByUserUseCase,
 )
-from showcase.course.application.read_models.course_read_model import CourseReadModel
+from showcase.course.application.read_models.course_facets_read_model import (
+    CourseFacets,
+)
+from showcase.course.application.read_models.course_read_model import (
+    CoursePage,
+    CourseReadModel,
+    CourseSummaryPage,
+    CourseSummaryReadModel,
+    CourseView,
+)
 from showcase.course.application.read_models.enrollment_read_model import (
     EnrollmentReadModel,
 )
@@ -108,6 +131,7 @@ from showcase.course.presentation.http.fastapi.dto.request import (
     CreateTagRequest,
     EnrollAuthenticatedRequest,
     EnrollRequest,
+    RecommendationJobRequest,
     UpdateCourseRequest,
     UpdateSkillRequest,
     UpdateTagRequest,
@@ -119,6 +143,20 @@ skills_router = APIRouter(prefix="/skills", tags=["skills"])
 tags_router = APIRouter(prefix="/tags", tags=["tags"])
 recommendations_router = APIRouter(prefix="/recommendations", tags=["recommendations"])
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+CourseList = list[CourseSummaryReadModel] | list[CourseReadModel]
+
+
+def _page_response(
+    page: CoursePage | CourseSummaryPage, response: Response
+) -> CourseList:
+    """Return page courses, exposing the next page cursor as a header."""
+    if page.next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.courses
+
 
 @cbv(course_router)
 class CourseController:
@@ -132,45 +170,83 @@ class CourseController:
     create_course_use_case: ICreateCourseUseCase = Depends()
     update_course_use_case: IUpdateCourseUseCase = Depends()
     get_courses_extended_use_case: IGetCoursesExtendedUseCase = Depends()
+    get_course_facets_use_case: IGetCourseFacetsUseCase = Depends()
     delete_course_use_case: IDeleteCourseUseCase = Depends()
     list_enrollments_by_user_use_case: IListEnrollmentsByUserUseCase = Depends()
 
     @course_router.get("/")
     async def list_courses(
         self,
+        response: Response,
         status: Annotated[CourseStatus | None, Query()] = None,
         is_published: Annotated[bool | None, Query()] = None,
         category_id: Annotated[UUID | None, Query()] = None,
         skip: Annotated[int, Query(ge=0)] = 0,
         limit: Annotated[int, Query(ge=1, le=1000)] = 100,
-    ) -> list[CourseReadModel]:
-        """Get all courses with optional filters."""
-        return await self.get_courses_use_case.execute(
-            GetCoursesQuery(
-                status=status,
-                is_published=is_published,
-                category_id=category_id,
-                skip=skip,
-                limit=limit,
+        after: Annotated[str | None, Query()] = None,
+        view: Annotated[CourseView, Query()] = CourseView.SUMMARY,
+    ) -> CourseList:
+        """Get all courses with optional filters.
+
+        The cursor of the next page is returned in the ``X-Next-Cursor`` header
+        and is passed back as ``after``. ``view=full`` returns complete courses
+        instead of summaries.
+        """
+        try:
+            page = await self.get_courses_use_case.execute(
+                GetCoursesQuery(
+                    status=status,
+                    is_published=is_published,
+                    category_id=category_id,
+                    skip=skip,
+                    limit=limit,
+                    after=after,
+                    view=view,
+                )
             )
-        )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        return _page_response(page, response)
 
     @course_router.get("/search")
     async def search(
         self,
+        response: Response,
         q: Annotated[str, Query(min_length=1)],
         skip: Annotated[int, Query(ge=0)] = 0,
         limit: Annotated[int, Query(ge=1, le=1000)] = 50,
-    ) -> list[CourseReadModel]:
+        after: Annotated[str | None, Query()] = None,
+        view: Annotated[CourseView, Query()] = CourseView.SUMMARY,
+    ) -> CourseList:
         """Full-text search for courses."""
-        return await self.get_courses_search_use_case.execute(
-            query=GetCoursesSearchQuery(query=q, skip=skip, limit=limit)
-        )
+        try:
+            page = await self.get_courses_search_use_case.execute(
+                query=GetCoursesSearchQuery(
+                    query=q, skip=skip, limit=limit, after=after, view=view
+                )
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        return _page_response(page, response)
 
     @course_router.get("/filter")
-    async def filter_extended(self, filter: Annotated[CoursesFilter, Query()]) -> list[CourseReadModel]:
+    async def filter_extended(
+        self, response: Response, filter: Annotated[CoursesFilter, Query()]
+    ) -> CourseList:
         """Filter endpoint for extended search."""
-        return await self.get_courses_extended_use_case.execute(filter)
+        try:
+            page = await self.get_courses_extended_use_case.execute(filter)
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        return _page_response(page, response)
+
+    @course_router.get("/facets")
+    async def facets(self, filter: Annotated[CoursesFilter, Query()]) -> CourseFacets:
+        """Course counts per facet value for the ``/filter`` predicates.
+
+        Sorting and paging parameters are ignored.
+        """
+        return await self.get_course_facets_use_case.execute(filter)
 
     @course_router.get("/{course_id}")
     async def get_course_by_id(self, course_id: UUID) -> CourseReadModel:
@@ -414,6 +490,7 @@ class TagController:
 @cbv(recommendations_router)
 class RecommendationController:
     service: IRecommendationService = Depends()
+    jobs: IRecommendationJobService = Depends()
 
     @recommendations_router.get("/")
     async def recommend_courses(
@@ -421,8 +498,72 @@ class RecommendationController:
         q: Annotated[str, Query(min_length=1)],
         skip: Annotated[int, Query(ge=0)] = 0,
         limit: Annotated[int, Query(ge=1, le=25)] = 10,
+        ranking: RankingMode = RankingMode.LLM,
+        debug: bool = False,
     ) -> RecommendationsDTO:
-        """Get courses recommendation by query."""
+        """Get courses recommendation by query.
+
+        ``ranking=local`` ranks without the LLM: faster and free, less precise.
+        ``debug=true`` lists the LLM calls made for the request in ``llm_calls``.
+        """
         return await self.service.recommend(
-            GetRecommendationsDTO(query=q, skip=skip, limit=limit)
+            GetRecommendationsDTO(
+                query=q, skip=skip, limit=limit, ranking=ranking, debug=debug
+            )
         )
+
+    @recommendations_router.post("/jobs", status_code=status.HTTP_202_ACCEPTED)
+    async def submit_recommendation_job(
+        self,
+        body: RecommendationJobRequest,
+        request: Request,
+        response: Response,
+        descriptor: Annotated[
+            IdentityDescriptor | None, Depends(get_optional_descriptor)
+        ],
+    ) -> RecommendationJobDTO:
+        """Queue a recommendation and return its job without waiting.
+
+        An unfinished job for the same request is returned instead of a new
+        one. Poll ``Location`` for the result; 429 when the caller or the
+        queue has too many unfinished jobs.
+        """
+        if descriptor is not None:
+            submitter = f"user:{descriptor.identity_id}"
+        else:
+            submitter = f"address:{request.client.host if request.client else ''}"
+
+        try:
+            job = await self.jobs.submit(
+                GetRecommendationsDTO(
+                    query=body.q,
+                    skip=body.skip,
+                    limit=body.limit,
+                    ranking=body.ranking,
+                    debug=body.debug,
+                ),
+                submitter,
+            )
+        except RecommendationJobRejectedError as e:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=str(e),
+                headers={"Retry-After": str(e.retry_after_seconds)},
+            ) from e
+        response.headers["Location"] = f"{request.url.path}/{job.job_id}"
+        return job
+
+    @recommendations_router.get("/jobs/{job_id}")
+    async def get_recommendation_job(
+        self,
+        job_id: UUID,
+        wait: Annotated[float, Query(ge=0, le=60)] = 0,
+    ) -> RecommendationJobDTO:
+        """Get a recommendation job, waiting up to ``wait`` seconds for it.
+
+        ``result`` is set once the job succeeded, ``error`` once it failed.
+        """
+        try:
+            return await self.jobs.get(job_id, wait_seconds=wait)
+        except RecommendationJobNotFoundError as e:
+            raise HTTPException(status_code=404, detail=str(e)) from e
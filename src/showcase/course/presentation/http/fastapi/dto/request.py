@@ -5,6 +5,9 @@ from decimal import Decimal
 from uuid import UUID
 
 from pydantic import BaseModel, Field
+from showcase.course.application.interfaces.services.recommendation_service import (
+    RankingMode,
+)
 from showcase.course.domain.value_objects import (
     CertificateType,
     CourseStatus,
@@ -126,3 +129,14 @@ class EnrollAuthenticatedRequest(BaseModel):
     full_name: str = Field(min_length=1, max_length=255)
     phone: str | None = None
     message: str | None = None
+
+
+# ============ Recommendation Request Models ============
+class RecommendationJobRequest(BaseModel):
+    """Request model for submitting a recommendation job."""
+
+    q: str = Field(min_length=1)
+    skip: int = Field(default=0, ge=0)
+    limit: int = Field(default=10, ge=1, le=25)
+    ranking: RankingMode = RankingMode.LLM
+    debug: bool = False
@@ -5,8 +5,8 @@ from aiogram.client.default import DefaultBotProperties
 from aiogram.enums import ParseMode
 from aiogram.fsm.storage.memory import MemoryStorage
 from common.infrastructure.config.deployment_meta import DeploymentMeta
-from showcase.category.application.interfaces.usecases.query.get_categories_usecase import (
-    IGetCategoriesUseCase,
+from showcase.category.application.interfaces.services.category_catalog import (
+    ICategoryCatalog,
 )
 from showcase.course.application.interfaces.services.recommendation_service import (
     IRecommendationService,
@@ -70,7 +70,7 @@ def create_dispatcher(
     get_courses_use_case: IGetCoursesExtendedUseCase,
     get_course_by_id_use_case: IGetCourseByIdUseCase,
     get_courses_search_use_case: IGetCoursesSearchUseCase,
-    get_categories_use_case: IGetCategoriesUseCase,
+    category_catalog: ICategoryCatalog,
     recommendation_service: IRecommendationService,
 ) -> Dispatcher:
     """Create and configure Telegram bot dispatcher.
@@ -79,7 +79,7 @@ def create_dispatcher(
         get_courses_use_case: Use case for getting courses
         get_course_by_id_use_case: Use case for getting course by ID
         get_courses_search_use_case: Use case for searching courses
-        get_categories_use_case: Use case for getting categories
+        category_catalog: Shared snapshot of all categories
         recommendation_service: Service for course recommendations
 
     Returns:
@@ -109,7 +109,7 @@ def create_dispatcher(
     )
 
     filter_callback_handler = FilterCallbackHandler(
-        get_categories_use_case=get_categories_use_case,
+        category_catalog=category_catalog,
         course_list_service=course_list_service,
     )
 
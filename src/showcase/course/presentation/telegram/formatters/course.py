@@ -1,9 +1,16 @@
 """Course formatters for Telegram."""
 
-from showcase.course.application.read_models.course_read_model import CourseReadModel
+from collections.abc import Sequence
 
+from showcase.course.application.read_models.course_read_model import (
+    CourseReadModel,
+    CourseSummaryReadModel,
+)
 
-def format_course_short(course: CourseReadModel, index: int | None = None) -> str:
+
+def format_course_short(
+    course: CourseSummaryReadModel | CourseReadModel, index: int | None = None
+) -> str:
     """Format a short course description for list display."""
     prefix = f"{index}. " if index is not None else ""
     price_str = f"{course.cost:.0f} ₽"
@@ -19,14 +26,16 @@ def format_course_short(course: CourseReadModel, index: int | None = None) -> st
     )
 
 
-def format_course_list(courses: list[CourseReadModel], page: int = 1) -> str:
+def format_course_list(
+    courses: Sequence[CourseSummaryReadModel | CourseReadModel], page: int = 1
+) -> str:
     """Format a list of courses for display."""
     if not courses:
         return "❌ Курсы не найдены."
 
     text = f"📚 <b>Найдено курсов: {len(courses)}</b>\n\n"
 
-    for idx, course in enumerate[CourseReadModel](courses, start=1):
+    for idx, course in enumerate(courses, start=1):
         text += format_course_short(course, index=idx)
         text += "\n\n"
 
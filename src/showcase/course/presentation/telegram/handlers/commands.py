@@ -90,7 +90,8 @@ class CommandHandler:
 
         query_text = parts[1]
         search_query = GetCoursesSearchQuery(query=query_text, limit=10)
-        courses = await self.get_courses_search_use_case.execute(search_query)
+        result = await self.get_courses_search_use_case.execute(search_query)
+        courses = result.courses
 
         if not courses:
             await message.answer(f"❌ По запросу '{query_text}' ничего не найдено.")
@@ -98,7 +99,7 @@ class CommandHandler:
 
         text = format_course_list(courses)
         keyboard = build_course_list_keyboard(
-            courses, page=1, has_next=len(courses) >= 10
+            courses, page=1, has_next=result.next_cursor is not None
         )
 
         await message.answer(text, reply_markup=keyboard)
@@ -5,9 +5,8 @@ from uuid import UUID
 from aiogram import F, Router
 from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery
-from showcase.category.application.dtos.queries import GetCategoriesQuery
-from showcase.category.application.interfaces.usecases.query.get_categories_usecase import (
-    IGetCategoriesUseCase,
+from showcase.category.application.interfaces.services.category_catalog import (
+    ICategoryCatalog,
 )
 from showcase.course.domain.value_objects import CourseStatus, Format
 from showcase.course.presentation.telegram.keyboards.builder import (
@@ -25,10 +24,10 @@ class FilterCallbackHandler:
 
     def __init__(
         self,
-        get_categories_use_case: IGetCategoriesUseCase,
+        category_catalog: ICategoryCatalog,
         course_list_service: CourseListService,
     ) -> None:
-        self.get_categories_use_case = get_categories_use_case
+        self.category_catalog = category_catalog
         self.course_list_service = course_list_service
         self.router = Router()
 
@@ -69,8 +68,7 @@ class FilterCallbackHandler:
         await callback.answer()
 
     async def _handle_filter_category(self, callback: CallbackQuery) -> None:
-        query = GetCategoriesQuery(limit=20)
-        categories = await self.get_categories_use_case.execute(query)
+        categories = (await self.category_catalog.snapshot()).categories
 
         if not categories:
             await callback.answer("❌ Категории не найдены.", show_alert=True)
@@ -63,7 +63,7 @@ class QueryHandler:
             query=query_text, limit=5
         )  # Increased limit for better results
         try:
-            courses = await self.get_courses_search_use_case.execute(search_query)
+            result = await self.get_courses_search_use_case.execute(search_query)
         except Exception as e:
             print(f"Error searching courses: {e}")
             text = "❌ Произошла ошибка при поиске курсов."
@@ -72,6 +72,7 @@ class QueryHandler:
             await state.clear()
             return
 
+        courses = result.courses
         if not courses:
             text = f"❌ По запросу '{query_text}' ничего не найдено."
             keyboard = build_main_menu_keyboard()
@@ -82,7 +83,7 @@ class QueryHandler:
         text = f"🔍 <b>Результаты поиска по запросу:</b> '{query_text}'\n\n"
         text += format_course_list(courses)
         keyboard = build_course_list_keyboard(
-            courses, page=1, has_next=len(courses) >= 5
+            courses, page=1, has_next=result.next_cursor is not None
         )
 
         await message.answer(text, reply_markup=keyboard)
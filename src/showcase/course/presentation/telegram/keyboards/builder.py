@@ -5,7 +5,10 @@ from uuid import UUID
 
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 from aiogram.utils.keyboard import InlineKeyboardBuilder
-from showcase.course.application.read_models.course_read_model import CourseReadModel
+from showcase.course.application.read_models.course_read_model import (
+    CourseReadModel,
+    CourseSummaryReadModel,
+)
 
 
 def build_main_menu_keyboard() -> InlineKeyboardMarkup:
@@ -22,7 +25,7 @@ def build_main_menu_keyboard() -> InlineKeyboardMarkup:
 
 
 def build_course_list_keyboard(
-    courses: Sequence[CourseReadModel],
+    courses: Sequence[CourseSummaryReadModel | CourseReadModel],
     page: int = 1,
     page_size: int = 5,
     has_next: bool = False,
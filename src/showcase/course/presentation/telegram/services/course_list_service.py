@@ -45,7 +45,13 @@ class CourseListService:
         format_value = data.get("format")  # Now used
         search_query = data.get("search_query")
 
-        skip = (page - 1) * PAGE_SIZE
+        # Cursors are keyed by the page they open. Page 1 is shown after every
+        # filter change, so it starts a fresh chain; pages without a cursor
+        # fall back to offset paging.
+        cursors: dict[str, str] = {} if page == 1 else data.get("cursors", {})
+        after = cursors.get(str(page))
+
+        skip = 0 if after else (page - 1) * PAGE_SIZE
         query = CoursesFilter(
             is_published=True,
             search=search_query,
@@ -55,11 +61,12 @@ class CourseListService:
                 [Format(format_value)] if format_value else None
             ),  # Added format filter
             skip=skip,
-            limit=PAGE_SIZE + 1,
+            limit=PAGE_SIZE,
+            after=after,
         )
 
         try:
-            all_courses = await self.get_courses_use_case.execute(query)
+            result = await self.get_courses_use_case.execute(query)
         except Exception as e:
             # Log error (placeholder; integrate actual logger)
             print(f"Error fetching courses: {e}")
@@ -68,10 +75,12 @@ class CourseListService:
             await self._send_response(callback_or_message, text, keyboard)
             return
 
-        has_next = len(all_courses) > PAGE_SIZE
-        courses = all_courses[:PAGE_SIZE]
+        courses = result.courses
+        has_next = result.next_cursor is not None
+        if result.next_cursor:
+            cursors[str(page + 1)] = result.next_cursor
 
-        await state.update_data(page=page)
+        await state.update_data(page=page, cursors=cursors)
 
         if not courses:
             text = (
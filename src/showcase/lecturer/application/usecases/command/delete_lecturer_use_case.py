@@ -1,5 +1,10 @@
 from uuid import UUID
 
+from common.application.interfaces.catalog.catalog_change_listener import (
+    CatalogChange,
+    CatalogEntity,
+    ICatalogChangeListener,
+)
 from showcase.lecturer.application.interfaces.repositories.lecturer_repository import (
     ILecturerRepository,
 )
@@ -9,9 +14,17 @@ from showcase.lecturer.application.interfaces.usecases.command.delete_lecturer_u
 
 
 class DeleteLecturerUseCase(IDeleteLecturerUseCase):
-    def __init__(self, lecturer_repository: ILecturerRepository) -> None:
+    def __init__(
+        self,
+        lecturer_repository: ILecturerRepository,
+        catalog_cache: ICatalogChangeListener,
+    ) -> None:
         self.lecturer_repository = lecturer_repository
+        self.catalog_cache = catalog_cache
 
     async def execute(self, lecturer_id: UUID) -> UUID:
         await self.lecturer_repository.delete(lecturer_id)
+        await self.catalog_cache.on_change(
+            CatalogChange(CatalogEntity.LECTURER, lecturer_id, deleted=True)
+        )
         return lecturer_id
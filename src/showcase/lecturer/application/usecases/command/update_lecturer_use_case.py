@@ -1,5 +1,10 @@
 from uuid import UUID
 
+from common.application.interfaces.catalog.catalog_change_listener import (
+    CatalogChange,
+    CatalogEntity,
+    ICatalogChangeListener,
+)
 from showcase.lecturer.application.dtos.commands.update_lecturer_command import (
     UpdateLecturerCommand,
 )
@@ -12,8 +17,13 @@ from showcase.lecturer.application.interfaces.usecases.command.update_lecturer_u
 
 
 class UpdateLecturerUseCase(IUpdateLecturerUseCase):
-    def __init__(self, lecturer_repository: ILecturerRepository) -> None:
+    def __init__(
+        self,
+        lecturer_repository: ILecturerRepository,
+        catalog_cache: ICatalogChangeListener,
+    ) -> None:
         self.lecturer_repository = lecturer_repository
+        self.catalog_cache = catalog_cache
 
     async def execute(self, command: UpdateLecturerCommand) -> UUID:
         lecturer = await self.lecturer_repository.get_by_id(command.lecturer_id)
@@ -25,4 +35,7 @@ class UpdateLecturerUseCase(IUpdateLecturerUseCase):
         lecturer.competencies = command.competencies
 
         await self.lecturer_repository.update(lecturer)
+        await self.catalog_cache.on_change(
+            CatalogChange(CatalogEntity.LECTURER, command.lecturer_id)
+        )
         return command.lecturer_id
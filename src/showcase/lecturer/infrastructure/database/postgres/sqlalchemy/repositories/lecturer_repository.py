@@ -2,6 +2,11 @@
 
 from uuid import UUID
 
+from common.application.interfaces.catalog.catalog_change_listener import (
+    CatalogChange,
+    CatalogEntity,
+    ICatalogChangeListener,
+)
 from common.infrastructure.database.postgres.sqlalchemy.executor import QueryExecutor
 from showcase.lecturer.application.interfaces.repositories.lecturer_repository import (
     ILecturerRepository,
@@ -16,8 +21,11 @@ from sqlalchemy import delete, select
 class LecturerRepository(ILecturerRepository):
     """Write repository for lecturers."""
 
-    def __init__(self, executor: QueryExecutor) -> None:
+    def __init__(
+        self, executor: QueryExecutor, catalog_listener: ICatalogChangeListener
+    ) -> None:
         self.executor = executor
+        self.catalog_listener = catalog_listener
 
     async def get_by_id(self, lecturer_id: UUID) -> Lecturer:
         """Get a lecturer by ID."""
@@ -30,17 +38,28 @@ class LecturerRepository(ILecturerRepository):
     async def add(self, lecturer: Lecturer) -> None:
         """Add a new lecturer."""
         model = self._to_persistence(lecturer)
-        await self.executor.add(model)
+        async with self.executor.uow:
+            await self.executor.add(model)
+            await self._notify(lecturer.lecturer_id)
 
     async def update(self, lecturer: Lecturer) -> None:
         """Update an existing lecturer."""
         model = self._to_persistence(lecturer)
-        await self.executor.save(model)
+        async with self.executor.uow:
+            await self.executor.save(model)
+            await self._notify(lecturer.lecturer_id)
 
     async def delete(self, lecturer_id: UUID) -> None:
         """Delete a lecturer by ID."""
-        await self.executor.execute(
-            delete(LecturerBase).where(LecturerBase.lecturer_id == lecturer_id)
+        async with self.executor.uow:
+            await self.executor.execute(
+                delete(LecturerBase).where(LecturerBase.lecturer_id == lecturer_id)
+            )
+            await self._notify(lecturer_id, deleted=True)
+
+    async def _notify(self, lecturer_id: UUID, deleted: bool = False) -> None:
+        await self.catalog_listener.on_change(
+            CatalogChange(CatalogEntity.LECTURER, lecturer_id, deleted=deleted)
         )
 
     @staticmethod
@@ -25,12 +25,16 @@ class LecturerContainer(containers.DeclarativeContainer):
     uuid_generator: providers.Dependency[Any] = providers.Dependency()
     query_executor: providers.Dependency[Any] = providers.Dependency()
     clock: providers.Dependency[Any] = providers.Dependency()
+    catalog_listener: providers.Dependency[Any] = providers.Dependency()
+    catalog_cache: providers.Dependency[Any] = providers.Dependency()
 
     # Read repository
     lecturer_read_repository = providers.Factory(LecturerReadRepository, query_executor)
 
     # Write repository
-    lecturer_repository = providers.Factory(LecturerRepository, query_executor)
+    lecturer_repository = providers.Factory(
+        LecturerRepository, query_executor, catalog_listener
+    )
 
     # Read use cases
     get_lecturers_usecase = providers.Factory(
@@ -47,8 +51,8 @@ class LecturerContainer(containers.DeclarativeContainer):
         uuid_generator=uuid_generator,
     )
     update_lecturer_usecase = providers.Factory(
-        UpdateLecturerUseCase, lecturer_repository
+        UpdateLecturerUseCase, lecturer_repository, catalog_cache
     )
     delete_lecturer_usecase = providers.Factory(
-        DeleteLecturerUseCase, lecturer_repository
+        DeleteLecturerUseCase, lecturer_repository, catalog_cache
     )